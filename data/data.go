@@ -6,8 +6,7 @@
 // pkg/pullreq/templates/help_comment.gotpl (1.025kB)
 // pkg/pullreq/templates/status_comment.gotpl (355B)
 // scripts/cluster-summary/__init__.py (0)
-// scripts/cluster-summary/cluster_summary.py (4.488kB)
-// scripts/cluster-summary/tabulate.py (57.091kB)
+// scripts/cluster-summary/cluster_summary.py (15.309kB)
 // scripts/create-lambda-bundle.sh (791B)
 // scripts/kindctl.sh (1.76kB)
 // scripts/pull-deps.sh (1.797kB)
@@ -199,7 +198,7 @@ func scriptsClusterSummary__init__Py() (*asset, error) {
 	return a, nil
 }
 
-var _scriptsClusterSummaryCluster_summaryPy = []byte("\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff\xec\x57\x6d\x6f\xdb\x36\x10\xfe\xae\x5f\x71\xcd\x10\x48\x42\x1d\x35\x5d\x37\x60\x2b\xe0\x02\x49\xac\x64\x59\x5d\x3b\xc8\x0b\x8a\x21\x0d\x04\x9a\x3a\x29\x6c\x29\x52\x20\xa9\xb6\xfe\xf7\x03\x29\xea\xc5\x89\xdb\xa4\x41\x81\x7d\x59\xbe\xc4\xbc\x3b\x3e\x7c\xee\x45\xc7\xe3\x2f\xcf\x5e\x34\x5a\xbd\x58\x31\xf1\xa2\x5e\x9b\x5b\x29\x82\x9d\x9d\x1d\xa0\xbc\xd1\x06\x55\xa6\x9b\xaa\x22\x6a\x9d\xd4\xeb\x20\x00\x00\x38\x53\x4c\x18\x90\x8d\x01\x02\x5e\x07\xb2\x00\xd2\x6d\x48\xe0\x4a\x63\x0e\x85\x54\xb0\xf3\xa9\x59\x21\xa9\x6b\xbe\x06\x6d\x88\x69\xf4\x0e\x50\xc2\xb9\x4e\x1c\xd0\x7b\xc5\x8c\x41\x01\x4c\xc0\x99\x3b\xd6\xed\xd1\xac\xaa\x39\xa3\xcc\xac\x27\xb0\x6a\x0c\x50\xd9\xf0\x1c\x56\x08\x0a\xbf\x0c\x1b\x4a\x09\x44\xe4\xc0\x04\x95\xaa\x96\x8a\x18\xb4\x0b\x23\x1d\xb0\xb9\x45\xb0\x27\x03\xe5\x0c\x85\x81\x9c\x29\xa4\x86\xaf\x13\xeb\x57\x10\xb0\xaa\x96\xca\x00\x51\x65\x4d\x94\xc6\x6e\xcd\x65\x59\x32\x51\x76\x4b\xa9\xbb\x5f\xba\x59\xd5\x4a\x52\xd4\xba\xdf\x6b\xc8\xaa\xe1\xc4\x60\x10\xf8\x5d\xc9\x8a\x68\x46\x8f\xa4\x28\x58\x19\x39\x12\x85\x54\x15\x31\xd3\x70\x37\x22\x9a\x1a\x56\x61\xac\x61\x37\xe2\xf8\x19\xb9\x20\x7e\x55\xa1\xd6\xa4\xc4\x58\x87\x13\xb7\xc7\x69\xa7\x1d\xe4\xe9\xe2\x78\x39\x09\xe2\x20\x08\x28\x27\x5a\xc3\x8a\x4a\x2e\x95\x7e\xed\x4c\xff\x4a\x0f\x66\xe9\x39\x4c\x21\xfc\xb0\xff\xea\xd5\xf5\x9f\xbf\x57\xa1\x93\x2f\xdf\x1e\xce\xaf\xd2\x41\xfe\x5b\x2f\x3f\x39\x4f\xd3\xc5\xa0\xf8\xd5\x2b\xde\x1f\x9c\x2f\x4e\x17\x27\x83\xe2\x95\x57\x1c\x1f\x9c\xce\x07\xe9\x4b\x2f\x4d\x17\xb3\xa3\x5e\xba\xef\x85\x87\xcb\xf9\xac\x17\x76\x96\x57\x8b\x59\x7a\x3e\x3f\x5d\x0c\x64\x2c\x97\x20\xc8\xb1\x80\x8a\x30\x11\xc5\xad\x27\x44\x95\x1a\xa6\x50\xa2\xc9\xec\xcf\x28\x6e\xcb\x8c\x15\x4e\x93\xe4\xb8\x6a\xca\xd6\xd2\x85\xc8\x07\xa7\x44\x33\x97\x65\x89\x2a\x8a\x13\x8d\x66\x6e\x23\x17\x75\xca\x59\x7a\x78\x75\xe2\x71\x6a\x5b\xae\xd9\x2d\x92\x9c\x89\x32\x0a\xcf\x96\xb3\x8b\x70\x02\x42\x66\x2e\x9a\x53\x77\x46\xb7\x8a\xdb\x1d\x32\xd7\x99\xc1\xaf\x06\xa6\xae\x8c\xa8\xe1\x99\x65\x67\x45\x51\x68\xb5\xe1\xa4\xe5\x66\x13\xa9\x6b\x42\xd1\xaf\x9d\xb5\xab\x01\x8f\xa4\xd0\x98\x75\x66\xc8\x8a\x63\xd4\xc3\x6e\x27\xf6\xf7\xf2\xf0\x21\x62\x1f\xe5\xea\x3b\xc4\xac\xf6\x49\xc4\x7a\xd8\xed\xc4\x66\xe9\xd9\x7c\xf9\xcf\xbb\x74\x71\xf9\x10\xbf\x1c\x6b\x2e\xd7\x15\x0a\xf3\x6d\x9a\x7d\x22\xc3\x91\xf5\x93\x68\xdf\x3d\x6d\x3b\xfb\x8b\xcb\x83\xcb\xf4\xf8\x6a\x7e\x91\x3e\x48\xdf\xb6\x28\x2c\x1a\xae\xf1\x51\xfc\xc7\xe6\x4f\x72\xe0\xde\x79\xdf\x88\xff\x41\xfa\x6e\xb9\x78\x04\xff\x9c\x60\x25\xc5\x23\xd9\x0f\xc6\x4f\x0b\xfe\xe6\x59\xdb\x99\x2f\x96\xb3\xf4\x21\xd2\x42\xe6\xf8\x9d\xa2\x76\xea\x27\x31\x1c\x80\x63\xdf\x74\xee\xa1\x2b\xd4\xb2\x51\x14\x33\xb3\xae\x71\x02\x23\xf8\x11\x72\xdb\x7a\x68\x95\xc3\x14\xae\x87\xf8\x79\x30\xdf\xb8\x9d\xa8\x44\x33\x5a\x6e\x82\x0f\x56\x7b\x7b\x03\xf8\xc8\x7c\x10\xb6\xb2\x9b\xbe\x0b\x6e\x00\xc1\xb3\x29\xf8\xa0\x0c\x3d\x91\x15\x03\x77\x67\x30\xd2\x75\xe4\x9f\x8f\xd9\x0f\x64\xc4\x88\x42\xf7\x37\xc4\x61\x43\x75\xd3\xaf\x90\x6b\xbc\x77\x42\x42\xea\x1a\x45\x1e\x85\x7b\x7b\x84\xf3\xbd\x1e\x44\x87\xbe\x38\xba\xe6\xec\x1a\x7a\x14\x9e\x37\x42\x30\x51\x02\x95\x55\x45\x44\xfe\x1a\x76\x6d\x9e\xb5\x51\x11\xad\xf2\xd8\xef\x51\x68\x1a\x25\x46\x37\x70\x42\x6f\x91\x7e\xca\x64\x63\xea\xc6\x38\xcb\x24\x47\x2a\x73\x8c\xc2\xc6\x14\x7b\x7f\x84\xdb\x92\xfd\x51\x4b\xf1\x5f\x25\xbb\x65\x3a\xde\x69\xd9\x84\xff\xd7\xc3\x13\xeb\x41\x37\xdc\x76\x8a\xef\x55\xc4\xb8\x72\x6c\xb0\x13\x2e\x49\xae\xa3\x76\xef\xdd\x72\xe9\xea\x65\xa3\x77\xb8\xae\xd1\x7a\xc4\x99\x40\x3b\x9e\x58\x51\xa2\x6b\xce\x4c\x14\x7e\x10\x9d\x0f\x4e\x90\x75\x36\xd7\x3e\x49\x76\x8c\xe5\x13\xb7\xd5\xce\xaa\x28\x9a\x0a\xed\x88\x1a\x39\xc3\x78\x23\x51\xce\x68\xba\x25\x47\x52\x18\x26\x1a\x0c\x36\x8c\xad\xe5\xfe\xa6\x61\x0b\xe0\xfe\x25\x0a\x6b\x4e\x28\xb6\x9d\x17\x2e\xd2\x79\x7a\x74\xb9\x3c\x0f\x27\xe0\x04\x59\x2f\x88\x07\x54\x2a\xab\x5a\x0a\x7b\x89\x76\x20\xde\x49\x08\xe3\xde\x68\xe4\x66\x97\xd6\x6b\xea\xdc\xa4\xd6\xc1\x11\x06\x2b\x80\xb6\x25\x77\x33\xcc\x71\x1c\x45\x34\x82\x88\xef\x78\xe1\x6e\x8d\x28\x5c\x48\x81\x50\xc8\x46\xe4\x2e\xbe\x9d\xb6\x4d\xe4\xe8\x7e\x89\xba\xe1\x3b\xe9\x7e\x44\xdb\x88\x5e\xbf\x7c\x7d\x33\x14\xac\xbd\x93\x50\xe9\xe9\xd8\x60\x7f\xa4\xd7\xb7\xf2\x0b\x13\x39\x7e\x9d\x5e\xaa\xc6\x17\x7a\x1c\x8f\x0e\x0d\xc3\xa1\x52\xc6\x97\x9c\xff\x3f\xba\xe4\x8e\x09\xd7\xe8\x93\x6c\xbf\x44\x2f\xbf\xe7\xef\x9b\x37\x6f\x6c\x8d\xc3\x2e\x78\x8c\xf6\xb8\xcd\x8f\xa9\xb5\xf5\x93\x7f\xe2\x87\xfb\xe7\xdd\x53\x20\x71\x83\xf7\x73\x08\xad\xa9\xc3\xba\xf3\xf1\x7a\xe4\xd1\x0e\x3b\xbf\x77\x9e\x0c\x23\x77\x7b\xa0\x7b\x0e\x29\x98\xf6\x4f\xa3\xe4\x40\x95\x8d\x9d\xb0\xce\x9c\x66\x88\x73\x8e\x9a\x2a\x56\x1b\x26\xc5\x34\x3c\x41\x33\x7e\x08\xda\xd7\x97\x1b\x6d\x36\x5e\x85\x3e\xa3\xed\x11\x09\xc9\x73\x7b\xb2\xc3\x8e\xc6\xbd\xd0\x35\x83\x51\x0f\xca\xb1\x20\x0d\x37\x6d\x50\x07\x31\xa1\xed\xd1\xda\x48\x85\x99\x51\x0d\x86\xe3\x5c\xf3\x7a\x1a\x5e\xda\xcf\x5f\x0a\x70\x88\x5d\xb3\xf1\x56\x8f\xe3\x22\xe4\x9e\x0b\xda\x4f\xa4\x53\x14\xd0\xe6\xe1\x47\x88\x8c\x7b\xb2\xa5\xd5\x75\xd2\x91\xd8\x5e\x05\x53\x6d\xd4\x7d\xa6\xe1\x3d\x26\x8b\xfe\x6a\x30\xd2\x36\x54\xa3\x18\x35\x60\xe4\x0f\xc5\xe6\x4e\x4b\xff\x19\x11\xb2\x65\x94\x13\x43\x5c\x5f\x21\x9c\xc3\x3d\xfc\xc7\x51\xdb\x7a\x9d\x7e\x3b\x40\x52\x27\x28\x3e\x33\x25\x85\x7d\x53\x46\xe1\xdb\xab\xc3\xf4\x68\xb9\x38\x3e\x3d\xb1\x7d\x33\x8c\xef\xd2\x7c\x7b\x17\x7e\x73\x54\xf1\xec\xdc\xbf\xfe\x3d\x1b\xb0\x02\xb2\xcc\xfa\x93\x65\xb6\xf9\xed\x64\x99\x7d\x01\x67\xd9\x4e\xfb\xe1\xb5\xcf\xe1\xe0\xdf\x00\x00\x00\xff\xff\xde\xeb\x67\x62\x88\x11\x00\x00")
+var _scriptsClusterSummaryCluster_summaryPy = []byte("\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff\xc5\x1b\x6b\x73\xdb\x36\xf2\xbb\x7e\x05\x2f\x19\x0f\xc9\xab\xcc\xa4\x49\xef\xe6\xce\x17\x75\x46\xb1\x95\xd4\xad\x22\x79\x24\xb9\x37\x3d\xd7\xc3\x81\x48\x48\x62\x42\x91\x3c\x3e\xec\x2a\x9d\xfc\xf7\xdb\x5d\x00\x24\x40\x4a\xb2\x9d\x7b\xf9\x43\x22\x01\xfb\xc2\xee\x62\xb1\xbb\x80\x9e\xff\xe1\x45\x55\xe4\x2f\x96\x51\xf2\x22\xdb\x95\x9b\x34\x79\xdd\x7b\xf6\xec\x99\x15\xc4\x55\x51\xf2\xdc\x2f\xaa\xed\x96\xe5\x3b\x2f\xdb\xf5\x7a\x16\xfc\x5d\xe5\x51\x52\x5a\x69\x55\x5a\xcc\x92\x73\x56\xba\x82\x2f\x12\xc1\xb3\xae\x0b\x1e\x5a\xab\x34\xb7\x9e\x7d\xaa\x96\x9c\x65\x59\xbc\xb3\x8a\x92\x95\x55\x01\x54\x59\x1c\x17\x1e\x11\xfa\x7b\x1e\x95\x25\x4f\xac\x28\xb1\xae\x88\x2f\xe1\x14\xd1\x36\x8b\xa3\x20\x2a\x77\x7d\x6b\x09\x4c\x82\xb4\x8a\x43\x6b\xc9\xad\x9c\xdf\x37\x08\xeb\xd4\x62\x49\x08\x9f\x82\x34\xcf\xd2\x9c\x95\x1c\xbf\x94\x29\x11\x2e\x37\xdc\x42\xce\x20\x51\xc4\x41\xd6\x30\xca\x79\x50\xc6\x3b\x0f\xd7\xd5\xeb\x01\x83\x34\x07\xe9\xf3\x75\xc6\xf2\x82\xab\xef\x41\x9a\x04\x55\x9e\x03\x82\xb7\xaa\xca\x2a\xe7\x85\x9a\x09\x81\x7c\x19\x6d\x6b\xc8\x8f\x45\x9a\xa8\xcf\x71\xba\x5e\x47\xc9\x5a\x7d\x4d\x6b\xa4\xa2\x5a\x66\x79\x1a\xf0\xa2\xe8\xf5\xca\x7c\x77\x46\x92\xc9\x39\x14\x2e\x4f\x78\x09\x2c\xf8\x6f\x01\xcf\x4a\xeb\x92\x26\x46\x79\x9e\xe6\x02\xb2\x01\xb1\x06\xd6\x24\x4d\x78\xaf\x27\x59\x79\x4b\x56\x44\xc1\x79\x9a\xac\xa2\xb5\x43\xb0\xa0\xb6\x2d\x2b\x07\xf6\x89\xc3\x8a\x00\x05\x75\x0b\xeb\xc4\x89\xf9\x1d\x8f\x13\x26\xbf\x6d\x41\x10\xb6\x86\xcf\x76\x9f\x70\x68\x76\xa0\x48\x5e\x4e\xde\x4d\xfb\x3d\xb7\xd7\x7b\x6e\xcd\x78\x91\x56\x39\xc8\x6d\x95\xa9\xb4\x6f\xf4\x99\xf7\x51\xe9\x61\x54\x64\x31\x03\x6b\xe7\x21\xcf\x7b\xb3\xd1\x7c\x7a\x3d\x3b\x1f\xcd\x41\xc0\x1b\xa2\xe9\xd8\x57\xd3\x8b\xb9\xdd\xb7\xec\x2c\x0d\x0b\xdb\xed\xcb\xd1\x1f\xa7\x6f\x69\xf4\x63\xba\xd4\x46\x2f\x46\x57\xe3\xe9\x2f\x1f\x46\x93\x05\x4d\x86\x3c\x8b\xd3\xdd\x16\xd4\xaf\xc1\xcc\x17\xc3\xc5\xe8\xdd\xf5\x78\x3e\x12\x40\xe8\x45\x7c\x55\xc5\x05\xd7\xa1\x2e\x86\xa3\x0f\xd3\x89\x82\x09\x19\xdf\xa6\x89\x09\x31\x99\x5e\x8c\x68\x32\x49\x43\x4e\xe3\xb7\xb8\xd6\x0f\x2c\xb3\x56\x79\xba\x25\x8f\xc9\xe5\xc2\xad\x72\x97\xc1\xea\x33\x56\xa0\x1b\x83\x12\xd0\x14\xe0\x3e\xf8\x91\x3c\x2b\x4a\xc2\x02\x3d\x5e\x20\x81\xa7\x24\x3c\x04\x62\x51\xc9\xb7\x45\xad\x15\xff\xa7\xcb\xc9\x05\xaa\xe6\x77\x12\x41\x68\xe4\xcc\xb2\xaf\xd2\x50\x5a\x40\xa8\x03\x86\x7e\x4c\x97\x6a\x48\x57\x02\xcc\x5c\xd4\x5f\x15\x80\xa1\x00\x80\x98\xcb\xef\x73\x5e\x83\x68\xeb\x47\x12\xf4\x4d\x9b\x16\x1a\x80\x99\x09\x7c\x80\xc1\x2f\xbd\xde\xf9\xf8\x7a\xbe\x18\xcd\xfc\xf9\xf9\xf4\x6a\x74\xe1\x1b\x86\x95\xf0\xa4\x2e\xb9\x4b\xe5\xae\xda\x72\xf8\x06\x9a\xc0\x4d\x1b\x47\x45\x09\x7e\x64\x71\x16\x6c\x4c\x45\xf6\x2d\x56\x58\xce\xf0\xea\x12\xd0\x40\xa3\x7d\x89\x06\xd4\x10\x0f\x82\x81\x85\x2e\x5a\x64\x0c\x3c\x4e\x4d\x8a\x29\x88\x04\xc9\x3a\xe6\xcd\xbc\xdb\x03\x32\xfe\xf8\x72\xbe\xf0\x3f\x8c\x16\x3f\x4c\xf7\xa8\x57\xec\x07\x1a\x39\x4f\x73\xfe\xf3\xb7\xc3\x2c\x92\x0b\xa7\x41\x94\xd3\x07\x58\x1f\x38\xf8\xc0\xdc\x6f\x98\x77\xc0\xea\xa9\x10\x31\xe4\xb4\x6b\xda\x4e\xe3\xf7\x96\x95\xc1\x66\x3f\x43\x00\x7e\x22\xc3\x8f\xb5\x4b\xb8\x7b\x3d\x43\xe3\x3b\xcc\xb2\x62\x3f\xdb\x06\xe5\x89\xdc\xc3\xb6\xdb\xb9\xfb\xbd\xef\x51\x52\x28\x1c\x1f\x90\x9e\x28\x87\x8e\xda\x56\x87\xee\xe4\x8f\xd3\x06\x61\x7c\x85\x14\x0d\x62\x4b\x06\xb5\x93\x1e\xe5\x74\x89\xd8\x6d\x07\x07\x5d\xda\x89\x3d\xda\x24\xd6\x32\x48\xe3\x34\x2f\xc4\x49\xf0\xc3\x68\x78\x31\x9a\x81\xab\xdb\xbf\xbe\x7c\xfd\xfa\xe6\xaf\x7f\xda\xda\x34\x3e\xfd\xe9\xed\xf8\x7a\xd4\x8c\x7f\x57\x8f\xbf\x9f\x8d\x46\x93\x66\xe2\x95\x9c\xf8\xfb\x70\x36\xb9\x9c\xbc\x6f\x26\x5e\xcb\x89\x77\xc3\xcb\x71\x33\xfa\xad\x1c\x1d\x4d\x2e\xce\xeb\xd1\x97\x72\xf0\xed\x74\x7c\x51\x0f\x2a\xc8\xeb\x09\x08\x38\xbe\x9c\x34\xc2\xa0\x2c\x18\x31\xde\xd1\xc9\x84\x87\xf3\x86\xb3\x10\xf6\xb3\x08\x17\x46\x98\xc0\x63\x3e\x8a\xe1\xe8\x4c\x20\x64\x54\x14\x90\x93\xb2\x87\xab\x06\x61\x9b\x2d\x2e\x09\x9c\x29\xe5\x78\x72\xfd\xdf\xd4\x03\x24\xdb\x37\x96\x4d\xfa\x85\x0f\x12\x43\x83\xc0\x25\xa9\x13\x53\x4d\xf7\x2d\x1f\xcf\xb6\x3a\xe8\x81\x19\x26\x53\xff\x7c\x3a\x9e\xce\x7c\x5d\x88\x9a\xbf\xfd\xfd\xf7\xdf\x1b\xf4\x8f\x10\x43\x93\x86\x7c\x65\x6d\x59\x94\x38\xae\xb0\x27\xe4\x1d\x78\xa6\xaf\xc1\x11\xf1\xa3\xe3\x8a\xb4\x2a\x5a\xd1\x8c\x17\xf2\x65\xb5\x3e\xab\x1d\x45\x9d\xd0\x00\x3e\x86\x8f\x3c\x77\x5c\x0f\x5c\x71\x8c\xc7\xb7\xa3\x26\x2f\x46\x6f\xaf\xdf\x4b\x3a\x4a\xad\xbe\x38\xc6\x20\x84\x1b\x23\x24\xad\xdf\x37\xc1\x0c\x99\x6f\x4d\x79\xaa\x82\xfb\xea\x04\x04\x54\x2d\x2f\x89\x0a\x4a\x4c\xba\xb2\xd2\x12\x1c\xfb\x3d\x2f\xe9\x50\xc8\xeb\x8c\xe2\x2e\x62\xea\x34\xb5\xdd\x1a\x8d\x0e\x4e\x7f\xb9\x13\xa2\x0c\x14\x84\x8f\x1a\xda\x56\x71\x19\x35\x1b\xac\xbb\xc0\xbe\x31\x47\x12\xd7\x7b\x77\xcf\x1c\xd1\xa6\xd4\xa9\x99\x14\x92\x70\x88\x6a\x4f\x5c\x8a\xca\x33\xa5\x3e\x32\xfd\x78\x3c\xb2\x3e\x96\x45\xff\xe3\xb5\x25\xe9\x3d\xf0\x55\x69\xac\x57\x7f\x80\x71\xa7\xfe\x82\xff\x7c\x06\x7b\x7a\x55\x19\x48\x5f\x32\x3c\xfb\xb0\xc7\x34\x6a\xcb\xb0\x36\xf0\x25\x8a\x53\xa3\x26\xa9\x4f\x3b\x70\x20\xd6\x20\xbf\x49\x26\xf8\x07\xdf\xab\x6d\x82\xde\x0a\x1b\xef\xfa\xc3\x64\x6e\x3a\xed\x6d\x0d\xd8\xc4\x65\x80\x35\x25\x4a\xd2\x12\xa5\x3a\x94\xcc\x34\xe6\x58\xe9\x54\xb0\x8a\x30\x35\x6b\x0d\x20\x8a\xd9\x67\x86\x7e\x1b\xf9\x6e\x20\x99\x1c\x7e\x18\xcd\xaf\x86\xe7\x23\x48\x28\x57\x11\x8f\x43\xc7\x86\xbc\x85\x81\x22\x59\x43\xc5\x76\xdd\x5b\x88\x11\x12\xb1\xa7\x69\x08\x5c\x09\x5c\x81\x2d\x63\xee\x63\xee\xe9\x63\x35\xe1\x18\x3e\xd2\x5a\x7c\x5f\x51\x41\x45\xde\xbb\x32\xa4\x74\x77\x49\xcb\x79\x9a\x55\xf6\xad\xc6\x35\x64\x10\x82\x42\x08\x7c\x9a\x3c\x98\x58\x93\xa9\x89\x4c\x16\xb7\x53\x61\x0c\xd0\xc1\x27\x8e\x51\x7c\xb9\x33\xe7\x3c\xb1\xb0\xc5\x86\xb7\x75\x2a\x8b\xc1\xd3\x22\x48\x33\x4c\xa3\x29\x18\xb1\x9c\x8b\xd8\xbf\xe2\x90\x2c\xc1\xf0\x7d\x54\x6e\xea\x4c\xaf\xae\x7b\x30\xd4\x60\x9d\x68\x39\x79\x95\x68\x75\x59\xbc\x73\xc1\xc2\x40\x96\x85\x98\x7f\x83\xaf\x0a\xb0\x8c\xe7\x52\x1a\xb9\xb4\x9e\xe9\x2a\x4d\x28\xac\xcd\x90\xd3\x82\x73\x74\x98\x56\xc0\x04\xf7\xc8\x1f\xe5\x4b\xc2\x29\x55\x95\xfc\x64\x16\x0f\x93\xa7\xff\x48\x43\xdd\xd2\xd4\x5b\x6c\x72\x50\xc3\x55\x9a\xc6\xa3\xdf\x78\x50\x95\x69\xee\x6c\xd9\x6f\xfe\x7d\x9a\x7f\xe2\x79\x31\x78\xe5\x62\xde\xcd\xe5\x54\xe3\xcc\x12\xdd\x10\x14\xff\x14\xa4\x07\x65\xeb\x36\x2a\xcd\xa8\xa4\xd9\x85\xdc\x0d\x3d\xb6\xdf\x81\xb0\xfb\xb6\xf7\x31\x85\x73\x8e\x16\xe9\x76\x01\x0e\xc4\xae\x9a\x7a\x2b\x74\xe1\x9f\x6b\x7c\x43\x7d\x4a\x0d\x26\xd6\x4d\xdb\xbe\x7d\xd3\x16\xb7\xa8\x66\xfa\x54\xd3\x68\xc2\x08\xa8\x00\x7c\x9d\xd4\x20\x34\xe2\x89\x11\xc7\x25\x26\x62\x0c\xb9\x48\x7d\x49\x63\x10\x39\xdc\xa5\x58\x03\xd6\x99\x09\xfe\x99\x65\x5f\x6b\x03\x9f\x99\x0e\xd0\xd3\xd7\xd3\x89\xaa\xa6\xaf\x10\xec\x17\x71\x20\xb7\x8e\x91\xdf\x0d\xc8\x33\xeb\xe6\xf6\x31\x04\xbf\x34\x91\x5d\x2c\x59\x82\xa0\x3a\xce\x0c\xc9\x90\x5f\x33\x89\x09\x88\x63\x93\x0c\x10\xf6\x6e\x6e\x5d\x33\x40\x9a\x5c\x07\xa6\xa6\x08\x17\x51\x05\x11\x1c\x82\xf0\x68\xe0\xe3\x96\x30\x05\x2f\x68\x13\x9a\x09\x46\x0d\x7d\x24\x5a\x7a\x2c\xcb\x78\x12\x12\xbf\x3a\x25\xc2\x22\xdd\xc4\x92\x51\xd4\x3c\x8b\xff\x5b\x11\xb4\xce\x16\x8c\x14\x41\x06\xcf\x21\x44\xb0\xba\x9b\xf0\xcf\x8a\x17\xe0\x97\xc5\x06\x43\x25\x0e\xc9\x6c\xa2\xc0\x18\x90\xc0\x0e\x8c\x00\x3d\x83\x5d\xdf\xb7\xee\x37\x11\x44\x52\x76\x97\x46\x50\x84\x03\x28\x11\x93\x2d\x27\x6c\xb7\xe5\x65\x95\x41\xf5\x5d\x95\x9b\x3e\x45\xe4\x30\x82\x58\x7c\xc7\xf3\x1d\x90\x42\x1e\xc0\x13\xc2\x6b\x82\x69\x8d\x0a\xba\x2a\x37\x17\x91\x0d\x42\xab\x19\x51\x51\x59\xb2\xf8\x1f\x68\x89\x8f\x27\xf4\xe2\x25\xfc\x5e\x4e\x8b\x83\x2d\xd0\x5a\x54\x44\x90\xbe\xfb\xab\x28\xe6\x83\x46\x9d\x98\x54\xa2\x95\x65\x19\xf4\xe4\xa8\x67\x38\x87\x1e\x02\x63\x9e\xb4\x0c\xea\x3e\x31\x28\x76\xa3\xa0\x41\xaf\x1b\xc6\x1e\x8c\xa2\x4a\x8b\x87\xa3\xa8\xa9\xe7\xfd\xf3\x0f\x48\x81\x7f\x47\x62\xad\xfb\x50\x88\x7d\x4c\x48\xc2\xbf\xdb\x26\xab\x91\x3b\xec\xf7\xc3\x31\xe1\xcc\x6a\x05\xda\x4e\x40\x39\x2e\x47\xbf\x1b\x94\x6b\x84\x2f\xad\xcd\x4c\x19\x95\xa6\xc4\x36\xa5\xa6\xa3\x74\xa6\xf9\x35\x75\xa7\xcc\xb6\x80\x2f\xfa\x51\x7d\x3d\x97\x90\x2d\xaa\x81\xf5\x6b\xcd\xbf\xdd\x96\xda\x97\xbc\x02\x0f\x51\xf4\x41\x39\x9c\x3b\xfa\xe6\x91\x32\xd6\x42\xb8\x9a\xe8\x72\x3b\xb4\xaa\x91\xb1\xec\xb6\x9d\x34\x81\x05\x44\xb0\x5b\xeb\x94\xb8\xcf\xad\x2b\xec\x72\x8b\xf8\xc2\xee\x11\x26\xc3\xce\x89\x9e\x49\x6d\xd8\x1d\xd2\x6b\xe2\x0d\x95\xe4\x21\x04\xb6\xc2\xda\xa6\x21\x8f\x25\xa5\x74\xf9\x11\xe2\x04\x44\x17\xec\x84\x32\x3d\xf8\x01\x05\xc1\xa2\x00\x4d\x41\xf4\xc9\xab\x80\xac\x05\xfb\x4d\x15\x7c\x05\xde\x19\x64\x55\xe9\xa9\xf2\xb2\xe3\x67\x07\xfb\x90\xe0\x0c\x07\xd3\xf3\x7a\x3d\x8d\x76\x41\x7f\x07\x2c\xe9\x3a\x3e\x24\xe0\x71\xca\x42\x8c\x4e\x25\xac\x74\xf0\x8e\x41\xe1\xb7\xaf\x04\x3c\x44\xb8\xe3\x0b\xae\xb9\xcf\x0f\x6c\xbd\xfd\x8c\xf5\x4a\x4d\x3f\xab\xd0\x85\x3d\x04\x2f\x1c\x25\x87\x47\x05\x46\x08\x61\x33\xe4\x8e\x5d\x95\xab\xd3\xbf\xe0\x29\xda\xad\x06\xc8\xfd\x0f\xb9\xfc\x9e\x93\x2c\xd8\x86\x46\xe8\xb3\x95\xc5\xb4\x76\xd5\xba\xee\x7e\x75\x76\xb6\x06\x75\x7a\x2a\x4c\xac\x63\xa2\x34\xb6\x01\xd3\x08\xa0\x8d\xb7\x33\xc0\xa6\x0b\x61\xba\xc9\x1f\x06\x75\xe3\x6d\x6f\x45\x47\x00\xed\xea\x0d\x16\xf8\x4d\x3b\xb8\x0b\x61\x74\xd1\x1e\x30\x60\x93\x3d\x9a\x7e\x22\x39\xa8\xbc\x03\x16\x08\xae\x77\xaa\xf5\x16\xf7\x6f\xe2\x99\x3c\x7b\x83\x74\xbb\x85\xe3\xf9\x0c\x76\x33\xec\x60\xd8\x39\x0e\x10\x73\x9b\x66\x0e\xa6\x68\x03\xed\x36\xc9\x83\xc2\x29\xf8\xe4\x0b\x45\x13\xec\x61\xbf\xc1\xbc\xed\x80\xc3\xa0\xa3\x88\xe2\x15\x37\x70\xdf\xca\x18\xe6\x09\x30\xc3\x00\x69\x80\x07\xb2\x99\xe7\x30\x2b\x81\xcc\x04\xef\xf5\x10\x49\xdc\x9a\x30\xc8\x29\x82\x92\x62\x10\x7c\x4c\xa9\xcf\x87\x74\xac\x38\xfa\xc4\x45\xb7\xb8\x2a\xbc\x6c\xc3\x0a\x6e\x7b\x2a\x89\xb8\x63\x71\x85\x7b\x0a\xd9\x36\xb9\xe8\x27\xbe\xc3\x08\x80\xd8\x5e\x91\xc5\x70\x76\xda\x9e\xed\x9a\x26\xc6\x9a\xac\xc0\xa8\xc5\x92\x80\x3b\x44\xa7\x4f\x12\xb8\x96\xa4\x20\xcb\x36\x9a\x6a\xe7\xa7\xa4\x1e\xb9\xbe\x7a\x4a\x09\x43\xff\xdf\x00\x89\x5b\x63\x17\xd2\xb0\x54\x98\x50\x96\xa9\x26\x5b\x89\x28\xe1\x63\xb6\x5d\x86\xcc\x12\x1a\x85\x5a\xfd\xec\xb8\x9a\x95\x2d\x72\x06\x69\x9d\x93\x54\x5b\x0e\x9f\xd2\xdc\x57\x40\x49\xba\x8d\x92\x7a\xe4\x21\x56\xf6\x49\xf8\xe2\x24\xb4\xad\x13\x2d\x6f\x69\xb3\x6f\xf3\x78\xa9\x25\x03\x6d\xd8\x36\xff\x06\x5a\xc9\xcd\xd6\xdc\xa9\x05\x50\xc1\x04\x12\xb4\x92\xba\x33\x74\xb9\xea\x63\x57\xc9\x69\x93\x6e\xfa\x25\x04\x0e\x39\xed\x02\xc0\xc0\xb0\xdb\x4c\x15\x06\x60\x70\x45\xaa\xd3\x67\x94\x2a\xb0\xdf\x54\xc9\x27\xe0\x9c\x7c\x6f\x1b\x56\xdb\x54\xb0\xa1\xfc\xb0\x22\xb5\x26\x0e\x36\xbf\x4e\x15\x31\x25\x3a\xde\x01\x61\x2a\xb9\xeb\x2e\x00\xc2\x33\x8b\x12\xbc\xf8\x26\xff\xe5\xaa\x59\x6b\x2c\x40\xfa\x76\x0d\x3c\x97\xb0\x32\x95\xd1\xc5\xd9\x67\x17\xcc\x4d\x6f\x02\xf2\xfc\x00\x3d\x76\x0f\x53\x54\x80\xc8\x91\x48\x4e\xdb\xbd\xd5\x6c\x85\xf8\x5d\x99\x32\x1e\x34\x12\x49\x51\x5a\x26\xc3\x75\x0b\x16\x9d\x85\x47\xdd\xa0\xd0\xd8\x09\x72\x00\xde\xb2\x53\xd7\x1e\x0b\x9e\x93\xc3\x40\x58\xb3\x9b\xad\xdd\x5e\x1b\x5d\xdf\x3f\x4d\x9f\x66\x61\x4a\xd7\x42\x74\xb6\x53\x1f\xc0\xbe\x67\x11\xb1\x04\x32\xa5\x94\x80\x87\xf6\x6d\x3b\x00\x30\x08\x8d\x86\x29\x3b\x81\xbf\x2d\xe9\x9e\x1e\x07\xf1\xf6\x4e\x0a\x4f\xd0\x43\xab\x36\xe2\x1c\x4b\xac\xe9\x20\x43\x94\x6e\x35\x2b\xd5\x27\xa6\x0d\xd7\x39\xbc\x91\x95\xc2\xa4\x18\x18\x01\x1f\x84\x15\x81\x18\xbe\xcb\xde\xb4\xb9\x17\xa8\x62\xec\x7a\x85\x94\xa4\xa8\xb6\x5a\x21\xa7\xfc\x92\x70\xce\xd3\x0a\x2f\x0a\x21\x3a\x18\x56\x0a\xbe\xc2\xce\x86\x58\x78\x6b\x0a\x87\x63\x26\x1c\xef\xa0\x64\x8f\x09\x7b\x8a\x6d\x51\x05\x01\xe7\x21\x78\xc7\xf1\xd0\xa7\xb6\x52\xcd\x9c\x14\x6c\x7d\xdb\xef\x08\x58\x47\x99\xb6\x74\xa4\x1a\x8a\x7e\x0f\x84\x42\x25\x1a\xc2\xe3\xee\xd2\x02\xa0\x46\xe3\x60\x0c\x94\x1b\xad\x91\xf5\x09\x3c\x1b\xa4\x16\xe3\x36\xb5\x0e\xf7\x2e\x3b\x58\xf9\xb1\x20\xdc\x46\x38\xd5\x16\xa7\xf4\x59\xdf\xe9\xd2\xbd\xa8\x5f\x40\xc8\x09\xb0\xc2\x6f\xab\xd6\x98\xdd\x1b\x9c\xd1\x7a\xf0\x31\x8b\x71\xb3\xd2\x37\xc4\x99\x4b\x14\x30\xfe\xef\x5f\x5a\x31\x5a\xf5\x2e\x9b\x3c\xf5\xa4\x18\x40\x46\x86\x6e\x05\x69\x41\x5f\xa4\x02\xae\xca\x55\xe4\x77\x74\xf1\x22\xcd\x21\xdc\x38\x86\x50\x1e\x15\x45\x8e\x54\x28\xf9\x8e\xfd\x26\x01\x0d\xe2\x49\x45\x6b\x15\xe0\xfb\x03\xb1\x0c\x93\x90\xc7\x5e\x8b\xf3\xcd\x0c\xa6\x61\x44\x4d\xa0\xe3\xbb\x4b\x00\x75\xc2\x27\xd9\x56\x4e\x8a\x4d\x8c\x49\x35\x78\x37\x16\x55\x33\x3a\x67\xce\xda\x61\xab\x85\x20\x78\x48\x94\x45\x5e\x71\xbb\x1b\xd1\x9a\x15\x08\x9a\x06\x40\x37\x7b\x36\x51\x26\x69\x29\xb1\x0e\x1e\x4b\x64\xd2\x2a\x29\xf0\x0e\xa1\x8a\xf1\x2a\x45\x3f\x8e\x24\x29\xc8\xf8\xed\xfe\x5c\x80\xc0\xf1\x70\x11\x15\x08\x18\x9a\xb9\x82\x80\xd5\x8d\x92\xa7\x31\xdf\x13\x6c\x70\x14\xab\xa4\xdb\xc6\x16\xc0\x98\xc7\x5d\x4f\x38\x7c\x88\x12\x42\x21\xdc\xaf\x76\x11\xc3\x38\x04\x21\x62\x41\x81\x3d\x30\x87\x6a\x9d\x53\xe4\xee\x69\x3d\x83\x28\x7d\x61\xb7\x1b\xb0\x28\xa0\xaa\x41\x88\xcc\x0d\x26\x09\xc7\xf0\xb5\x96\x0b\x8f\x15\x73\x32\xab\x09\x8a\xd8\xf6\x11\x6e\x62\x6b\xec\xdf\x4f\x04\xd8\xde\x00\xcf\xad\x73\x79\x9f\xd6\x79\x0c\xa0\xbd\x19\xc2\xdb\x43\x9e\xf7\xd1\xfa\x70\xac\xbb\x10\xd0\xa2\xbc\xf0\xf0\xae\x09\x6a\xf2\x2d\xbe\xb6\xa1\xae\xe7\x73\x95\x4d\xd7\x97\x74\xc5\x06\xf6\x0c\x5e\x55\xa9\x42\x16\x49\xd8\x5e\x4f\x5e\x2d\x76\x1e\x0d\x35\x75\xa1\xb8\xdb\x3b\x70\xad\x67\xbb\xda\x89\x01\xf5\xdb\x68\x78\xf1\x0b\x80\xd6\x99\xa4\x31\x8b\x0f\xd7\xae\xe7\x72\x5a\x38\x59\x0b\x1b\x20\x66\x8b\x79\x4d\x40\xd8\xdc\x80\x19\xbe\x47\x51\xf0\xd1\x9e\x2c\x89\xcd\xb7\x47\x5f\x27\xf6\xf9\xf4\xc3\xd5\x78\xb4\xb8\x9c\x4e\x90\x77\xeb\x8c\x35\x20\x2f\xae\x67\x43\x84\x93\x60\x2a\x94\x3f\x4a\x44\xf3\xb5\xd2\xbf\xa7\x60\x51\x1d\x69\x09\x4f\xb8\x9b\x71\x7c\x22\xca\x0a\x5b\xc5\x82\x5c\x0d\x98\x24\xae\xaf\x4e\x17\xd3\xd3\x8b\xe1\x42\x63\x29\xe9\x54\x19\x5e\x7c\x87\x1a\xa5\x97\x26\xee\xf0\xe7\xe1\xe5\x78\xf8\x76\xdc\x45\x65\x77\x2c\xa2\xa0\x73\x04\xf9\x80\x5e\x5a\x0f\xa8\xfe\x6f\x8a\x39\x68\x37\xfd\x59\xd5\xd7\x49\x77\x31\x9a\x5f\xce\x46\x17\x1d\xad\x85\xbc\x88\x72\x1e\x4e\xaa\x2d\xc4\x16\x19\x96\x65\x22\x66\x3a\xe8\xf5\x6c\x36\x9a\x2c\x3a\xf8\xf2\x2a\xe0\x41\x7c\xa5\x1d\x13\x3b\x21\x34\x71\xae\x74\x50\x1e\x76\x93\x07\xb9\x1e\xf6\x16\xc1\x79\xa8\x7c\xa6\x8b\x8a\x6f\x53\xad\xf9\x68\x3c\x3a\x5f\x4c\x67\x30\x7d\x20\x0d\x7a\x94\xfd\xd4\x93\xb4\xaf\x33\x5d\x1d\xb4\xb4\xec\xc4\xd4\xed\x74\x3c\xaa\xe7\x45\x68\x3f\x26\x95\x18\xfd\x79\x34\x9b\x8b\x30\xd2\x52\x0c\x10\xb9\x4c\x56\x29\x1d\x4c\x10\x80\x7e\x86\x9a\x35\xc2\x5a\xa6\x59\x93\x6a\xec\x6b\xb9\x6c\xa9\x0a\xd0\xa6\x6a\xc5\xae\x4f\x3d\xdc\xc9\x90\xc5\xdb\x69\x6d\xa0\xfb\x0c\xa6\x28\xf3\x8c\x88\xd7\xb8\x35\x39\xad\x71\x79\xf2\xcb\xe9\xc9\xf6\xf4\x24\x5c\x9c\xfc\x70\x76\xf2\xe1\xec\x64\xfe\x0f\xf5\x74\x8f\x76\x19\x0b\x40\xb8\xcf\x11\x2c\x68\x70\xe8\x49\x0d\xad\xa5\x95\x18\x43\x61\x5d\xb2\xa6\xd5\x26\x1e\xcc\x61\x3b\x4d\x02\x60\x62\xa1\xfa\xea\xa0\xdb\xe5\x32\xe7\x77\x11\xb5\x45\xee\xd9\x4e\x74\xe1\xd5\x29\x17\xa6\x70\x26\xab\x36\x5b\x81\xdd\xd4\x10\x53\x96\x2d\xfb\xcd\x89\x92\x52\x70\xf2\xca\xb4\x64\xf8\xa0\x92\x66\x21\xfd\xa8\xeb\x36\xa8\x9b\x2b\xf1\xda\x5c\xa1\xbe\x78\x61\xfd\xf9\x25\xcd\x6d\xe0\x6c\x6e\xcd\xbc\xfe\xf3\x4b\x31\x17\xb2\x1d\x4e\x09\x10\x98\x78\xf5\x1d\x0d\xef\x38\x23\x14\x9a\x26\xf8\x3f\xd5\xf9\x9c\x22\xf3\x06\xe8\x5b\x7f\xb4\x5e\x75\xab\x9a\x93\x90\x52\x6f\x09\x48\xd3\x94\xa2\x28\x21\xdf\x58\xdf\xbe\xec\x60\x61\xc2\x04\x27\x29\xbe\xb5\x83\xc4\xc1\x91\xb0\x98\x80\x61\x63\x55\xf2\x3c\x01\x9e\x18\x1c\x6d\x77\x1f\x55\x92\xe7\xf5\x3e\x79\xb6\x28\x8f\x04\x6c\x30\xc5\xaa\xdf\x58\x7f\x79\x48\x18\x02\x04\xbe\x1b\x10\x45\xb1\x93\xa2\x6c\x75\x51\x14\xc1\xef\xba\x14\x41\x88\x0d\x0a\x41\x20\x5d\x8c\x57\xdf\x81\xe8\x0f\xca\x81\xe6\xc0\x37\xf2\x20\x86\x40\x3c\x01\x44\x92\x6b\x8f\x10\x44\x12\x0c\x77\xc8\x46\x54\x75\x23\xc5\xa3\xa8\x0f\xca\x44\xae\x02\x32\xec\x28\xf8\xed\x50\x26\xc0\x24\x29\xf7\xdf\xcb\x28\xfe\x3b\xe4\x4f\xd8\x72\x6f\xb5\x08\xcb\x16\x71\x95\x44\x74\x07\x28\x87\xb5\x8f\x3e\x4e\xc9\xcd\xf7\xdc\x1a\x63\xd7\x5a\x6e\xa6\xbe\x15\x73\xbc\xd2\x4a\x57\xea\x66\x5e\xa2\xa0\xff\x46\x78\x1f\xff\x99\xe7\xa9\xe5\x70\x6f\xed\x81\xa4\xaf\xc1\x3d\x9a\xfb\x34\x49\x0f\x46\x5f\x82\x9f\x69\xf7\x5d\x8a\x06\xe4\xd8\x5d\xf7\x85\x05\xc9\x82\x53\x93\xdb\x68\xee\x13\xc4\x3e\xa8\x63\xab\x53\x21\xf4\xc8\xbb\x33\xf3\x81\x99\xde\xfc\xc7\xaa\x80\x4b\x28\xb7\x25\x36\xbd\xf5\x83\xe3\x05\x9f\x61\xad\xd2\x2a\x09\x7f\x4d\xb4\x47\x8f\x42\xe4\x7a\xcb\x63\x13\xb6\xd3\x45\xf8\xda\x67\x89\x79\x7a\x4f\xb5\xd8\x8d\x28\x11\xea\x67\x8a\xb8\x7a\x5f\xb4\x53\x69\x39\xb7\xb7\x75\xad\xa6\x1e\xb3\xd0\x4a\x34\xd5\x03\x25\x55\xc6\xdc\xe0\xdd\x8b\x28\x36\xb4\xf2\xcf\x55\x0f\x66\xc5\x8c\x4e\xbd\xbe\x60\x3d\x87\x0c\x1a\x76\xb4\xb8\x3f\xa5\x49\xf0\xc4\xb0\xdc\x50\xab\xb3\xfe\x1d\x03\xfe\xa0\x84\x1e\x62\x64\xe0\x24\x04\xca\xe3\xb8\xa8\x7f\x9c\xf4\x37\x49\xac\xdc\x44\xf4\xb4\x76\x5b\x41\x81\x03\x09\x07\xa3\xd7\x6d\x1b\x86\xbf\x79\x12\x97\xb4\x79\x5a\xad\xa1\xf6\x61\xcb\x0a\xfb\x1b\xb2\x14\xcd\xd7\x5c\xbd\x7f\x92\x3f\xaf\x92\x22\x80\x9e\xf0\x04\xa0\xd7\x10\xe9\xfd\x4d\x70\x2b\x56\x94\xa3\x41\x12\x52\x80\xdb\xf4\xeb\x72\x96\xac\x39\xc1\xca\x45\xba\xae\x2c\x78\xa1\x84\x56\x05\xb0\xd2\xa9\x46\x42\xeb\x0c\xd1\xa2\x00\x0e\x3f\x78\xf1\x47\x90\xc8\x21\x49\x24\x17\x18\xed\x0b\xd1\x10\xf7\x73\x94\xa1\x54\x72\xa4\x70\x9b\x3b\x36\xe2\x57\xdf\xa9\xc1\x80\x2c\x28\x89\x3e\x9c\xb8\x60\x2c\xc0\x55\xf7\x64\xd2\x17\xc1\x03\x05\x14\x61\xcb\xf6\x8b\x9c\xb3\x9b\x9d\x70\xfc\x8d\xaa\xb8\x10\xd6\xb2\x0b\x31\xde\x76\xfc\xce\x23\xf1\x1b\x49\xea\x76\x5f\xd0\x12\x38\x7b\x40\x9b\xdb\x38\xf1\x18\x5c\xa0\x50\xc2\x83\xbd\x2d\xf5\x23\x35\x6f\x98\xaf\x2b\xac\xa7\xe8\x32\x5f\x7b\xf5\x02\xf9\x5e\x00\x9a\xc0\x54\x61\x80\xcf\x94\xf5\x9f\xe4\x51\xde\x80\x15\x87\xf1\xfb\x3c\xb9\x49\x05\x0b\x8f\x85\x21\x72\x26\xda\x5a\xf7\xeb\xf4\x94\xae\x29\xb5\xdb\x51\x75\xe7\xd5\xba\xb6\x66\x81\x60\x5d\x40\x8a\x0a\x29\x1a\xf6\x83\x9a\xc9\x0d\x8f\xb3\x81\xbd\xc0\xd8\x95\xe2\xe5\x1b\x50\x54\xd7\xa0\x2a\x77\x7a\x94\x2c\x49\x7a\x4a\x36\xf8\x0f\x8a\xb3\xc2\xc6\x16\xfe\x28\xe0\x29\x82\xb4\x2e\xb2\x9b\xc7\xbe\xcd\x30\xf6\x2f\x06\xe0\x9c\x5d\x49\xed\x8e\x24\x93\xfa\xd2\xba\x4c\xb1\x03\x02\x2e\x1d\x40\x2a\x9b\x3e\x49\x37\xad\xcb\xe6\xff\x84\x86\xd0\x8d\xb0\x46\xd8\xf3\x13\xad\x27\x89\xb6\xf7\xa2\xff\xb0\x82\xd2\xc2\xe3\xc9\x5d\x94\xab\x4e\xe3\x4f\xd7\x6f\x47\xe7\xd3\xc9\xbb\xcb\xf7\xe2\xd2\xa2\x2d\xe6\x4f\x6d\xf2\x8f\x93\xaa\x2a\xf8\x69\xf7\x85\xc3\xd7\x6b\xeb\xba\xa8\xb3\x06\x8b\xdf\xe1\xcf\x53\x57\x47\x7f\x19\x80\xc1\x9d\x6e\xb1\x63\xaa\x24\xa5\xe4\xfa\x39\x2f\x57\x20\xaa\x1e\xf5\x1b\x91\x1e\x90\xf5\xe9\x9a\xc9\xf7\xf1\x24\x7e\xe6\xfb\x78\xce\xfb\xfe\x33\x11\x32\xc4\x4f\x4c\x7a\xff\x02\xd9\x3b\x5f\xad\xcd\x3b\x00\x00")
 
 func scriptsClusterSummaryCluster_summaryPyBytes() ([]byte, error) {
 	return bindataRead(
@@ -214,28 +213,8 @@ func scriptsClusterSummaryCluster_summaryPy() (*asset, error) {
 		return nil, err
 	}
 
-	info := bindataFileInfo{name: "scripts/cluster-summary/cluster_summary.py", size: 4488, mode: os.FileMode(0755), modTime: time.Unix(1620428515, 0)}
-	a := &asset{bytes: bytes, info: info, digest: [32]uint8{0xb2, 0xfd, 0xc1, 0xd0, 0x9d, 0x3e, 0x14, 0x51, 0x1a, 0x84, 0x85, 0x49, 0x4a, 0x63, 0x5c, 0x4d, 0x3a, 0x6c, 0x28, 0x48, 0x9, 0xd0, 0x64, 0x2f, 0x7b, 0x5b, 0xa8, 0xe8, 0x1, 0xa, 0xa9, 0x99}}
-	return a, nil
-}
-
-var _scriptsClusterSummaryTabulatePy = []byte("\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff\xe4\xbd\xdd\x72\x1b\xc9\x91\x30\x7a\x8f\xa7\x48\xb7\x6c\x13\x90\x1a\x10\x49\x69\xec\x11\x46\xd0\x06\x47\xa2\x66\x78\x56\x22\x15\x24\x67\xc6\x0e\x02\x0b\x15\xba\x0b\x44\x5b\x8d\x2e\xb8\xab\x40\x88\x96\x74\xc2\x71\x9e\xe0\x44\xec\xd5\xd9\x58\x5f\xac\xc3\x11\x1b\xb1\x71\x9e\x60\x63\x63\x2f\xf6\x84\xaf\xf6\x2d\xfc\x24\x27\x2a\xeb\xbf\xbb\x01\x82\x23\x8d\x3d\xfb\x7d\x8c\x19\x01\xa8\xca\xca\xca\xca\xcc\xca\xca\xfa\xcb\xba\x03\xdd\xbb\x5d\x48\x58\x9a\x15\x97\x7d\x58\x8a\x69\xf7\x73\x99\xd2\x8a\xa2\xe8\x55\x49\x85\xb8\xee\x2e\xca\xac\x10\x20\xc8\x64\x99\x93\x12\x52\x22\x48\xaf\xd5\x7a\xca\x16\xd7\x65\x76\x39\x13\xd0\x4e\x3a\xb0\xbf\xbb\xb7\xd7\xdd\xdf\xdd\xfb\x25\x9c\xd1\xf2\x92\x5e\xc3\x01\x17\xa4\xc8\x8a\x56\xeb\x15\x2d\xe7\x19\xe7\x19\x2b\x20\xe3\x30\xa3\x25\x9d\x5c\xc3\x65\x49\x0a\x41\xd3\x18\xa6\x25\xa5\xc0\xa6\x90\xcc\x48\x79\x49\x63\x10\x0c\x48\x71\x0d\x0b\x5a\x72\x56\x00\x9b\x08\x92\x15\x59\x71\xd9\x22\x90\xb0\xc5\xb5\x84\x14\xb3\x8c\x03\x67\x53\xb1\x22\x25\x05\x52\xa4\x40\x38\x67\x49\x46\x04\x4d\x21\x65\xc9\x72\x4e\x0b\x41\x84\xac\x6f\x9a\xe5\x94\x43\x5b\xcc\x68\x2b\x3a\xd3\x25\xa2\x0e\x56\x92\x52\x92\x43\x56\x80\x98\x51\x30\x59\xb0\xca\xc4\x8c\x2d\x05\x94\x94\x8b\x32\x4b\x24\x8e\x18\xb2\x22\xc9\x97\x92\x37\x2d\x93\x9d\x67\xf3\x4c\xd7\x20\x8b\x23\x13\xb8\x44\xba\xe4\x34\x46\x3a\x63\x98\xb3\x34\x9b\xca\x4f\x8a\xcd\x5a\x2c\x27\x79\xc6\x67\x71\x2b\xcd\x24\xea\xc9\x52\xd0\x18\xb8\x4c\x4c\x68\x21\x4b\x91\x22\xbd\xcf\x4a\xe0\x34\xcf\x25\x86\x8c\x72\xd5\x56\x47\x1d\xc2\x80\x60\xad\x85\x64\xa8\xd0\x2c\xc2\x7a\x57\x33\x36\x0f\x5b\x92\x71\x98\x2e\xcb\x22\xe3\x33\x9a\x62\x73\x19\x70\x86\x35\xfe\x86\x26\x42\x62\x91\xe0\x53\x96\xe7\x6c\x95\x15\x97\x90\xb0\x22\xcd\x64\x8b\x78\xbf\xd5\x3a\x9f\x51\x20\x13\x76\x45\xb1\x2d\x4a\xc6\x05\x13\x59\xa2\xd8\x8d\x02\x58\x38\xa9\xea\x2c\x3e\x23\x79\x0e\x13\xda\x52\x0c\xa3\xa9\x64\x2f\xf1\x9a\x53\xca\xea\xa5\x56\x88\x8c\xe4\xb0\x60\x25\xd6\x57\x6d\x66\xaf\xd5\x3a\xff\xfa\x10\xce\x4e\x9e\x9f\x7f\x77\x70\x7a\x08\x47\x67\xf0\xea\xf4\xe4\xdb\xa3\x67\x87\xcf\x20\x3a\x38\x83\xa3\xb3\x28\x86\xef\x8e\xce\xbf\x3e\xf9\xe6\x1c\xbe\x3b\x38\x3d\x3d\x38\x3e\xff\x35\x9c\x3c\x87\x83\xe3\x5f\xc3\xdf\x1f\x1d\x3f\x8b\x5b\x87\xbf\x7a\x75\x7a\x78\x76\x06\x27\xa7\x70\xf4\xf2\xd5\x8b\xa3\xc3\x67\x31\x1c\x1d\x3f\x7d\xf1\xcd\xb3\xa3\xe3\xaf\xe0\xcb\x6f\xce\xe1\xf8\xe4\x1c\x5e\x1c\xbd\x3c\x3a\x3f\x7c\x06\xe7\x27\x20\x2b\xd4\xa8\x8e\x0e\xcf\xe0\xe4\x79\xeb\xe5\xe1\xe9\xd3\xaf\x0f\x8e\xcf\x0f\xbe\x3c\x7a\x71\x74\xfe\xeb\x18\x9e\x1f\x9d\x1f\x4b\x9c\xcf\x4f\x4e\xe1\x00\x5e\x1d\x9c\x9e\x1f\x3d\xfd\xe6\xc5\xc1\x29\xbc\xfa\xe6\xf4\xd5\xc9\xd9\x21\x1c\x1c\x3f\x6b\x1d\x9f\x1c\x1f\x1d\x3f\x3f\x3d\x3a\xfe\xea\xf0\xe5\xe1\xf1\x79\x0f\x8e\x8e\xe1\xf8\x04\x0e\xbf\x3d\x3c\x3e\x87\xb3\xaf\x0f\x5e\xbc\xc0\xaa\x0e\xbe\x39\xff\xfa\xe4\x14\xe9\x7b\x7a\xf2\xea\xd7\xa7\x47\x5f\x7d\x7d\x0e\x5f\x9f\xbc\x78\x76\x78\x7a\x06\x5f\x1e\xb6\x5e\x1c\x1d\x7c\xf9\xe2\x50\x55\x75\xfc\x6b\x78\xfa\xe2\xe0\xe8\x65\x0c\xcf\x0e\x5e\x1e\x7c\x75\x88\xa5\x4e\xce\xbf\x3e\x3c\x05\x09\xa6\xa9\xfb\xee\xeb\x43\x4c\x3a\x3a\x86\x83\x63\x38\x78\x7a\x7e\x74\x72\xdc\x3a\x79\x0e\x4f\x4f\x8e\xcf\x4f\x0f\x9e\x9e\xc7\x70\x7e\x72\x7a\x6e\x8b\x7e\x77\x74\x76\x18\xc3\xc1\xe9\xd1\x99\x64\xc8\xf3\xd3\x93\x97\x31\x48\x76\x9e\x3c\x47\x9e\x1d\xcb\x72\xc7\x87\x0a\x8b\x64\x35\x04\x12\x39\x39\xc5\xdf\xdf\x9c\x1d\x3a\x5a\x9e\x1d\x1e\xbc\x38\x3a\xfe\xea\x4c\x16\xf6\x81\x7b\xd2\x8a\xb4\x5a\xd3\x92\xcd\x61\x3c\x9e\x2e\xc5\xb2\xa4\xe3\x31\x64\x73\x29\x7e\x40\xbb\x32\x9e\x2e\x0b\xec\x6a\xeb\xa0\x96\x45\x96\xb0\x94\x8e\xf3\x4c\xd0\x92\xe4\x5c\xc1\x25\x2c\xcf\x69\xa2\x54\x48\x03\x16\x64\x4e\x53\xb1\x5c\xe4\x54\x81\x2c\x72\x22\xa6\xac\x9c\xdb\xea\xae\xc5\x8c\x15\xe3\x2b\x5a\x4a\xbd\x1d\x2b\x48\x9d\x57\xda\x6f\x73\x22\x66\xad\x56\x2b\x9b\x36\xc2\xb7\x3b\xf0\x64\x00\xed\xe8\x41\x14\x83\xfa\x67\x37\xea\xf4\x5b\x00\x00\x55\xb2\x7a\x64\x92\x98\xaa\x8f\x24\xe9\x93\x9c\xb6\x68\xce\x69\x33\x78\x0d\x74\x3d\x09\x17\xbb\x23\x78\x2c\xab\xf7\x30\x49\xe6\x08\xc6\x72\x8b\x27\xfb\x5d\xb6\x18\xe7\xac\xb8\xa4\x5c\x38\x30\x64\xb6\x0f\xb6\x20\xa5\xec\x8f\x2d\x04\x19\x17\xac\xa0\x63\x71\xbd\xa0\x30\x00\xf9\xd1\x3e\x66\x05\xed\xa8\xbc\x09\x63\xb9\xc9\x93\xdf\x55\xaa\x94\xa0\x4e\xcc\x0a\x55\x11\xd6\x6a\x12\xe5\x77\x80\x3b\x50\xb0\xdf\x12\x95\x3b\xcd\x19\xb1\x65\xf0\x87\x4a\x17\xf4\xad\x4d\xd6\x32\x0f\x0b\x4e\xb2\x82\x94\xd7\x06\x84\x8b\x52\x11\x9d\xd2\x29\x8c\x33\x3e\x96\xd6\xbe\x3d\xd5\xc2\x90\x7f\x25\x15\xcb\xb2\x80\x19\xe1\x44\x88\xb2\x3d\x8d\x21\x2a\x29\x49\xa3\x4e\xab\x55\x95\x43\x8d\x7b\x1e\xf3\x80\xf0\x6d\x99\x59\xd2\x74\x99\x48\x73\xff\x03\x33\xd5\x26\x6e\xc3\x4b\xc9\xa8\x06\xfe\x4d\xae\x05\xe5\x98\x31\x21\x1c\x07\xbc\xe2\xd2\x67\xab\x51\x23\xb6\x1d\x97\x33\x9e\x15\xd2\xb8\x27\x54\x32\x3a\x63\xbd\xa3\x93\x2f\x09\xa7\x92\xd7\xa2\xbc\xee\xfb\x28\x57\xc9\x2a\x4b\xc5\x4c\x0a\x97\x2d\xa4\xee\x93\x1c\x56\x59\x4a\xbb\xd2\x09\x20\x89\xa0\x25\xb4\x9f\xfe\x1f\x7f\xdf\x01\xbe\x5c\xc8\x02\x2d\xfa\x36\xa1\x0b\x01\x47\x58\xfc\xb0\x2c\x59\xa9\xf0\x19\x44\x03\x90\x1c\x6d\xb5\x5a\xe3\x31\xc9\xf3\xf1\x18\x06\x70\x11\x29\x77\x45\x50\xd9\x47\xcd\xf7\xb1\x34\x07\x44\x70\x99\xc6\xb3\xf9\x22\xa7\x63\x4e\x17\xa4\x94\xbe\x83\xce\x8b\x46\xad\xb1\xed\x6f\x12\x53\xb4\xdb\xfb\xbc\xf7\x8b\xa8\xd5\x6a\xdd\x81\x79\x56\x64\xf3\xe5\x1c\xe8\x5b\x51\x12\xe0\x0b\x92\x50\x39\xca\xcd\x28\x49\x69\xc9\x5b\x2f\x8f\x8e\xc7\xaf\x0e\x9e\xe1\x30\x33\x80\x7d\x59\xe2\xbb\x19\x15\x33\x5a\xca\xd1\xaf\x60\x72\xe0\x85\x45\x49\x39\x2d\xaf\x28\xe4\x94\x48\xb7\xe2\xbe\x28\x49\x96\x4b\xe6\xaf\x66\x99\xa0\x16\xa9\x72\xb3\xe4\x48\x76\x78\xfa\xed\xe1\xf8\xbb\xaf\x8f\xce\x0f\xcf\x5e\x1d\x3c\x3d\x84\x01\x3c\x27\x39\xa7\xad\xd6\xf8\xd9\xe1\xf3\x83\x6f\x5e\x9c\x8f\x9f\xbf\x38\x39\x38\x7f\xfe\xf2\x5c\x92\x7b\x19\xb9\xf4\x97\x47\x67\xd2\xc4\x7f\x7b\xf0\x42\xe6\xa8\x36\x64\x53\x38\x2f\x97\x34\x06\x5a\x48\x33\xb3\x99\xf3\xdf\x1d\x3d\x3b\x1c\x3f\xfd\xfa\xe0\xf4\x6c\xfc\xf2\xe4\x99\xac\xda\xf0\x3c\xe3\xd8\x20\xcd\xf8\x17\x59\x21\x75\xca\x59\xe0\x76\x24\x93\xa2\x18\x2e\xa2\x09\xbd\xcc\x0a\xc9\xf1\x59\xae\x92\x22\x4e\x17\xf2\x83\x16\x69\x34\x92\x0a\xf2\x8c\x08\x72\xca\x56\x15\x04\x3a\x35\xc4\x51\x2d\x7a\x07\x0e\xa4\x63\x9a\x53\xa9\xb8\xcb\x44\x8e\x1c\x92\x34\x49\xff\x82\x71\xe5\xfc\x4c\x68\xbf\x75\xa7\x75\x07\xb5\xb5\xdb\xed\x82\x24\x43\xf9\x37\x5d\xf3\xa7\x73\xe5\x9f\x12\x66\xc9\x56\x95\x12\x13\x9a\xb3\x95\xca\x84\xb0\x84\x94\x54\x13\xfc\x4a\x50\x5a\x94\x6c\xc5\x3d\xf8\x5e\xaf\x07\xed\x39\x2b\xa9\x29\xc5\x3b\x32\x6d\xab\xb2\xf2\x2f\x27\x5c\xac\xad\x30\x67\x2b\xbf\x49\xad\x3b\x70\x2e\x59\xf3\x1c\x15\x7b\x87\x23\xd4\x5d\xa0\x39\x95\x2e\x32\x87\x84\x14\xd2\x5f\x53\xac\xe9\x02\xcd\x50\x53\xa5\x44\x63\xa9\x25\xd2\x2b\xd3\xb0\x46\xda\x4b\x4e\xd3\x58\x83\xb3\x12\x08\xa0\xdc\x51\x5e\x41\xb2\x19\xd2\xfb\x70\x91\xb0\x7c\x8c\x1a\xc3\x47\xb1\xfa\x45\xf2\xec\xb2\x40\x0a\x46\xd0\x7d\x02\xca\xf2\xf4\x1a\xc8\xbd\x5b\xb2\xd5\x27\xa5\xd6\xe8\xd9\x66\x82\x69\x9e\x8f\xaf\x48\xbe\xa4\x96\xe2\xad\xe9\x5f\x90\x54\x76\x69\x68\x93\x42\xda\x68\x7a\x49\xcb\x8e\xa4\x46\x12\x47\xe6\x6c\x59\x08\xe9\xee\x62\x3f\xd7\xd6\x83\x94\x6c\x59\xa4\x28\x51\x50\x95\x2a\x4c\x72\xae\x31\x56\xda\x36\x9e\x65\xa9\xd5\xe0\x4a\xc3\xa5\x6b\x9f\xf1\x45\x4e\xae\xd1\xd5\x56\x3d\xc1\xb2\x6c\x59\x58\xbf\x9e\xe4\xf9\x75\xd0\xe2\x3c\xe3\x48\x8c\x05\xd6\xe6\x69\x42\x0d\x46\xe9\xc1\x2b\xbe\x2a\xb4\x33\xc2\xa5\xbf\xb2\x9c\x5b\x83\x27\x49\xf5\x44\x16\xf6\x5f\xb4\xd0\x91\x97\x1d\xc5\x98\x74\x61\x47\x8e\xc8\x76\x44\x9d\x65\x13\xbd\xbe\x56\xcf\x12\x2b\xdd\x35\x1a\x4b\xf9\x89\xb6\x2b\xfb\x89\xba\xf3\xf8\x49\x5a\x6c\x7e\x52\x95\xff\x3a\x6f\x14\xb7\xa4\xd5\xc1\xc1\x70\x91\x2d\xe4\xf0\x71\x29\xd9\x37\x46\xf8\x84\xe5\xac\xe0\x6d\x54\x10\x39\x11\xcc\x51\x71\xf4\x58\x19\x45\xd1\xa9\x1a\x2a\x09\xe8\x52\x92\xff\x04\x66\xac\xcc\x7e\xc7\x0a\x41\x72\xec\xa0\x28\x7a\x37\x30\x2a\x9c\x52\x67\x92\x99\x1a\x44\x8b\x34\x4b\x88\xa0\x5a\x16\x3b\x1c\xac\x42\x42\x5b\xba\x2a\x05\xbc\x96\xa4\xbd\x06\xb6\x14\x8b\xa5\x00\x35\xae\x75\x7a\xd2\x13\xc7\x51\x13\x06\x96\x36\x85\x71\xaa\x50\xc8\xa2\x17\x11\xce\xf7\xa4\x8d\x4d\x69\x92\xcd\x49\x1e\x8d\x6a\x63\x7d\x3b\xea\x46\x70\x17\xda\x2b\xe8\xc2\x5e\xa7\x03\xf7\x20\xea\x2b\xdc\x34\xb7\xc8\x06\x03\x88\x12\x5a\x08\x5a\x46\x35\x04\x51\x3f\x82\x7b\x01\x9a\xfd\x4d\x68\x72\x3a\x15\xdb\x20\xd9\xeb\x74\x74\x71\xe3\xdc\xf9\xe0\x08\xb7\x0a\xa4\x27\xf9\x1d\x88\xce\xf0\x85\xa3\xf8\x90\x02\xde\x20\xbf\xad\x44\x26\x58\x5d\x56\x88\xe9\x96\xf2\xd2\xca\xc2\xa5\x57\xb3\x41\xe9\x62\x58\x75\x64\x59\x90\xdf\x24\xd6\xdf\x65\x8b\xb6\x6d\x84\x53\x47\xde\x19\xb5\x7c\xb6\xbc\x97\x5c\x8c\xde\x47\xbd\xdf\xb0\xac\x68\x9b\xca\x3a\x2a\xd1\x70\x6b\x4e\xd3\x8c\xac\xb2\x37\xd9\xb8\x64\x2b\x55\xaf\xf4\xa9\x79\x5b\xbb\x4f\xac\x8c\xc1\x33\x9c\x5e\x6d\x75\x46\xba\xe6\x0f\xe0\x9d\xd7\x83\x51\xc8\x10\xf9\xbd\x50\xe9\x62\x1f\x76\xb0\xcc\x40\xff\x7e\x0f\x3b\x1e\x8c\xd1\x31\x0b\xa4\x13\x42\x28\xa3\xcc\x6b\x71\x7d\xc0\x7f\xef\xc0\x8c\x94\x69\x57\xce\x3d\x52\x6b\xcd\xc7\xca\x48\x8f\xb5\x46\xca\x86\xe3\x0a\x0e\xae\x86\x60\x83\x41\xb0\x4b\xf4\xf3\x34\x92\x92\xa0\x8d\x16\x33\x52\x58\x2c\x92\x4f\x73\x2a\x5d\x2c\xec\xcb\x40\xa6\x53\x9a\x08\x0e\xac\xc8\xaf\xd1\xca\x22\x26\x44\xa0\x98\xe8\xb1\x59\x8a\xde\xb5\x05\xa4\xc4\x2c\x17\x7b\x97\x54\x48\xe9\x47\x91\x94\x59\x22\xe5\x06\x11\x2a\x42\x12\x03\xb1\x8a\x50\x11\x8e\x96\x88\x32\x6a\xf8\x6f\xc2\x72\x4e\x17\x72\x06\x60\x44\x0a\x77\x61\xdf\x57\x15\x27\x6c\x59\x11\x82\x2b\xa5\xa9\xd1\xdb\xe9\xf4\x4a\x39\x2e\x2e\xda\xd6\x5a\xca\x19\x49\x96\xd3\xaa\xfe\x6c\xab\x34\x1e\x9c\x9c\xfd\xde\x1b\xc8\x56\xd6\xd5\xc9\x6a\xd1\xe3\x9e\x34\x61\x46\x7f\xa2\x27\xf8\xd3\xaa\x4a\x34\xe8\xf9\x16\x4e\x01\x7c\xf0\x78\x0f\x03\x68\xaf\xe1\xf0\x95\xe9\x64\x57\x4d\x9d\xcc\x91\xa9\x6d\x51\x73\x37\xd3\x20\x61\x27\x9b\x89\x79\x3e\x46\x4f\x77\x8c\x23\xee\x58\x2f\x38\xea\x71\xc8\x19\xa7\x71\x76\x59\xb0\x92\x7a\x5c\xd2\x29\x9a\x59\x77\xd4\x1a\x9d\x1e\xb6\x95\xcb\xba\xca\x70\x75\x0e\x3d\xe3\x92\x72\x6e\x47\x77\xe5\x30\x13\x03\x27\xfd\x4a\x9f\xee\x61\xa1\x49\xbe\x88\x1e\x23\xc2\x27\x92\x73\x8f\xc5\x84\xa5\xd7\x4f\x94\x0f\xee\x88\x6f\x10\xae\x20\x97\x3f\xac\x69\x00\x2e\xae\x73\x3a\x88\xa4\x82\x75\x11\x41\x5f\x2d\xc9\x7e\x11\x35\x9b\x89\xa6\x02\x2a\x37\x2c\xe1\x99\x8c\x9b\xeb\xf8\xb0\x4d\xc7\x7d\xfc\x6e\xf7\xc3\xbb\xbd\x0f\x4f\xde\xed\x7f\x78\x7c\xff\xdd\xee\x87\x27\x51\x4f\x19\x7b\xc7\xa9\x26\xa5\x8b\x21\xe9\x58\x24\xb7\xef\xd8\x25\x5b\x49\xe1\xc8\x19\xe0\x63\x51\x3e\x41\x3d\x8c\xd6\x75\x5c\xdb\x6f\x25\xd4\xe3\xfb\x12\xde\xf8\x08\x9a\x46\x1c\x91\xc5\x2c\xea\x4b\x3d\xcb\xa4\x9f\xee\xeb\x4e\x0c\x49\x49\xe5\x88\x47\xa0\xa0\xab\x40\x05\xdd\x80\xec\x08\x5a\xa7\x5d\xb2\x84\xfc\xaa\x41\x63\xa4\xc5\x24\xfa\xda\xe7\xa9\xaa\x86\xb5\x43\x16\xcb\x8a\xef\xaf\x90\xb1\x26\x7a\x10\x45\x1f\xa1\x9b\x8f\xd7\xeb\xcd\x93\x66\xe5\x6c\x2a\x61\x94\xf3\xc9\x1a\xed\xdc\xa2\x96\xad\xd4\x53\x69\x27\xbc\xdb\xff\x00\xdb\x2a\xa6\x16\xbc\x1a\x77\xd4\x8f\x8f\x52\x55\x6d\x74\xd6\xaa\x27\x1a\x4c\x67\x31\x73\x22\xe8\x5b\xe5\xc5\x59\xbb\xb9\xcc\x49\xd9\xe8\xc7\xc5\x30\x61\xec\x8d\x20\x13\x3e\xc0\xf5\x93\x26\xb9\x5a\x71\xe6\xc1\xf0\x51\x86\xa3\x47\x52\x19\x3c\x4a\x3d\x76\xe8\xda\xc7\xca\xdb\xe3\xe3\xe9\x5c\xe0\xba\x8b\x56\xf1\x3a\x0b\xf3\x48\xbb\x6c\x92\x45\x96\xd0\x50\xad\x5d\x1f\xb1\x8c\x75\x32\x43\xb9\x0d\x87\xd8\xf8\x77\xba\xfa\x0f\xef\x64\x17\x6f\xa2\xe5\x1e\x44\x1f\x3c\x3d\xd5\x85\x05\x5b\x94\xcb\x9c\x46\xb2\x8f\x1b\x0e\xa1\x0b\x2d\x33\xf5\x9a\x8d\x2d\xa3\xe4\x24\xad\xfe\x8b\x83\xf3\xc3\x5f\x8d\x0f\xcf\x9e\x1e\xbc\x3a\x1c\x9f\x7e\xf3\xe2\xf0\xcc\x76\x8c\x32\xfa\x79\xd4\x87\x32\x1a\xfe\x5c\x97\x2c\xa3\x9f\xa9\x84\x9f\xd9\x84\x9f\xaa\x84\x9f\xda\x84\x3b\x2a\xe1\x8e\x4d\x18\xab\x84\xb1\x4d\xf8\x07\x95\xf0\x0f\xef\x3e\xd8\xa4\x77\x2a\xe9\x9d\x4d\xf8\xa0\x12\x1c\xc4\xff\xa9\x12\x64\xdf\x20\x3c\xc9\x32\x91\xe5\x29\xb5\x18\xa2\xe1\xd0\xe5\x4f\x48\xf2\x86\xe7\x84\xcf\xbc\x0a\x1e\xab\x6c\x5a\xf0\x65\x49\xe7\x44\xcc\xde\x3d\x76\x99\x4f\x6a\x99\x4f\x64\xe6\x87\x50\x3d\x4b\xb6\xba\xd9\xcd\x89\x81\xf2\x44\x8a\x81\x0f\xea\x8c\xd5\x9a\x2a\x71\x52\x9e\x90\x05\x1d\x27\x33\xa9\xe4\xf5\x55\x58\x83\x04\x35\x2c\xc1\x81\x43\xcd\x88\xb0\x58\x3a\xb6\xde\xcd\x85\xd1\xca\x39\x59\xb4\x3d\xa4\xca\x34\x76\x94\x5a\xca\xaf\xa8\x99\xde\x92\x88\x19\x52\x94\x6e\xeb\x15\x95\x76\x24\x7b\xc4\xcf\xe5\x3f\xc3\xe1\x70\x18\x05\x0a\x3c\x9e\x2c\xb3\x3c\x1d\xeb\xf5\x56\xc9\x8d\x90\x9a\x58\xa3\xb3\xae\x44\xc9\xc5\x58\x93\x34\xcd\xe4\x0f\xa5\xc3\x6d\x39\xe7\x37\x26\x87\xd7\x79\x42\xe7\x0b\x71\x2d\x6d\x86\xc7\x96\x6c\xea\x2f\x4c\x5f\x91\x3c\x86\xb6\x5b\x1c\x8f\x83\x35\xf1\x4e\x07\x1d\xfa\x82\x09\x69\x28\x7b\x7a\x1c\xec\x07\xdd\xc5\xf4\xc9\x5e\x2f\xb2\xe9\xe1\x6c\xd3\x83\xba\x32\x3b\x00\x05\x5d\x69\x1f\x4e\xb2\x3e\xcf\xb8\x68\x9b\x56\xd8\x7c\x5c\xeb\x1b\xc0\xc5\xc8\x0c\xb7\x1a\xc2\x61\xf6\xb0\x48\x17\x78\x10\xb6\xdb\xe5\x28\x9c\x52\x7e\x25\xc3\x89\xa0\x44\x1d\xa2\x29\x71\xb1\x15\x09\x29\xd9\xaa\xe3\xb3\x4b\x67\x87\x0d\xd2\x89\x0d\xd5\xaa\xd4\x4e\x15\x3b\xef\x91\xc5\x82\x16\x69\x5b\xff\x0e\x14\xc2\xc0\xc4\x7e\x93\x5a\xad\x96\xf6\x7a\xf5\x1a\xbd\xb5\x26\x7a\xa5\x3e\xea\xfb\xcb\x83\xce\x18\xda\x45\xa4\xc1\x8b\xac\xa0\x4a\x13\xbb\xf2\x1f\x80\x48\x8d\x52\x01\xa8\xb7\xb4\xb4\x6d\x01\xbb\xe0\x34\xc0\x45\xb7\x3a\xba\x9b\x11\xd9\x95\xa8\x41\xd0\x63\xea\x80\x7a\x75\xea\x26\x30\x3d\xa9\x1c\xec\xba\xa4\xea\x8a\xd5\xe0\xc2\x5f\x5f\xf3\x57\xc8\x46\xaa\x90\x46\x17\x2d\x72\x92\x15\x37\x73\x77\x4d\xdb\x35\x2b\x9b\x72\x6f\xe6\x5b\x98\xfe\xb7\x60\x92\xa3\xc0\xb0\xe3\xb2\xcc\xd2\x6d\x75\xed\x9e\x15\xf9\x3d\xf5\xcf\x8d\xca\x86\x70\x83\x4d\x25\x1c\xd7\x6e\x51\xc7\x16\xb0\x0d\xdc\x7d\x2f\x81\xf4\x3f\x9b\xd8\xbb\x06\xce\xf0\x77\xef\x56\xfc\x9d\x92\x22\xb9\x1e\xdf\x86\xcb\xff\xdf\x1f\xff\xf2\xfb\x3f\xfe\xe5\xf7\xff\x8f\x24\x00\xbf\xff\xd7\xff\xed\xbe\xfe\xc9\x7e\xfd\xcb\xef\xff\x78\x33\xff\x11\xf2\xcf\xff\xd9\x88\xea\xdf\xdc\xd7\x7f\xb9\x59\x2e\x12\xf0\x0f\x7f\xfe\x47\x53\xe6\x0f\x7f\xf9\xbf\xfe\x5f\xfb\xfd\xbf\xfe\xc3\x7d\xfd\xd3\x26\x81\x61\x6d\xff\xfd\xcf\x8d\xe4\xfc\xab\xd7\xb2\x7f\xbf\x41\x92\x8a\x82\xdf\xff\x93\xa3\xa6\xf2\x7d\x93\x78\x6f\x53\xf8\xfb\xc9\xfc\x32\x13\xb3\xe5\x64\x5b\x79\xbf\xb7\x5a\x5c\xd7\xb9\x66\xa9\xde\x5c\xe2\x13\xd8\xa2\xbf\x42\x6f\xf1\x4d\x76\xd5\x4a\x67\x8b\x2d\x86\xc0\xe6\x65\xed\xf5\xec\xdb\x0e\xfe\x7f\x3c\xf3\x58\x79\x29\x26\xf9\xc7\x8e\x71\x55\x5d\xbb\xf7\x3f\x5a\xd7\xea\xbd\xf4\x37\x59\x49\x7e\xa4\x7e\xc0\x7b\xd5\x46\xf3\xef\x5f\x8d\x25\x8b\x92\x72\xc1\x3e\x8d\xe2\x84\x7a\xf3\x83\xa8\x8d\x6d\xfa\x8d\xde\x52\x0d\xea\x7b\xf2\x87\xff\x76\x8b\x6e\xf5\x7d\x9d\xa5\x4f\xd1\xd5\xfe\xe7\x38\x46\x25\x17\xb7\x99\xe3\x0c\x6e\x3b\xc7\xd9\x58\xe0\x36\x73\x9c\x35\x88\x7e\x1c\xee\xbb\xdd\xa9\xdc\x92\x97\xc1\x3c\x77\xe7\xdd\x7b\x48\x72\xc2\xf9\x20\x92\x28\x70\x3e\x1a\x35\x2d\xfe\xe7\x74\x1a\xee\x2f\x60\xdd\xd5\xb5\xb5\xda\x5a\x5b\xf1\xfe\x1e\x3c\xfe\x49\xb7\x0b\x09\xc1\xcd\x62\xe8\x76\x9f\x0c\x8b\xf7\x5d\x0f\xf0\xe6\x4e\x81\x6a\x6c\xff\xbf\xd1\x4f\xbd\x09\xde\xc9\xf6\xfd\x87\x75\x90\x4e\xb4\xfa\x64\x63\x7b\xed\x8e\x70\x0c\xd1\x4f\x9a\x84\xbd\x4d\xc1\xc6\x4e\x74\x4b\xf1\xb3\xac\x90\xff\xff\xb8\xc6\x31\xd7\xf8\xfa\xa6\x84\x19\xd7\xcc\x7e\xc3\xce\xce\xce\x66\xfe\xad\x43\xf1\xd1\x06\xe8\x9a\x2d\x45\x49\x92\x37\x3f\x2e\xde\x79\x3e\x00\x9a\x08\xf0\x3f\x37\x1a\x67\x0d\xa6\x3f\x3e\x9e\x3f\x33\x31\xdf\x62\xb0\xbb\x69\x1b\x77\x3d\xdf\x7c\x7b\x71\x3b\xab\xfc\xf8\xbe\xda\x11\x1b\x16\x8f\xef\xbb\x6d\xb4\x2d\x7b\x72\xc3\xce\x6d\x8c\x3b\x7c\x9b\xb4\x70\x4d\xa1\xf4\x63\x16\xa9\x2a\x4e\x3b\xae\x9e\x6f\xc1\xef\x75\x9b\x40\x37\x19\x52\xbb\xb9\xb1\x9d\x35\xdd\x2c\x01\x8d\x6c\x58\x0c\x87\xb4\x48\xed\x56\xcc\xcd\x62\x70\x9b\x04\x75\x6e\x37\xe5\x7d\x3f\xd5\xd5\x88\xc8\xea\x7f\x79\x7e\x5a\x0d\x75\xbc\x73\x5b\x2b\xef\x3e\x6c\xd2\xe9\x1b\x4b\x7c\x0c\xef\xcd\xce\xda\xcd\x02\xa8\xd0\xd3\x20\x08\xb7\x91\x79\x5e\x2e\xe9\x8d\x1e\xc3\x70\x38\xcf\x52\xdc\xe2\xfb\x44\xa2\x99\x30\x21\xd8\x5c\x62\xfc\xb1\xea\xbb\xe0\x57\x3f\xd2\x51\x4c\x72\x66\x28\xb6\x72\x89\xeb\x60\xdf\xcf\x27\xd2\x47\xaf\x7e\xa4\x0c\x79\x3f\xee\xe1\x08\xfd\x7e\xdc\x5b\x3b\xe1\x5a\x73\x7a\xec\x23\xb4\xe4\x43\xab\xd5\xaa\xde\x0a\x31\x5b\x62\x9c\x95\x82\xa6\xed\x70\x3b\xaa\xf7\x86\x5e\xf3\x76\xa7\xd3\x69\xb5\xee\xc0\xb9\x3d\x14\x6d\x8a\x4e\x99\x39\xd7\x37\x5f\xe6\x22\xc3\x53\xa1\x09\xcd\x73\x6e\x0f\x5e\x4d\x59\xae\x2e\x45\x0a\x86\x17\x21\xe9\x6f\x97\xb4\x10\xad\x3b\x1a\x11\x6e\x9a\x21\xe2\x37\xf4\xda\x9c\x19\x67\x65\x76\x99\x15\x24\xd7\xd5\x00\x5f\xd0\x24\x9b\x66\x34\x05\x22\x10\xe0\xe0\xd5\x91\x2a\xa4\x8e\x21\x66\x5c\xe2\x9b\x19\xb2\x40\xcc\x88\xb0\x04\x2c\xf5\x75\x88\x92\xe2\x15\x94\x42\x34\x55\xd1\x6b\x59\xfa\xeb\x1b\x71\x66\xa7\x48\x7f\xd1\xea\x65\xb7\xe7\xcc\x37\x9d\xae\x97\xf8\xd5\xa7\x4e\x0b\x16\xff\xfd\x5f\x66\x3d\x41\xad\x72\xaa\x4f\x9d\x66\x17\xef\xcc\xb7\x70\xb9\x4a\x7d\x56\xd7\x6b\xcc\xb7\x70\x9d\x42\x7d\x06\xf3\x6d\xfc\x40\x7d\xb8\x03\xe7\x27\xcf\x4e\xfa\x70\x90\xa6\x9e\x10\xf5\x4d\x18\x14\x30\xde\xf6\xa5\x73\x75\x25\x39\x54\x80\xbe\xbd\xa3\xd1\x05\x3b\xc3\xe9\xc3\x29\x5d\xe4\x24\xa1\x30\x2c\xd4\x19\xe1\xc7\x93\xf2\x89\x0f\xa9\x67\x2b\x7d\x38\xff\xf2\x99\x97\x6e\x3c\xf1\x6a\xba\xf4\xba\x6e\x44\x8a\x46\xf4\x6e\x1f\xbe\xe1\x14\xa2\x39\x79\x43\xa5\x1e\x46\xb0\x20\xc9\x1b\x72\x49\xfb\x70\x64\xce\xef\xc7\x52\x15\x10\xd3\xaf\x86\xc5\xaf\x11\x97\x77\xd3\x64\x88\xe7\xad\xde\xfd\x6a\x38\xfc\xf5\x07\xdc\x18\xd7\x77\x92\xd4\x29\xaf\x5a\x49\x18\x9a\xaa\x54\x11\x8f\x20\xc1\xaf\xaa\x0d\xd1\xfd\xb9\xb1\x2d\xf7\x9f\x40\x7b\xbe\xe4\x42\xea\xec\x8a\xe6\x79\x57\xb2\x98\xa6\xf0\xab\x97\x2f\x3a\xad\xd6\xd8\xe9\x67\xc2\x52\x3c\xcb\x50\xd2\x5e\xc2\xe6\x8b\x2c\xa7\xed\x32\x1a\x96\xef\x87\xc5\xfb\x61\x39\x2c\xa2\x4e\x0d\x78\x8c\x97\xde\xc2\x22\x93\x4a\x91\xac\xb8\xca\x78\x26\x7b\x7e\x03\x7e\xd4\x9c\x32\x1a\xbe\xdd\x9b\x0c\x2f\x86\xe9\xbd\x8b\x2f\x86\xe9\xe8\xee\xfc\xbd\x49\xb8\x3b\xfc\xc2\xfc\x33\x8f\x5a\x1d\x80\x3b\x70\x70\x7c\x76\x84\x47\xc2\x4b\x40\x84\xb5\x1a\x9a\x88\xc2\x7a\x26\xaa\x9e\xe1\xc5\x70\x98\xde\x1b\x0e\x2f\xbe\x18\x7a\x95\x61\xea\xdd\x2f\xec\x3f\x6b\xab\x53\x87\x2a\xd6\xdc\x76\x73\x47\x7a\xdd\x29\xf7\xa7\xac\x50\x77\xa9\x80\xe8\x62\xfe\xb8\xa1\xc4\xa4\x4f\x15\x81\xc5\x07\x93\x6b\xbc\xd7\xa0\xb1\xf5\xd4\xc1\x87\x27\x4f\x9e\x48\xe9\xc3\x60\x6d\xfd\xd1\x70\x28\xa2\x0e\x7c\x01\x43\x6b\xb8\x8d\x59\x6e\x5f\x5c\x44\x53\xc6\xa2\x18\xf6\x46\x31\x5c\x44\x7c\x41\xe6\x51\x0c\xfb\x0f\x46\xa3\x58\x75\xbe\xe9\x5c\x0c\x04\xbf\xea\xc0\x60\x00\x3b\x53\xc6\x60\x38\x14\xb0\x37\x1c\x16\x12\x74\x38\x14\xfb\x0f\x76\x10\xab\xf4\x92\x5a\xa6\x79\x4a\x84\xea\x24\x42\xe3\x78\x18\x8e\x58\xdb\xff\x6a\x1e\xec\xbd\x03\xf2\x37\x8e\xf8\xeb\x60\x6f\x39\xec\x9b\x73\x34\x19\x4f\x58\x71\x45\x4b\x21\x75\xad\x2d\xbf\xc7\xfa\xb6\x92\x16\xb6\xbd\x98\x09\x78\xfe\xbb\xb8\x6a\xeb\x6c\x9b\x68\xf8\x54\xea\x93\xe9\xfa\x26\x66\xfb\x5b\x39\xdc\xe0\x4d\xcc\x18\xce\xaf\x17\xea\x6b\xfd\x38\x92\xbe\xa7\x68\xc8\x29\x96\xf3\x09\x2d\xdb\x01\x0d\x46\x22\x52\x55\x1c\x48\xb4\xb7\xff\xa0\xf7\xf0\x33\x7d\x90\xc8\x56\x5f\x07\xba\x01\x02\x75\x46\x81\x28\x5a\x9a\xb1\xd0\x87\x9f\xfd\xe2\x97\x9f\xdf\x04\x98\x15\xd3\x6a\x75\x86\xfa\x6c\x8a\xe7\x86\x2a\x2c\xc7\x0b\xb9\x15\x9e\xd7\xb8\x03\xe6\xbe\x8b\x77\x50\x49\x95\xb8\xf9\xac\x92\x53\xda\x39\x11\xb3\x9e\xc4\x30\x55\xb5\x1a\x26\x77\x80\x95\x26\xb3\x20\x45\x25\x53\xe9\x4b\x8d\x30\x7d\xa5\x2d\x67\x2b\x5a\xb6\x3b\xea\x5a\x90\x6c\x7c\x0c\x51\x57\x7f\x16\xa4\x88\x82\x33\x9b\xaa\x8f\x19\x49\x67\x85\xb0\x8d\xc8\x0a\x21\x49\x1e\x64\x85\x68\x96\xb9\x04\xde\x20\x4b\x93\xed\xf4\xc1\x31\xae\xd2\x9f\x1d\x3f\xf0\x9e\xb5\x6e\xa6\xf4\xa6\x34\x11\x36\x9f\x95\xd0\x6e\x60\x78\xc0\x63\x09\xd4\x04\x63\x65\xd2\x71\x1d\x45\x4a\xa3\x22\x7d\x5d\xa5\x95\x7f\xb5\x73\x4e\x18\xcb\x37\xf6\x05\x04\xc0\x19\x5e\x23\x5f\x30\x3b\x42\x5e\xac\xe1\x1c\x42\xec\xdd\xc0\xb3\x2a\xa7\xbc\x2b\xe9\x92\x49\xb6\x85\x8d\xea\xe9\xb1\x2b\x64\x0c\x32\x44\x5f\x2a\xcf\x0a\x68\x47\x92\x36\xa9\x38\x3e\xbd\xee\x72\x88\xa3\x21\x86\x19\xe1\x6e\x88\x1c\xa8\xbb\xca\xc5\x72\xbe\x20\x25\x57\x3f\x1d\xb7\xa4\xe7\x9b\x53\xc2\x05\x5c\xd2\x82\x96\x59\x82\xad\x81\xb6\xbb\x65\x8f\xea\x17\x83\xeb\x89\xb1\x89\x2d\xd0\xf1\xc6\xa8\xb1\x2b\x80\xae\x77\x78\x49\x3f\x64\x2b\x66\xe2\xc0\xe4\x60\xa3\x46\x01\xa8\xac\x3d\x0f\x6e\x6f\x2d\xd8\x8e\x1c\xd4\x2f\x1e\xec\xcd\x1f\xee\xe3\xb7\xdd\xf9\x8e\x2b\xf6\x70\xff\x13\x94\xb3\xb2\x37\x06\x2b\xe0\x73\xc5\x9c\x6c\x56\xfb\x75\x1d\xc3\xef\x3c\x55\xd3\x62\x03\x0c\x8c\xf1\x60\xa5\xab\xd9\x8e\x39\x86\x2e\xa3\x35\x1c\xc7\xd7\x9a\x71\x72\xe1\x14\x9c\xe9\x34\x21\x1e\x0c\x25\x51\xc6\x99\xbe\xce\xdf\xc1\x7b\x0a\x29\x11\x54\x64\x73\xda\x33\x5f\x62\x4c\xd2\x31\x75\xb2\x39\xad\xd5\x62\x5b\xeb\x6a\x69\xec\xb3\x7e\x19\xdb\x73\x82\x32\xce\x16\xea\x03\xa6\x5a\x97\xeb\x21\x14\x74\x54\x87\x7a\xc1\xd8\x0b\xff\x70\x4b\x24\xe1\x98\xbb\xb9\xac\x0b\x20\xb1\x6e\x40\x0a\x44\xdc\xc0\x00\x97\xab\xd1\x34\xd4\xe2\xb1\x56\x77\x7f\x32\x15\xb4\x5c\x30\x8f\x51\xb6\x87\x9f\x5d\xcf\x27\x2c\xe7\x80\x20\x40\x40\x9f\xba\x07\x84\x8e\xa1\xbb\x67\xee\x28\x6b\xad\xc9\x49\xf2\x46\xcd\x9d\x03\x48\xbf\xaf\x7b\xb5\x85\xc3\xca\xfe\x1a\x98\xdd\xdd\x3d\x0d\xd1\xdd\x6b\x06\xa1\x97\x97\xfc\x06\x10\xe5\x65\xd8\x9a\xaa\xde\xc3\x1a\xef\xc8\xe5\xd6\x98\x53\xe1\xaa\xae\xb7\xce\x75\xf9\xb7\x60\x5c\x85\xf6\x90\xc3\x7a\x39\xcd\x8a\xb4\x1d\xf5\xa2\xce\x7a\x18\x3d\xf4\x1b\x58\x2a\x6d\xd8\x14\x41\x1e\xc3\xae\xba\x1c\xb0\x60\x3c\x28\xaf\xf3\x9f\x0c\x60\x37\xac\xdc\x23\x32\xa7\x85\xd5\xc4\x2e\x82\x77\x61\x2f\x00\xae\xd3\x1e\xb4\x51\x05\x84\x51\x32\x5d\xaf\x61\x06\x4e\xce\x60\x14\x57\xed\xad\x5f\x92\xe6\x74\x2a\xda\x78\xfe\x3e\x06\xef\x6e\xef\xf3\x7c\xc9\x67\xea\xda\x8c\xaf\x2c\xa6\xc0\x2f\x62\xd8\x19\x2e\x77\x1f\x3e\x9c\xca\x7f\x1f\x3c\xc2\xef\xbf\xc0\xef\xbb\x3b\x6a\x02\x02\xb0\x16\x60\xcd\x2c\x44\xdf\x0f\x79\xb7\xdb\x7f\xf2\xb3\x94\x7f\x88\xe0\x67\xe0\x6e\x65\x9b\x3e\x39\x17\xe6\x2e\x0e\xef\x78\xcd\x40\x4a\xd7\xb6\x43\xd2\x5c\x69\x86\x2a\xb0\x45\x3b\xd6\x65\x03\xdc\xdc\x8e\xc7\xb7\x6e\xc7\x84\x89\x59\x43\x33\x9e\xe2\x65\x1b\x1b\x5c\x21\x68\x09\x16\xd9\x46\x20\x6b\x5b\x72\x73\x43\xfe\xe1\xd6\x0d\x91\xc3\x52\x5b\x5d\xc3\x1c\x57\xda\x63\xdc\x6a\x03\x5d\x1b\x01\x4d\xbb\x4f\xe9\x9c\x5d\x51\x70\xa3\x72\x75\x36\xdf\xb3\x06\xc3\x37\xce\xc1\xe0\x5c\xeb\x0d\x25\xed\xf1\xe5\xa4\x5d\x5d\x76\x50\xab\xf4\xdc\xbb\x31\x2f\x3b\x0d\x51\x71\x81\x90\xed\x5b\x22\x52\xeb\x17\x16\x9d\x6e\xa3\x01\x41\x56\xb4\x3d\xc9\x7e\xab\x9b\xa6\xc2\xc8\x60\x04\x04\x8c\x03\x46\x8d\xbf\xd8\xab\xb5\x1a\x48\x89\x0b\x6f\xec\x8a\xa6\xbe\x2e\x84\x75\x58\x57\x68\x46\xf3\x9c\x59\x6f\x28\xae\xc2\x45\x2b\x56\xe6\xa9\xb6\x7e\xed\xcf\x62\xf8\xac\x13\x6a\xc1\xfa\xb0\x44\x26\x2c\x8e\x96\x41\x43\x2c\x1c\x1c\x60\x2b\x51\x73\x9c\x44\x72\x5a\x8c\xa7\x85\x8b\xa2\xd3\x5b\x25\xdc\x29\x58\x68\xcb\x2c\x6c\x4e\x8b\x1b\x85\x5e\xf5\xc8\x6e\x1a\xa9\x15\xf2\x76\x83\x26\x6e\x88\xa0\x60\x0a\xd9\x6a\x11\xdc\xce\x67\xdc\x62\x9b\x15\xf7\xad\xf4\x14\x7d\x2b\xa9\x63\x94\x94\xc9\xac\x5d\x5d\xbb\x93\xca\x75\x0b\x65\xbd\x01\x9b\x51\x5a\xaf\x05\x0e\x42\xe9\x89\xfb\xcd\x63\x70\xe9\xe3\x69\x31\xc8\x69\xb1\x59\xa1\x99\xa0\x18\xe6\x30\xbf\xf6\xf7\x03\x58\x21\x93\x7b\x95\x09\xd8\x9c\xbc\xc5\x5b\x58\x41\x15\x31\xf6\xb6\x45\x9e\x89\x76\x74\x31\x2c\x87\xc5\x28\x8a\xc1\xa3\xa8\xe3\xe8\x4e\x66\x8c\x71\x57\xb2\x1d\xf8\xf5\x26\xcc\x93\xcc\xa6\x52\x91\x79\x0c\xbe\xa8\x1a\x82\x5b\x98\x58\x38\x20\x18\x24\x24\x4f\x70\x31\x0e\x8c\x45\xc2\x3b\x61\x4a\x79\x3d\xf7\x25\xa8\xd3\xd3\x61\xbf\x49\xd2\xf7\x0f\x7a\xa2\xf3\x34\xab\x34\xf6\xb7\xe8\x84\x18\xb6\xe4\x8a\x64\x39\x06\xcb\x5b\x57\xe3\x36\x1d\xad\x52\x24\xe8\x6f\x8e\x53\xae\x80\x0f\x4b\xe6\x93\x94\x00\xef\xd7\xd5\xa7\xaa\x34\x9d\x20\x98\x5d\x48\x82\x8f\xd1\x2f\xe3\xab\x89\x4d\x33\x4e\x73\x9e\x5d\x16\xfa\x6a\x9c\xd1\x81\x05\x49\xa7\xc6\xc3\xe2\xde\x9d\xdd\xca\xa4\xda\xf5\x4e\xef\xf2\xeb\xc0\xde\x77\xf5\x3d\x4f\x69\xd7\x1a\x62\x90\x85\x2e\x9a\xae\x10\x06\x70\xc1\xcd\xbd\x39\xdc\x30\xc1\xe8\x26\x3a\x77\x64\x8b\x20\x95\x52\x1b\xb4\x73\xe5\xf4\x20\x24\xa7\x16\x3d\xe6\xaf\x40\x8f\xf4\x2d\xd6\xd1\x63\x6f\xfc\xfa\x04\xad\xd1\x7c\xc0\xbb\x89\x08\xaf\x02\xb7\x78\x73\x81\x26\xab\xbb\x81\xbc\xba\x4b\xbc\x0e\x31\xdf\x84\x66\x4e\xde\x7a\xe5\xa4\xd1\x31\x3f\x3b\xad\x26\xc6\xc1\x3d\x68\xfb\x65\xba\xb2\x5a\xde\x81\xbb\x36\xbe\x08\x8f\x31\xc9\x5c\xef\xb6\x6a\x67\xf1\x6e\x23\x72\xf4\xd2\x0d\x9b\xfb\x8d\x05\xa4\x67\xd5\xd0\x69\xfe\x0a\xda\x80\x1d\x22\x70\xe1\x4c\x1b\x11\xaa\xa9\x2b\xaa\x35\x14\x03\x87\x3f\x5c\x37\xc4\x9f\xf3\xac\xc0\xbe\x6c\x96\xf3\x1b\xd6\xbb\x54\x6b\x2b\x46\x51\xdd\x5a\x57\x79\xbe\x61\x32\xe9\xce\x94\x5f\xa8\xea\x31\x3c\xd9\xc5\x82\xa4\x29\x4d\xc7\x3a\xc9\x06\x15\x0a\x1a\x22\x9b\xfb\x31\xf6\xa4\x55\x31\x62\x1f\x39\x26\x29\x77\x8c\xeb\xb8\x6b\x66\x5b\x5e\x8e\x91\x6e\x78\xd4\x44\x69\x97\x60\x4e\xde\x9a\x50\x90\x6a\x38\x7d\xdb\x36\xc5\x3b\xb1\xe5\x78\x47\xbb\x77\x6a\x9f\xb7\xa4\x53\x92\x08\xf4\x31\x31\xa8\x99\xeb\xec\x52\x2d\xb2\xe2\x32\xa7\x5d\x1c\xb7\xa5\x4b\xe7\x46\xf1\x39\xee\xaa\xc1\xa6\x01\x42\x6b\x66\xb5\x95\xf6\x7a\xf1\x06\x9b\x11\x48\x2b\x8c\xcf\x60\xfe\xbc\xa0\x19\x4a\x3e\xa6\xf1\xd2\x9b\x71\x8a\x3d\xe7\xca\x7f\x90\xa4\xf1\x76\x67\xd4\xa9\x21\x92\xa0\x73\xbf\x13\x04\x10\x9b\x0c\xd0\x9d\x35\xc1\x23\x95\x0c\x12\x56\x96\x3a\xa8\x6d\xd8\x11\xc7\x39\x2d\xb0\x4d\x52\x3e\x6d\x5c\x0c\xf0\x08\x6e\x72\x78\xa4\x9f\x53\xa7\x73\x14\xa0\x0d\x7c\x0a\x83\x5e\x51\xd2\x55\x71\xc1\x72\x85\x63\x15\x43\x6e\x8d\xd5\xd8\x5c\xc1\x57\x54\x75\x46\x95\x06\x1a\x87\x41\xad\xec\x07\x75\x40\xca\x8a\x1d\x01\x09\xc6\xf3\x73\x73\x35\xcb\x06\xfe\x45\x05\x97\xea\x63\x29\xa3\x5c\x96\x2b\xa8\x3a\x87\x41\x16\x8b\xfc\x1a\x48\xc1\x30\x56\x94\x63\xda\x47\xeb\xc3\x2a\x54\x84\x76\x45\x13\x70\x47\x88\xaf\x57\x08\x2f\x7c\x98\xed\xf9\x21\x8f\x3b\x0d\x8a\x62\x9d\x72\xbf\xe7\xa0\xb3\xa8\x6e\xf9\xff\x30\x9d\x63\x53\x07\xd8\x62\x20\xfd\x48\x3d\xb6\x66\x29\xa7\x35\x8b\xf4\xbf\xa9\x76\xd6\x34\x70\x0b\x6d\x0a\xf6\x11\x43\x94\x2e\x98\x4f\x49\xc7\x7a\x8f\x07\x77\x77\xf6\x62\xdc\xe2\xd8\x37\x3b\xd9\xd7\x0b\xca\x83\xc0\x3c\x6e\x9b\xa0\x0f\xde\xbe\xb9\x5b\xa3\xef\x83\x77\x58\x2c\x2b\x44\x1f\xf6\xdd\x6f\x5c\x09\xef\xc3\x03\xbf\xa0\x9b\x4f\xf7\xe1\xa1\x97\x61\xa7\xb4\x7d\xf8\x4c\x25\xab\x68\x30\x59\x71\x55\x27\xeb\xb3\xbe\x57\xc0\x21\x79\xd8\x0f\x2a\x70\x19\x0f\xfa\x7a\xef\xca\xa6\xec\xf7\x71\x4b\xcb\xfe\xde\xeb\x7b\x8d\x72\xc9\xbb\x7d\x8f\x05\x3e\x59\x92\x95\x66\xb7\x4c\x8d\x96\x48\x25\x46\x0c\xd1\x9c\xfd\xac\xa3\xb8\xeb\x12\xf7\x65\x62\x10\xc4\xc1\xb4\xee\xc2\xc3\x37\xb2\x53\x52\xe5\x45\x78\xdb\x7a\xfc\x53\xec\xeb\xa9\xd7\x04\x70\xb0\xd6\x81\x4c\x48\x89\xd3\x6a\xb3\xe7\x0a\x82\xf9\xeb\x43\x3e\x19\x17\xaa\x42\xf4\x95\x46\x95\x8d\x4e\xb7\x1a\xd8\x5c\x34\xda\x8b\x62\x88\xf6\x23\x5d\xce\x44\xe7\xde\xb2\x58\xef\x81\x29\xe8\xa2\x75\x6f\x5f\x34\x86\x68\xca\x96\xa5\x41\x11\x6e\x4b\x6d\xc2\x80\xa5\xf4\x22\xe9\x83\xa9\x5b\x0a\x7d\xb8\x8f\xff\x26\x3b\xb7\xc5\xa8\x22\xce\x46\x93\x72\xf9\xf6\xd6\xd4\xec\xc5\xb0\x1f\xe3\x02\xd9\x8d\x3c\xd4\x41\xc2\xcd\x46\x1d\x10\x0e\xa9\x58\x83\x36\x15\x76\x43\xaf\xbd\xf7\xe8\xd1\x5e\xbc\x1f\xef\x3d\xea\xc4\x90\x8a\x9e\x4a\xfb\x65\xfc\xe0\xb3\xce\x7a\x62\x83\x65\x3f\xd3\x59\x2f\xb4\xde\x56\x34\xd6\x29\xeb\xba\x31\xc6\x2e\x93\xa6\xcb\x84\xb6\x03\x9b\xa5\xfb\x53\xec\x29\x9d\x5d\xbf\xd1\x8b\xc9\x18\x9c\xe6\x8a\xe4\x6a\x2f\x1d\x55\x65\x3a\x17\xd2\x79\xe5\x72\x48\xbd\x22\xf9\x20\x8a\x9a\x7a\x91\xb7\xf6\xaf\x4e\x68\xe9\x48\xc2\x40\x12\xf5\xa8\x0b\x46\x22\x15\x6a\x4f\x58\x77\x8f\x6f\x74\x7c\x7d\x1d\x2a\x1b\x0f\xbc\xf6\x5d\xcf\x99\xa9\x00\x31\x17\x4a\x79\xf6\x50\x61\x1e\xe0\x77\x82\xff\xee\xeb\x75\x76\xb3\x06\xaf\xd6\xd5\x3f\xc7\xef\x0f\xf1\xdf\x5d\x0d\x31\x0a\x8f\x76\x4d\x72\x89\x56\xe3\x55\x30\xbf\xdc\x89\x61\x7f\x14\xaf\xaf\xec\xf3\x9d\x18\x1e\x8e\x42\x44\x97\x8c\xa5\xe3\x92\xf2\x65\x2e\x60\x00\x3b\x43\x5d\x54\x97\xd5\x85\x35\xa9\x66\xf7\x42\xfe\x0d\x35\xb9\x9a\x5e\x4d\xb0\xa6\x58\x13\x35\x2c\x74\x04\x6d\x30\xc1\xb4\x87\xc3\xc2\x66\x22\xc9\xfe\x18\x08\xfb\x36\xbb\x91\x80\xcf\x3d\xd0\x87\x3b\xcd\x27\xdd\xc4\x24\xb7\x81\x8d\x06\x92\xf9\xb8\x81\xe1\x35\xb2\xae\xb2\xc1\x6a\x52\x36\x95\x22\x5f\xbb\x65\xee\x54\xa8\xe5\x81\xa3\x49\xcd\x0a\xb8\xc0\x9d\x54\xd7\x3d\xea\xf1\x7e\xa3\x77\xbb\x1f\x6c\x44\xb8\x2b\x92\x77\xdc\xf4\xdd\xe2\xe1\xe1\x08\xe9\xda\xe8\x9f\x31\x83\xa6\x5d\x60\xa5\xf9\x11\x46\xe7\xf2\xf6\x24\xf5\x51\x33\x7b\xba\x6c\x0b\x2c\xcd\x74\xa9\xb1\xdc\x0d\xf5\x7c\x4c\x30\xce\x41\x49\xd3\xb1\xda\x1d\x84\x41\xc3\x61\x08\x6f\xe1\x3a\x74\xe8\x36\x07\x91\xb2\xb0\x41\x54\xa5\x86\x4a\x2b\xed\x21\xab\xb1\x14\x61\xc3\xf9\x08\xdb\x30\xf3\xa7\x04\x21\x54\x00\x2d\x18\xe8\xdf\xfa\x68\x97\x46\xd4\x71\x26\xa4\xd3\xc4\xb8\x2b\x92\xf7\xf4\x19\x5e\x53\x24\x0e\x11\x77\x36\xf8\xcd\x66\x2b\xcc\xaf\xb8\xa9\xd2\xe6\x40\xcc\x35\x6d\x0a\x96\x51\x74\xb0\x53\xb5\x34\xa2\xcf\x29\x7b\x0b\x0f\xda\xd1\x0f\x5c\xc8\xb8\x69\x3d\xc4\xae\x47\xe0\xd1\x48\xbb\x3a\xf2\x8a\xd8\x73\x49\x3a\x78\xa1\x60\xc6\xdf\xc7\x79\xc8\x65\x76\x45\x0b\x78\x53\xb0\x55\x11\xd6\x62\x5e\x2a\x52\xc5\xfc\x9d\xb8\xa6\x35\x00\x7d\x36\x13\xe7\x5c\xea\x6c\xaf\x9a\xdc\xd6\xb7\x35\xaa\x61\x13\xb5\x07\x6c\x4a\x86\x13\xbe\x90\x49\xb3\x26\xd6\xb8\x45\x17\x3d\x77\x9e\xb9\x37\x2a\x14\x56\x8b\x71\x54\x93\x8d\x9d\x4b\xfa\x54\x98\x75\x13\x35\xc7\x93\x93\x34\xdb\x08\xcc\x29\x5c\xcf\xc1\xe5\x73\x1d\x8c\xac\x03\x5d\xa8\x2f\xf8\x2b\x5e\xde\x1b\x78\xa5\x0c\x27\xc3\xe5\xd6\xe6\xa8\xdf\xb5\xbd\x6f\x9f\x7d\xdb\x2c\x22\x7b\x78\xfc\xbd\xe7\x1a\x9a\x35\x0b\x93\x4d\x4a\x1c\x96\x6d\x3a\xf2\x52\x39\x77\x60\x0a\x98\xdd\xe3\x92\x2e\x68\x91\xe2\xed\x96\xac\x48\xe9\x5b\x1d\xea\x0e\xbf\xbb\xe1\xfd\x20\x4d\x81\xe0\xd6\x7e\x77\xce\xb8\x50\xd9\xda\x21\xf6\x37\x63\x54\xba\x1e\x0c\x70\x67\xd0\x24\x60\xcf\xa8\x6f\x10\xb3\x95\x5d\xd0\x92\xd2\x53\xd5\xc2\x4f\x94\x2c\xf1\x8d\x0a\x6f\x61\xb6\xc4\xe3\x2c\x08\x33\x88\x0c\x8d\xd5\x6c\xbc\x12\xa4\xe2\xb7\x7a\xab\x05\x25\xc9\x38\x05\x77\x76\x58\xa3\x01\x73\xda\x9f\x70\xf5\x5c\x10\x51\x27\x78\xb4\x71\x66\x53\x7b\xef\xc0\x1c\xb2\x31\xc1\xf2\x2e\xae\x46\x70\xcf\xc5\xb1\x43\x6d\xbf\x8a\x4d\xdc\x3b\x39\xe7\xc4\x0a\x34\x1d\xa1\x97\x26\x1b\xad\xf9\x8f\x7b\x85\x2e\x70\x60\x74\x00\xab\x92\x2c\x16\xb4\x34\xcf\x33\xc8\x71\x20\x25\x65\xaa\x76\x15\x3b\xfa\xa6\x8f\x99\x32\x0b\x74\x97\x58\x01\xc7\xcb\xf9\xab\x6b\x20\x65\x49\xae\xb9\xf6\x29\xfd\xd1\xcf\xdf\x99\x74\xa3\x95\x1a\xe6\x1c\x53\x70\x11\x45\x8f\xe6\x79\xf6\x86\xe6\xd7\xfa\x59\x06\x3c\xcb\xb2\xd0\xf8\xd5\x31\xfc\x39\x29\xae\xed\x0b\x0e\xd5\x7a\x82\xc3\xd7\x85\xd4\xd4\x3c\xfb\x1d\x35\x97\x08\xc7\x92\xa7\x6d\xff\x87\xf5\x40\x62\xe0\x33\xb6\xd2\x12\x4e\xe9\x94\x2c\x73\x11\x79\x93\xb3\x92\x14\x1c\xdf\xd5\x22\xce\x79\x54\x22\xc2\x21\x57\x30\xef\x79\x09\xf9\xc9\xd5\x31\x3b\x97\x68\x9f\x8f\x40\x94\x67\x16\x87\xff\xc2\xa0\x72\x98\xb5\x4f\x7a\x17\x8b\x76\xd9\xb4\x8b\xf8\xf0\x05\x0b\xbd\x32\x91\xe9\xe7\xb2\x24\x5e\xf3\x9d\xfb\xa5\x64\x06\x3e\x4b\xa1\x9e\xfd\xe0\xd0\x5e\xf2\x25\xee\xcc\xe2\x85\x28\xe4\xa3\x71\xbd\xa2\x37\xf4\x5a\xea\x58\xa5\x78\x9a\x25\xe2\xfb\x94\x3b\x29\x53\x5a\xd2\xf4\xd9\x2d\x8b\xef\x3f\x0b\x34\xc9\x24\xab\xb4\x92\x26\xac\x4c\x75\xd6\x2d\x90\xca\x36\x04\x3c\xba\x45\xd9\x85\xd4\x7e\xde\x7b\x46\x04\x79\x5e\x92\x39\xdd\xba\xa8\x9c\xc7\x63\x08\x4f\xec\x92\xea\x05\x17\x55\x86\x70\x53\xc2\x8b\x75\x39\x88\x10\xd8\xbd\xce\xa1\x27\xfb\xf8\x8c\x02\xe5\xdb\x20\xc0\xda\xb5\x62\x1d\x4d\x9b\x14\x59\x69\xb7\xb6\x11\x0a\xaf\x1e\xd8\xab\xcd\xec\x35\x60\x21\xf9\x4a\x76\xee\x06\x24\x18\xc7\x37\xcf\xf5\x34\x52\x1b\xad\x26\x14\x05\xbd\xa2\x72\x66\xae\xd6\xe9\xbe\x2f\x1e\x0c\xda\x5e\x58\x71\x6a\x82\xe4\x34\xcf\x2c\x8d\x70\x1f\x6d\xaf\x72\xfe\x37\x30\x4c\x68\x91\x82\x88\xa4\xa0\x1c\x65\x9d\xb6\x8f\x93\xd6\x49\xc9\xde\xd0\xc2\xbc\x3e\x15\xee\x66\x37\x1a\x31\x34\x57\x3d\x69\x38\x4b\x72\x1d\x1b\xf6\x26\xac\xa4\x3d\x6c\x42\xef\x48\x19\xe7\x5e\xaf\x77\x73\xa5\x72\xf2\x13\xd4\xe9\x9c\xac\x7a\x50\x55\xbd\xfe\x26\xd9\xa4\xdf\x06\x03\xbb\x5b\x8b\x07\x85\x43\xbb\xa7\x75\x16\xad\xd4\x1a\x08\xc5\xd4\xc8\x1b\x08\xef\x60\x97\xea\x4a\x13\x8d\x05\xab\xda\xf3\x77\xbe\xff\xdf\x84\xb5\x67\xc2\xdf\x46\xe3\x71\x82\xef\x96\x45\x9d\xea\xf2\xb4\x1e\x00\x88\x5a\xe4\x2a\xf4\x81\x08\x59\x71\x00\x28\xe9\x87\x01\x04\xd8\xd5\x7d\xd5\xd0\x6d\x57\xc3\x26\xf2\x2a\xc8\x40\x2a\xbd\x27\xee\xda\x77\x1b\x08\x6d\x57\x56\xb6\xf1\x40\x83\xb9\x08\x36\x23\x57\x54\x8f\x53\x42\x8e\x0f\xf8\xf8\x96\x37\x83\x58\xcf\x7b\x14\x53\xbd\xe5\x5a\x8b\xf1\x69\x82\x45\xc9\x16\xb4\x14\xd7\xb8\xfa\x01\x3d\x2d\xd8\x27\x2a\xfa\xbc\x65\x51\xdd\x4a\xa9\x14\xd8\xed\xed\xed\xf5\x76\x3b\x4d\x1c\x43\x56\xf8\x04\x85\x50\xd9\x34\xe4\xa9\x52\x5b\x39\x9a\xf8\x67\xbe\xea\xe7\x55\xc3\x73\x4f\x6b\x50\xc4\x58\x7b\xa7\x5e\xda\xd0\x77\xd1\xc7\x78\xbb\x6b\x8a\xd7\x8a\x35\x1f\x9d\xad\x20\xbb\x58\x83\x6d\x54\x9d\xe3\xd6\xf4\x49\x0b\xc4\x89\x66\x4e\x44\x99\xbd\xad\x6d\x1c\x34\x6b\x80\x12\xaa\xb4\x6d\x56\x3e\x1c\x88\x74\x68\x0b\xdd\x51\xa5\xbb\xa5\x6d\x74\x28\x03\xdd\x8d\x6b\xa2\xea\x55\x5c\x4f\xf0\x1c\xc3\xd0\x25\xd4\xfe\xa0\x6c\xd5\xa6\xdd\xa0\xba\x7b\x1a\x38\x24\xa6\xa1\xd2\x33\x24\xa5\x75\xca\xd4\xc0\x6a\x9e\x17\xc3\x96\x99\xe1\x0f\x82\x48\xce\x38\x1d\x41\x4b\x13\x56\x5b\x31\x62\x73\xb2\x08\x56\x17\x64\x89\x0e\xf6\x35\x03\xc8\x67\x6c\x99\xa7\xf8\x98\x87\xd9\x25\x01\x7f\x07\x4e\x3f\xca\x80\x63\xb4\x3f\x46\x04\xc3\x7f\xac\x68\xf6\x1c\x8d\x56\x85\x89\x0d\x7d\x63\x63\xab\xec\x0e\x5e\x18\x6f\x5a\x49\x9e\x14\x80\x01\xa3\xf5\xad\xe9\x76\xc6\xf9\x92\xc2\x9d\xcf\xf7\x3a\x6b\x78\x71\x31\x0a\xad\x47\xbb\x19\xce\x54\x1e\xe4\x6e\xb0\xe3\xa9\x64\x6a\xe5\xe4\xbb\x04\xbf\xa4\xa2\x6e\xa0\x53\x25\x81\x48\x76\x10\xee\x15\xaa\x19\x2b\xe5\x98\xfb\xae\xd9\x9a\x56\xd5\xd1\x63\xef\xe3\x1f\xd7\x56\x3b\x4d\x83\x27\xb0\x5b\xcb\xf5\x2c\x91\x04\xba\xd8\x1d\xc5\xca\x15\xae\x73\xc1\x30\xcd\xc2\x45\xe3\x69\x46\xf3\x74\x73\xe3\xdd\xb3\xbb\xcd\x8d\x6e\x54\x6b\x5d\x45\x4f\x57\xd0\xe9\x84\x2c\x08\x9a\xb4\xb6\x19\xb2\xef\xd5\xe8\x31\x1d\xd2\xf3\xbe\x03\x88\x65\x91\xfd\x76\xac\xed\x3f\xa7\xa2\x8d\x7d\x0b\xaf\x27\xab\x67\xb6\x66\x04\x5f\xcd\xce\x19\x7b\xb3\x5c\x34\x0d\x1a\x17\x23\xdc\xe7\x16\xac\x24\x97\x54\xed\x05\x50\x51\x1d\x37\x7c\xa9\x59\xaf\xb6\x6e\x9e\x31\x0b\x29\x1e\x18\x96\x40\xad\xf9\x78\xdf\xe2\xdd\x87\x5a\x61\x49\x4f\x8f\xbe\x15\xb4\x48\xdb\x16\x91\x09\x54\x51\x83\xb6\xed\xee\x2d\x17\x29\x11\xb4\x8d\x96\xa5\x06\xa6\x7b\x3f\x12\xb3\xd7\x1f\x55\x57\x1e\x9b\x83\xca\xfb\x00\x6f\x74\xb6\x26\xa4\x79\x48\xba\x03\x67\xd2\x63\x90\x34\x2d\xa9\xb4\x4a\xea\x80\x47\x56\x2c\x96\x52\x78\xfe\x73\x31\x15\xc6\xbe\x41\x1b\x93\x15\xae\x3d\xcd\x35\x58\x06\xe9\x48\xf4\x6f\xea\x4d\xad\x73\x86\xa4\x35\xc0\x9b\x0d\x38\x04\xda\x2e\x01\x82\xec\xea\x5d\x2a\x3b\xcb\x6e\xd0\x5e\xc5\x1a\x62\x67\x6b\x06\xed\x34\x78\xb3\x11\xe7\xa3\x1b\x48\xb8\x30\x13\xec\x4b\x2a\xda\x6f\x62\x78\xd3\x71\x82\x91\xe4\x8d\x36\x94\x6d\xec\xac\xc6\xb1\xee\xd4\x1b\xb6\xa5\x9e\x57\x75\xba\x59\x66\x5e\x13\x9c\x3e\x6f\xdd\x88\xef\xdd\x10\xd8\xe8\x3d\x35\x8e\x49\xd5\xf6\x37\xdc\x59\xaa\x7a\x13\x8d\xc8\xa3\x0d\x12\x36\x3e\xa6\xef\x63\xbc\xa1\xd7\x2b\x56\xa6\x51\x0d\x59\xb3\x1f\x74\x21\xfb\x21\x32\xb0\xca\xbd\x6a\x5f\x1e\xb5\x7e\x98\xf1\x96\xf2\xa4\xcc\xf0\x24\x77\xc3\xa8\xbb\xa6\xd0\x94\x8a\x64\xc6\x8a\xa6\x71\x7a\x4d\x89\x92\xad\xf0\xc0\xcb\xa6\x71\xea\x15\xbe\xa5\x8e\x5e\xda\x84\x70\x8c\x9d\x03\xc9\xb2\xe4\xac\x04\x36\xf9\x0d\x4d\x04\xb4\x5f\x1d\xbe\x82\xdd\xfd\x87\x8f\x3a\x95\xa2\xb8\xaa\xe9\xb6\xeb\x54\x29\xb7\x63\xb7\x23\x59\xb2\xb3\xd6\x93\x51\x73\x24\x69\xd9\xa7\xee\xb4\x61\x56\x54\x9c\x01\xc7\xa8\xaa\x28\x9a\x3d\xad\x0d\xdd\xe9\x8e\x1a\xa9\xd4\xe1\x08\x7f\x05\xe5\x56\x03\x34\x29\x2e\x69\xdb\xd4\x72\xb1\x3b\xea\xe0\x9d\x03\x85\x5f\x90\x37\xd4\x19\xa7\x92\xcd\x55\xd4\x21\xbb\xd4\x83\x0f\x89\x24\x94\x73\x52\x5e\xdb\xb9\x77\x93\xa5\xd8\xd4\x14\x7f\x29\xbb\x79\xae\xe5\x31\x19\x21\x2f\x76\x47\xfe\x82\x30\x0f\x9e\x26\x01\x6f\x32\xa1\xa0\xfd\xe1\xad\xde\xff\x1d\x72\x8d\x6a\xdd\xb2\xc3\x5a\x23\xb3\xd9\x69\x37\xd8\xaa\x03\x6e\xeb\x36\x55\xb4\xa0\xe2\xb0\xab\x9b\x24\x5c\xe8\x35\x6f\x2b\x31\x39\xd7\x92\x3d\x5e\xdd\x30\xb3\xb3\x2e\xa5\x1f\x08\x63\x97\x96\xc6\xb8\x5b\xc9\x45\x69\xde\xab\xb7\x39\x2a\x16\xc4\xba\xbd\x4f\xfb\x74\x8d\x5b\xa4\x52\xc7\xe6\xd5\xc2\x9b\x0e\x22\xb4\x56\xa0\xba\x15\x37\xec\x86\xb4\xa0\xe9\x7a\xb2\xa9\x30\x86\x23\x3d\xc1\x71\x8f\xf9\xd4\xdb\xb5\x7d\x9d\x2a\x1e\x98\x6d\xbe\x57\x7b\xd8\x46\xbd\x2c\x88\x11\x13\xd4\x76\x82\xc7\xb3\xf5\x84\x74\x9a\x95\xbd\xae\xe8\xc1\x24\x38\xec\x99\x1d\x6f\x30\xbb\x2d\x0b\xc3\x46\xa8\x85\x49\x6c\x03\x06\x33\xf9\x5e\xed\x58\x10\xce\x8d\xce\x2d\x88\x5e\x1c\x56\x53\x3f\x7f\xa8\xcb\x8a\x4c\x64\x24\xb7\xeb\x47\x9b\x0c\xc6\x06\x13\x51\xa8\xe3\xe1\x76\xcb\xd1\xf3\x67\x8b\x84\xe5\x26\xb3\x66\x0b\x64\x75\x33\x0e\x8f\x15\xd4\x5a\xa3\x12\x45\x23\xb8\x0b\x6d\x85\xaa\x2b\x8b\x74\xec\x3b\x77\xba\x95\xde\x76\x52\xec\x72\x70\xd3\xc5\x8e\x17\x6a\xc5\xd5\x1f\xb1\xfc\x3e\x3e\x68\xeb\x50\x3f\x36\xa6\x51\x18\x48\xcd\x6c\xa9\x0f\x6a\xcf\xfd\xab\xfc\x62\x39\xd7\x4f\xda\x9a\x0b\x2a\x2a\x9d\x8b\x52\xa7\xe3\x4e\xaa\xb9\x7c\x60\x4f\x13\x59\x74\x2f\x8f\xce\xce\x8e\x8e\xbf\xfa\xf6\xe0\x45\x1c\x1a\x02\x6f\xd1\x1c\x33\xd2\x8c\xe3\xa1\x5d\x7b\x6a\xcf\xbb\x91\x60\x5e\x32\xd3\x81\x88\x1a\x0e\x25\x4d\xb3\xb7\xb8\x59\x90\x8a\x99\x8b\x9d\x06\x8b\x92\x0a\x71\xad\x46\xd8\xf0\xaa\xaf\xda\x4a\xf4\xa2\x41\xed\xc5\xb0\xdf\x7b\xf0\x70\x14\xc3\x45\xf7\xb3\x5f\xc4\x10\x7d\xde\x7b\xf4\xe8\x51\x84\xc1\xa1\xf6\xa3\x18\xa2\xbd\xdd\xdd\xdd\xbd\x68\x34\xd2\x3d\xc2\x3f\xc2\xd3\xed\x6a\x19\xef\xa9\x0f\x89\x48\x01\x7d\xf6\x0b\x95\x82\xc8\x34\xd0\x3e\x00\xe2\x6a\x42\x83\x69\xde\xc6\x06\xfd\xed\x32\x2b\xa9\x9c\xf6\x5f\x2e\xd5\xa3\xce\xaf\x7d\x51\xbf\xee\x98\x6d\x0b\xb5\x6c\x1d\x6e\x64\xb5\x6f\xda\xc9\xea\xc4\x9e\x57\x88\x33\x6d\xa5\x2a\xb8\x95\x15\x6b\xd7\x30\x63\xd2\x06\x57\x96\x77\x2a\x0b\x3f\x16\x2e\xa3\xe6\x5a\x0a\x88\x15\xeb\xa6\xd9\x9c\x16\x5c\xad\x2b\x7b\x8b\x41\x71\xc3\x76\x93\x5e\x32\x7a\x85\xab\xaa\xea\x0a\xb5\x6c\xe1\x54\xed\x95\x68\xc6\x78\x0f\x7e\x72\xc3\xbe\x6e\x95\x7b\x4c\x7b\x54\x45\x96\xd0\xca\x9b\xf2\x31\xee\x29\xea\x27\x91\x39\x4d\x58\x11\xb0\x56\x43\xbd\xee\xf4\x8d\x93\xd4\x05\x9b\x68\x39\x5d\x00\x7d\xbb\xc8\xb3\x24\x13\x96\x77\x61\x2d\xb6\x6c\x36\xb5\xc5\xbd\xdd\xa7\xd7\xb1\xac\xbe\xa8\x38\x35\x66\x23\x3a\xe3\xb8\x05\xd5\x8c\x03\x1d\x34\x53\xde\x13\x0e\x7a\x64\xbe\xfb\xa7\x76\x7b\xa4\x8f\x86\xc8\x10\xdb\x89\x54\x84\x95\x9c\x37\x98\x37\x55\x73\xca\xcd\x43\xbe\x19\x87\x45\xc9\xd2\x65\x62\x2f\x41\x1f\x4d\x2b\xfb\xe4\x76\x47\x8c\x83\x2a\x38\x23\x45\x05\x44\x1b\x5c\x24\x50\x59\x5a\x49\x02\xee\xe3\x72\xbb\x80\x8b\x6b\x52\x66\x5b\x2c\x27\x5c\x98\x62\x3d\x38\x9f\x65\x88\x3f\x61\x05\xcf\xb8\xa0\x3a\x0e\x03\x9a\x79\xdc\x44\xcb\x49\x56\x74\xa5\x87\x60\x82\x50\xb2\x29\x9c\xa2\x0d\xd7\x8a\xe3\x94\x86\x6f\xea\xed\x11\xa7\x6f\xa3\x38\x22\x97\x34\x1a\xc5\x17\xd1\x41\x9e\x25\x34\x8a\xa3\xe7\x51\xbc\xff\x50\x26\x7c\xc9\x26\x51\x1c\xbd\x8c\xe2\xbd\x47\x23\x1d\x39\xba\xd7\xeb\x85\x36\xdc\x13\x69\x38\xe5\xe3\xf4\xad\xfa\x42\x2e\xa9\xd3\xd2\xf0\x03\xd3\xb1\x5a\x80\xe7\xb6\xe4\xbe\x32\x1b\x5f\xb2\x89\xfc\x78\x69\xd3\xf7\x1e\xa9\xb6\x7c\x79\x6d\x56\xb1\xe3\xfa\x8e\x04\xaa\x0f\x6e\x95\x90\x42\x7a\x64\x99\x7b\x31\x5e\x2a\x45\x42\xf2\x5c\xeb\x95\xde\xba\xa3\x6f\x7b\xb2\xb7\xe0\x42\x39\xf0\x6c\x9e\xe5\xc4\xaa\x90\x60\xb8\x4f\xa8\x8c\x47\xb0\x5b\xa8\xb8\xb1\xe4\x14\x5e\xd7\xb7\x2e\x5f\x4b\x2d\xf4\xd2\xcf\xcb\x25\x7d\x8d\xb5\x98\xa7\xa1\xfd\x7d\x43\x35\x02\x35\x6d\x49\xc6\x38\xd4\x07\x35\x38\x07\xc2\x4b\xc5\x31\xe2\x75\xcf\x74\x7c\xd5\x94\x64\xc9\x05\x9b\xbb\x56\xea\x36\xd5\x71\x72\x36\xa7\x63\x63\xc7\x5e\x6f\xd4\x17\xab\x19\x46\x27\x1a\xf6\x6d\xcd\xc8\xa0\xfe\x53\x22\xde\x45\xf1\x6a\xb9\xee\xa1\x4c\xf7\x1e\x85\x60\xaa\xda\xa7\x95\x7b\x62\x75\xf3\x66\x2d\xdc\x6b\x43\xd8\x6b\x10\xd2\xe2\x4a\x61\xa5\x54\xc8\x49\xa6\x91\x1e\xf2\x92\x2c\x05\x9b\x13\x91\x49\xc9\x5f\xeb\x63\x12\xf8\x1e\xa8\xb2\xf2\x26\xb0\x2b\xd7\x5b\x60\xf9\x75\xcf\x53\x30\xc8\xf4\x09\x25\x1e\x06\xbb\x31\x3d\xd7\x78\x07\x13\x69\x12\xe4\x48\x33\xcd\x97\x7c\x46\x31\x18\x1a\xbd\xa4\xa5\xcd\x13\x4c\x85\x36\xcd\x2e\x67\xa2\xa3\xa8\xd0\xa0\xca\x55\xbc\xa2\xe5\xb5\x98\x65\xc5\xa5\x5a\x89\xd4\xe0\x18\x63\x04\x5e\x31\xae\x2f\x98\x54\xb8\xa3\xca\xb6\x5f\x1b\xf7\xe4\x75\x0c\xaf\x8d\x4b\xf2\xba\x23\xad\x4e\xdf\xdc\x38\x76\x8f\xeb\xc6\xfa\xd8\x97\xf7\xbe\xae\x42\x83\xaf\xe4\x4b\x3d\x74\xf8\x34\xa5\x78\xc8\xa9\x2d\xf9\xab\xbc\x13\x47\x41\x27\x1c\x94\x74\xa4\xd6\x75\x83\xd2\x6b\xe3\x67\xbd\x56\x9b\x8e\x61\xc8\xdd\x84\xe0\x95\x78\x3c\x7a\xe0\x66\xf1\x5c\x9d\x04\xd2\x0e\x50\x21\x48\x56\x48\xa6\xe2\x8d\x05\xec\xeb\x68\x16\x2b\x51\x8b\xb4\x0d\x95\x63\x15\xc9\xb9\xb4\xb7\x7a\x38\x56\x43\x55\xa9\x06\x77\x29\x43\x43\x82\xb9\x41\x21\x5b\xba\xa0\xa6\x72\xdd\x19\x5e\x4b\x06\xbc\xf6\x2f\x44\xe8\x73\x9d\xa9\xa9\xfd\xb5\x73\xfa\x5e\x9b\xb3\x8f\xed\x3c\x7b\x43\x2b\xed\x8e\xd5\xb3\xf1\x1e\x61\x9e\xef\xa1\xf1\xcb\xb6\xa7\xd9\x74\x4a\x4b\xd3\x01\x34\x27\x3a\xfd\x8d\xb6\x5c\xc5\xee\xdc\xd3\x77\x00\xaa\xe6\xda\xfd\x5d\xa8\x58\x4a\x31\x3c\xdc\x8f\xe1\x41\x6f\xef\xe1\x46\x58\xb4\x7d\x91\x42\x2a\x9d\xc3\x5f\xca\x5e\xef\x1f\x98\xff\xbb\xc8\xf9\x82\xca\xb0\xab\xaf\xca\xcf\x5d\x90\xb9\xee\xf3\x6a\xb3\x5e\x56\x0d\x00\x0f\xf7\x01\xab\xc6\x34\x65\x5e\x01\xfe\x4e\xfa\x8c\xbf\x6c\xc4\x85\x89\xdf\x92\x32\x63\x4b\xee\x8f\x7f\x61\x84\x68\x74\x0b\xd1\xbf\x57\xda\xef\x1f\xbc\x97\x08\x76\xb0\xe4\x4e\x0c\x3b\xca\xfb\x97\xdf\x2e\xcb\x2c\x95\x9f\x8b\x6c\x81\xbf\x55\x00\x64\xf9\xad\xe4\x42\x7e\xd8\x50\xc3\xfa\x29\x9a\x1d\x0c\xfe\x2b\x73\x6c\xc4\xff\x1d\xec\x25\x3b\x61\x14\xfa\x9d\x1e\x12\x8c\x04\xbe\xae\xc6\xc1\x7e\xed\xeb\xb3\x3a\x8a\x67\xbd\xa8\x65\x29\x05\x9f\x5f\x7b\x27\xbf\x4c\x80\x6c\x7d\xc2\x44\xc5\x86\x36\xba\x6b\x36\x4d\xe5\x60\x44\x8a\x6b\x58\x70\xba\x4c\xd9\x65\x49\x16\xb3\x2c\x51\x66\xb1\x24\xfa\x9d\x78\xed\x97\x66\xc2\x86\x95\xe5\xae\x9f\xe9\x8e\xc4\x96\x92\x64\xbe\x20\x09\xdd\x46\xe1\x1e\xee\x49\xaf\xfe\x11\x4e\x11\xb4\x62\x45\x0f\x3f\xdb\xeb\xed\x46\x75\x9f\xc1\x57\x2c\xdd\xe5\x30\xd2\xa5\x32\x92\x72\x9a\xa1\xdb\xa6\x55\xca\xdc\x7a\x03\xcf\xcc\x06\x7a\x85\x7f\x9a\x02\x5f\xbf\x54\xfa\x67\x7b\x1f\x4b\xbf\x37\x61\x0c\x09\x53\xf5\xd7\x6b\xb6\x75\x9a\x09\xa6\x91\x92\x3e\x6a\x88\x1e\x1a\x4b\x4c\xb0\x5e\x25\x94\xbf\x01\x9b\x35\x75\x37\xf1\xd9\x1a\xf0\xea\x2c\xef\x6f\x20\x80\x90\xe4\x90\xa8\x9b\x85\xd2\x50\x46\xc9\x09\x63\xa3\xe3\x2d\x1d\xed\xfb\xc9\xb1\x57\x1d\xdf\x33\x73\x01\x98\x5c\xc3\xe1\x9c\x24\x7a\x9a\xd0\xa3\xb9\x09\xf5\x0d\x4c\x6d\xa2\x69\xa9\x4a\x5c\x3f\xb4\x4c\xd7\x8a\x14\x1b\xa2\xb9\x73\xcf\x1b\x7b\x83\xef\x98\xfb\xde\x13\xf8\x7b\xcf\x81\x79\xaf\xca\x0e\xdc\x5f\xf0\xdd\x94\xb5\xa2\x7f\xef\xb8\x6d\xca\xde\x50\xaf\xd3\x8e\xf7\x28\x16\xfd\xfd\x86\xb2\x9f\x4e\x87\x1a\x78\x74\xaf\x81\x3b\xb2\x85\xef\xd7\xb4\xad\x01\x1e\x5b\xf5\x7e\x4d\x7b\xee\xd5\x5a\xe2\x07\xe5\x47\xdb\x2c\x7d\x21\xf9\x0b\x96\x72\x54\x85\x09\x7b\xdb\x95\xc9\xf2\xbb\xbb\x53\xfc\xd7\x57\x28\x8f\x4c\xcd\x32\xf3\x4c\xb0\x7e\x48\xf7\x53\x7e\xfc\xe9\xd3\xe3\xfc\xcb\xef\xff\x68\xa9\xfe\xc3\x5f\x7e\xff\x4f\x9e\xd6\xdb\x24\xa7\xfc\x26\xc9\x35\xf4\xcf\xff\xf9\x03\xb4\xf3\xdf\x7e\x00\x9c\xff\x52\x69\xa6\xed\xa0\x5e\x33\x8d\x2e\xd7\x9a\xf9\x87\x3f\xff\xa3\x79\x5c\xf9\x07\xf9\xfc\xaf\xff\xf8\x61\xd1\xff\x29\x6c\xbc\xb3\x30\xae\xf1\xb6\x63\xd6\x65\xfc\xdf\xff\xfc\x03\xc8\xe3\x5f\x7f\x08\x5d\xfe\x77\xe3\xfc\x65\x0b\x1a\x59\x77\x42\x8f\x54\x59\x01\xaf\xbe\x7e\x05\x2f\x49\xf9\x26\x65\xab\x02\x0e\xdf\x8a\x92\x00\x9e\x5b\xe1\x72\x52\xc5\x4a\x3d\x44\x21\x0e\x7c\x91\xf8\x6f\x35\x4c\x21\xfd\xda\x9e\x6c\x1e\x88\xde\xf7\x9d\xe9\x7c\xef\xbe\xf6\xdf\x6f\x31\x10\xad\x1f\x6a\x34\x17\xd5\xdb\x25\x55\x3e\xea\x11\x5f\x0e\xf8\xd2\x27\x7f\x85\x50\xf0\xf4\xc5\xd1\xdf\x80\x4f\x8a\x42\xb3\xa8\xd6\xc8\xa8\xea\x44\xdb\x1f\x36\x75\xb1\x26\x1e\xa9\xac\x2a\x83\x3e\xa5\xaf\xec\xcb\xb8\x5f\x11\x60\x28\xbf\xda\x30\xdb\x34\x9c\x2a\x99\xe9\xb7\x69\x1a\x74\x5f\x39\x67\xac\xbc\xec\xce\x59\xaa\xce\x8a\x2b\x60\xfc\x8d\xcf\xf7\x78\x0b\xb1\x79\x76\x39\x93\xf3\x2b\x3b\xc9\x56\xdb\xeb\xba\x67\x69\x7f\x7d\x72\x8d\x1b\x71\x6a\x44\x56\x6f\x76\x83\x60\x6a\x45\x9e\x4e\x55\xac\xc1\x70\x35\x46\xad\x95\xa8\x02\x04\xa2\x7b\x11\xf0\xec\x12\xd7\x10\x71\xa1\x8f\x08\x0a\xf6\x3a\x5f\x56\xc8\x21\x5d\x47\x3e\xf9\xeb\xeb\x96\xe6\xe4\x76\xbd\x70\x8d\x7e\x7d\x64\x2f\xfc\x74\xca\x56\x6b\xcc\x2d\xd5\xaa\xe4\xc2\xe9\x94\x7d\x8f\xc5\x5f\x59\x50\xfa\x51\xd2\x33\x7c\xb3\x65\x59\xd2\xf4\x9c\xbe\x15\x5f\xc0\x22\xa7\x44\x47\xfc\x2f\x98\xa0\xea\x2d\xa8\x2a\x18\x90\x24\xa1\x0b\xc1\xd5\x82\x8f\x9e\x6e\xfc\xad\x8c\xaf\x6c\xab\x66\x94\xf5\xeb\xbd\xaf\x9b\x27\x83\xeb\x4b\x6c\x3b\x19\x5c\x8b\xe5\xd3\x69\x43\xa5\x85\xae\x92\xed\xa6\x88\x95\x32\x4a\x43\xdc\x83\xc7\x66\x80\x90\x1e\xbb\xd2\x90\x39\x29\xdf\x2c\x17\x6a\xd5\x32\x2b\xe0\xbb\xec\x4d\xb6\x90\xe0\xca\x08\x15\x6a\x71\x0b\xd1\xbc\x94\xc9\x32\xbf\x3b\x21\x12\x9a\x67\xe2\x26\x15\x68\x14\xe2\xc7\xa9\x46\xc3\x3d\x30\x8f\x7b\xae\xa5\x9a\x87\xb7\x7b\xad\x59\xf5\xb4\xfa\x03\xcc\xda\x90\xe0\xc7\x4f\x3c\x05\xfb\xc9\x4f\x40\xef\x9f\xab\x55\xea\xea\xd0\xa6\x8b\x04\x46\xe6\x7d\xbd\x88\x2f\x4e\x5b\xc4\xb3\x3c\xf5\x22\x46\xdc\xef\x3f\x68\x11\xe3\xc3\xb3\x4e\xba\x5f\x9f\xbf\x7c\xa1\x45\xfb\x23\x93\x10\x12\xaa\x85\xf3\x58\x3d\x44\xab\xbf\xcb\x72\xe6\x7b\xf9\xe4\xb1\x98\x3d\xb1\x8c\x7e\x7c\x5f\xcc\x64\x4a\x93\xe4\x90\x27\x5f\x44\x4f\x2c\xe7\x15\xf0\x7d\x51\x6a\x64\xf7\x03\xcc\xf8\x08\xae\x57\x4b\xfa\xc4\xca\xe6\xf1\x7d\x91\xca\x94\xcd\xb5\x68\x9e\x28\x60\x57\x8b\x46\x66\xa5\xb6\x15\x32\x63\xcb\xab\xc8\xee\xfb\x64\xea\xe7\x7a\xb5\xa0\xd5\x93\xb7\x95\x7e\x8c\x37\x50\x68\x71\x95\x95\x4c\x5d\x6b\x67\x53\x78\x41\xce\xe9\xaf\x20\x65\x89\xda\x17\xdf\x46\x19\x6e\x67\xa9\x14\x25\x5a\x94\xc3\x21\xbe\x3f\x6a\x5f\xf9\x7c\x97\x97\x1f\x74\xc6\xcc\x7a\x0d\xaa\x1b\xfc\xdc\x0d\x6d\xc3\xe1\x70\xe8\x39\x73\x3f\x77\x83\x9b\xcd\xf1\xcb\x87\x0f\x89\xfa\x0c\xc1\x77\x6b\x2b\x8b\x60\x9a\xc0\x18\x26\x4b\xb7\xc8\x4c\x79\x42\x16\x54\x6d\xd9\x90\xdc\x5b\x9e\xd0\xe7\x5a\x96\xc9\x0c\x08\x87\x09\x49\xde\xf0\x9c\x70\x15\x3d\x6d\x59\x48\x85\x4e\x58\x49\x63\xe0\x4c\x73\x36\x61\xf3\x39\x29\x52\x0e\x73\x72\x0d\x74\x3e\xa1\xa9\x79\xbb\x11\x31\xe1\xcb\x8e\x3b\x7a\x4f\xe4\x46\xb6\xff\x74\xfc\xe8\xa7\x15\xd6\x4b\x0e\xd0\xf9\x62\xf6\x4e\xb2\xe6\xc3\x46\x21\x60\xeb\x6f\x2d\x08\x59\xa7\xfc\xde\x28\x0f\xbf\xee\x8f\x91\x8b\x7d\xd3\xf6\xfb\x6a\x2c\x22\x53\x4e\xa9\x9c\xd1\x18\x7c\x3d\x2e\xae\xed\x7b\x85\x9f\x5a\xa9\x1d\xd5\x37\x33\x55\xb0\x45\xb9\xcc\x3f\x46\xbf\xdd\x53\xb9\x6b\x99\x79\xac\xce\x66\x2c\x48\xc9\x4d\x1c\xf3\x6e\xf0\x87\x49\xfe\xb9\x02\x52\xe8\xed\x58\x15\x87\x40\x9f\x7a\xc1\x23\x59\x78\x31\xda\xbc\x7a\xa1\x36\x32\xd5\x77\xbd\x01\x3f\xcb\x38\xd0\x82\x2f\x4b\xca\xad\x2b\x6d\x1f\x04\x55\xa5\x8d\x61\x96\xd3\x11\xb4\x69\x34\x75\xdb\xcf\x0e\x8b\xac\x35\xa7\x04\x8f\x8c\xac\x68\x56\xa6\xa0\x42\x15\xa9\x3d\x42\x7c\xc4\x38\x41\x45\x30\xf8\x74\xf7\xd3\xae\x8e\xda\x55\x85\xcb\x4c\xc0\xd9\xd7\x07\x1c\x68\xef\xb2\x07\xd1\xc3\xfd\x47\x8f\xf6\xe9\x5e\x64\x1f\x2d\xd5\x8d\xc2\x57\x53\xdd\x41\x16\xc4\x81\xb0\xbb\x6e\xcf\x5c\x53\xbf\x4c\x66\x3d\x7b\xcc\x28\x61\xd2\x5f\x16\x14\x27\x54\x6a\x7b\xb8\x08\xd8\x0d\x6d\x5b\x1e\xb7\x8c\x63\xe9\x2c\x61\xe9\xd7\xb5\xd3\x6e\xfa\xa4\xc4\x73\x56\x62\x10\x3d\xc0\x89\xd6\x65\x49\x32\x59\x75\xc2\x0a\x51\xb2\xdc\x1e\xd7\xf2\x0e\xd6\x9a\xb3\x3e\xfa\xdc\x10\x78\x7b\xd5\x15\x62\x70\x97\x9b\x15\x20\x66\x8c\x9b\x39\x9c\xde\x83\x97\xec\xa9\x93\x74\xb1\x1b\xc3\xfe\xe8\x35\xac\xf0\x70\xf1\x8d\x58\x55\xcb\xd4\x89\x26\x7c\xf9\x68\x26\xe5\x66\xce\xf6\xa8\xae\xed\xe2\x88\xf8\xc7\xd8\xea\xc7\x52\x83\x5c\x7b\x37\x42\xb6\x7d\xcc\xa6\x63\x1d\xf7\xc1\x9d\xa5\x5c\x17\x81\xa2\x11\x5f\x63\x28\x0a\xfb\x0d\x8b\xd8\x83\xcd\xea\x6c\xa9\xb9\x2e\xec\x9f\xd9\xd2\x73\x60\x36\x85\xd3\xb3\x73\x33\x21\x77\xe7\xb0\xd5\x68\x91\xba\xbb\x88\xfb\x26\xce\x4d\x14\x35\x80\x11\x0e\xd1\x70\x08\x78\xbc\x25\xea\xf5\x7c\x2e\xa1\x79\x51\x11\xd4\xb9\x1f\xb2\x66\x3d\x33\x4a\x2e\xc6\x0a\xf1\x18\x69\x35\xc1\xa3\x9b\x4b\xd8\xb6\xb2\x85\xc8\xe6\xd9\xef\xf0\x2c\x42\x1f\x6f\xa8\x61\x67\xd3\xef\x65\xa0\x02\xea\x17\x33\x58\x91\xe8\x83\x99\x36\xc6\x29\x9f\x93\x52\xe8\xf3\x97\x26\xc6\x3f\x57\xca\x91\x4d\xd5\x15\x73\x8b\x00\xe3\x66\xb1\x65\xa1\x0e\x23\xe1\xee\x22\x9e\xfa\x86\x01\x3e\x4b\xad\x42\x04\xd9\x76\x5e\xb8\xb4\xb5\x07\xd5\xdd\xe9\xf9\x7b\x9b\xe0\x4b\xb6\xea\x04\x97\x76\x03\x8e\x8c\x7c\xd1\x87\x21\xbb\x54\x88\x25\xfd\xd8\x43\xed\xa9\x13\xd7\x02\x7d\xfa\xb9\x1a\x7d\x76\xb0\xed\x63\x1e\x35\xb1\x67\x05\xd4\x9f\x4c\xd6\xcf\x01\x7a\x4f\x62\x78\x14\x04\x7d\x48\xeb\x4e\x1d\x87\x8a\xbd\xa9\x01\xdc\x28\x16\xc4\x67\x70\x51\xa9\x07\xde\x1b\x9d\x61\x94\xf4\x10\xca\x3d\x03\xf8\xa9\xc3\x75\xdf\x31\xeb\x11\x78\x08\x5d\x32\xc0\x1e\x35\xd4\x11\x3a\xed\xd1\x18\xdd\x59\x05\x0b\xee\x42\x98\xf3\xda\x19\x17\xed\x30\x18\x41\xa0\x03\x7a\xd4\x36\x26\x10\xbb\x13\x7d\xbb\x20\x45\x6a\xcd\x62\xbb\x6a\x27\x63\x3c\x05\x2e\x2b\xd0\xa5\x13\x96\xbb\x70\x8f\x7e\x48\xc9\x44\x9a\x70\x6b\x5e\x8b\x45\xc7\x9c\xf6\x89\xa1\x58\x98\xa0\x42\x12\x91\x83\x32\x81\x85\xc2\x2b\x09\x2e\x80\xa3\x9c\x50\x9b\x97\xbb\xb0\x13\xe7\x29\x5c\xd1\x92\xfb\xc1\x74\x55\x64\x50\xef\x1d\x72\x43\x2e\xdc\xad\x04\x00\x33\x78\x6d\x22\x5e\x46\xfd\xcd\x92\x0b\x48\x97\x8b\x5c\x2d\xe5\x79\x0f\xa2\x09\x86\x67\x2f\xb2\x02\x28\x49\x66\xfe\xb0\xe4\xee\x8b\x4f\x2d\x56\xb5\xd4\xc4\x85\xbe\x21\x0c\x54\x24\xb0\xa2\xea\xc8\x62\x78\xfa\x68\x3d\xe9\x52\x7e\xf5\xd8\x73\xfa\x02\x60\x00\xdd\x81\xc7\xae\xa5\xfd\x7a\x33\x6d\x57\xd0\x77\x5c\xdb\x8e\x2d\xdd\x06\x6c\xc8\xac\xda\x21\x79\x7d\xea\x3f\x94\x8e\x3b\x23\x14\xca\xc7\xd2\xa0\x01\xc6\x3a\x12\x42\x20\x0f\x57\x78\xd4\xd0\xe1\xaa\x25\xf1\x52\x8e\x2d\x51\x63\x88\x0f\xbe\x81\x1f\x3e\xd8\x5a\x76\x04\xb8\x42\x6e\xb8\x33\xfe\xa3\x8e\xdf\xdb\x9c\x72\x5d\xd8\x40\xa4\x31\x24\xf8\x64\xe6\xd8\xc6\x1f\x1d\x5f\x55\x23\xfe\xab\x50\x5b\x52\xad\x12\x67\xd9\xb1\xab\x34\x95\x0e\x3b\x8e\xe9\x7c\x71\x28\xe5\x38\x68\xa4\xa2\x72\x64\xaf\x2f\x49\x0f\x2d\xf0\x88\xf4\xc9\xc7\x01\x5c\x98\x13\x81\x92\xa5\x89\x70\x21\x2d\x11\xfb\x48\x9d\x59\x34\x27\x0f\x15\x8d\x08\x64\xc8\xb0\xbd\xd7\x5c\x61\x68\xbe\x9e\x44\x38\x97\x36\xcc\x53\x22\x03\xef\x5d\x3a\x0a\x58\x91\xa5\x6f\x75\x7c\x3e\xec\x7e\x68\xfd\xf0\xfa\xa0\x2e\x57\x11\xb1\x6a\xd0\x45\x96\xbe\x1d\xc1\x40\xfd\x6a\x81\xf7\x5e\x84\x6c\xab\x37\xe6\x7a\x61\xfe\xe0\x1e\xbc\x3c\x3a\x1e\xbf\x3a\x78\xf6\xec\xe8\xf8\xab\x6a\xcc\x3f\x3e\xf2\x2f\xd3\x20\x37\x2e\x76\x47\x70\xd7\xa9\x9a\x1e\x55\x1b\xd5\x22\x7c\xdc\x22\x89\x81\xa8\xf7\x14\x6a\xd1\x71\x6f\x1a\x24\x2a\x4a\xa2\xd1\x84\x9a\xa1\x58\xe0\x1e\x6c\x08\xb5\xa0\xe9\xb6\xad\xd1\x0c\xff\xae\x10\x49\xd3\xca\x39\x7f\x00\xf4\xb0\x64\xcb\xf0\x83\x95\x70\x71\x11\x45\x23\xc3\x85\xda\xe5\x21\x31\xb6\xea\xa5\xbf\xc8\x22\x46\x89\xd6\x16\xf3\x45\x15\x9a\x6d\x7c\x95\x02\xd9\x26\xbf\x59\xd9\x25\x3a\xf8\x7b\x82\xa1\xdf\x93\x4e\x2d\xd0\xa7\xe6\x75\x62\xf8\x64\x6b\x88\x75\x93\x5c\x89\xa6\xfb\x89\x37\x05\x8f\x34\xb2\xf4\x94\x29\x94\x9b\xcb\xaa\x93\x36\xab\x49\xd1\x7a\xed\x86\x7f\x35\x51\x86\x84\xfa\x17\x17\x65\xf9\xbb\xde\x10\x5d\xb5\xaa\x45\x10\x41\x7f\x3d\x0b\xd5\x0f\xdd\xc1\xf9\xcd\x75\x19\xd5\xc2\xa8\x02\x41\xd0\x1e\xed\x79\x79\x8f\xc4\x37\xbb\x6e\x6a\xb7\x7a\x8d\xdf\x16\x66\x5e\x98\x83\x62\xa3\x4e\x70\x7d\x4c\xe7\x2b\x60\xaf\xb4\x65\xa8\xba\x5f\xe6\x49\xdf\xf0\xb7\xe2\x89\xa9\x68\x7f\x37\xfb\x43\xe6\x9d\x17\xb6\xac\xbd\xca\x6d\x1f\x02\x33\x87\x3e\x27\x0c\xfb\x0c\x8e\x57\x97\x62\x06\xaf\xfd\xc2\xaf\xf5\x22\x84\xd9\x46\xe4\xb0\x9a\x51\xbb\xad\x50\x99\x89\xba\x59\x15\x4e\x84\x59\xe0\x94\xd8\x18\x67\xb5\x69\xae\x3e\x91\x6d\xe8\xd1\xf3\xe9\x58\x15\xc6\xb3\xee\x0c\x5d\x1c\x77\xa5\xc6\xbb\x98\x26\x2d\x42\xf5\x04\x7b\xc6\xd1\x5d\xbe\xb1\x46\xd9\x72\xef\x2a\x90\x12\x16\x4d\x15\x25\x12\x22\xcf\x95\xaf\x65\xa3\xc5\xf9\x61\x38\x9d\x32\xd5\xf9\x6f\x47\x0c\xef\x2e\xa3\xe7\xd1\x62\xb4\x7a\x69\x66\x7c\x56\x87\x83\x8b\xba\x2c\x5a\xd4\x2e\xe5\x85\x83\x8a\x45\xaa\x2e\x48\x8f\x82\x29\x80\xa7\x80\x16\xae\xa1\xef\x69\x90\x0b\xd9\x43\xaa\xb5\xd5\x68\x74\x0f\x62\x8e\x4b\xb6\x6a\xe3\x4a\x29\xbe\x32\x94\x3a\x07\x4b\x8e\xb5\x32\x3d\x78\xee\x49\x4e\x2d\x21\xc2\x68\x83\x08\xeb\xe7\xa5\x34\x1d\x63\x09\xfd\xc4\x04\xdc\x53\x4f\x8b\xdc\xc3\x82\xd8\xe1\xe5\x4f\xd9\xe7\x25\x54\x2d\xac\xad\x8f\x62\x7d\x03\x55\xb6\x89\x09\xba\xcc\xf2\x74\xac\x4f\xc2\xca\x96\xf8\x38\xb0\x3f\x4a\xf7\x56\xf7\x9c\xe7\x76\xe6\x83\x41\xd7\x4b\x13\x75\xfd\x19\x11\xe4\x94\xad\xcc\xcc\x68\x95\x89\x19\x5b\x0a\xd3\x42\xbd\x86\x80\xab\x8f\x31\x70\xba\x90\x83\x68\xaa\xae\x82\x1b\x0f\xdf\x3c\x6c\x8f\x40\x70\x4f\x42\x05\xf1\x79\x91\x1c\xe9\x00\xd0\x22\xed\xf4\x4a\xfd\xbc\x55\xd8\x88\x3a\xf5\x09\xcb\x8d\x1d\x31\xce\x48\xad\x4d\xd6\x0c\xe8\x89\x84\xea\xe6\x76\xad\x50\x76\x0f\xff\x52\x1c\x62\x76\xab\x22\x3a\x0e\xd4\x74\x5e\x0f\x9d\xdb\x14\x8f\x4f\x81\xae\x09\x85\xe7\xae\xd8\x4e\xe7\x62\x8b\x96\x6c\x0a\xc4\xbb\x9d\x58\x6d\x44\x6a\x0c\x1d\x33\x9e\x10\x9e\x25\x08\x8d\xe1\x90\x63\xb8\x35\x37\xb1\x9c\x89\x44\xf3\xfd\xc4\x12\xbc\xbe\xa1\xc2\x38\x87\x54\xba\x15\x04\x89\xd9\x55\x6b\xc9\xf5\x22\x4f\xbb\x5e\x49\xd3\xf1\xda\x3a\x11\xc2\x5c\xe5\xb5\xc4\xc9\x3e\xb8\x82\x2e\xec\xab\xbe\xaa\x1e\xaf\x91\x7d\x2f\x40\xa7\xfa\x20\x56\xe4\x42\x59\x27\xe1\x43\x44\x76\xa4\x6e\x26\x50\xa1\x28\x4c\x69\xfb\x4e\x26\x2d\x62\x1f\xb1\x8a\xb3\xe0\x6e\x38\x2a\x78\xbd\x12\x58\xb2\x95\x9e\x41\xe0\x1b\x21\x78\xcf\x0a\xa9\x56\xe6\x64\x35\xa3\x25\x05\xce\xe6\x54\x17\x93\x83\x87\x9e\x86\x34\x35\xc0\xea\x53\x3b\xc9\x71\x21\x0b\x2d\xd6\x4a\xdd\x12\x57\x50\x6a\x2a\x96\xe4\xe6\xe5\xaa\x24\xf7\x9e\xc0\xf1\xd0\x79\xe2\x36\x5e\xae\x15\x99\x33\x76\x17\x49\x7e\x91\x8d\x7c\x07\xc7\x61\x50\xc9\x19\x46\x70\xc1\x90\x00\x8a\x02\xbd\x1c\x21\xf3\xf2\x42\x2d\xa1\x59\x94\xfd\xaa\x55\xcd\xcd\x53\x77\x4a\xbd\xf1\x06\x5e\xda\xf1\xbc\xff\xcd\x3d\x40\x16\xd8\xa8\xb5\x6b\x95\x56\xf5\x01\x5c\x1a\x6b\x46\x20\xb3\x6e\x67\x8e\x66\xac\xcc\x7e\xc7\x0a\x41\x72\x2c\x1c\x1a\x23\x8d\x6e\x2b\x6b\xa4\x61\x37\x9b\x23\x0d\xd4\x48\x7d\x93\x05\xd2\x66\x7e\x9a\xe5\x79\x60\xec\x35\x1e\x0b\x67\x45\x2f\x21\xa5\x72\xb9\x0e\x66\xab\xaa\x0d\x70\x75\xbb\xa6\xbb\x78\xbb\x32\xba\x74\xaa\xb6\x0d\x25\x50\x55\xc8\x0d\x82\x68\xb2\x64\x5b\x48\x71\xbd\x22\x04\x9e\x6f\x93\xd3\xdb\x8c\xb8\xf9\x11\xdb\x57\xfa\x88\x24\xf1\xef\x61\x59\x25\x51\x77\xf8\xf4\xb5\x66\x75\x5b\xc2\xf8\x6b\xb6\x87\x2b\xd6\xce\xb2\x34\xc5\xb0\xb3\xd3\xb9\xe8\xc9\x61\x5b\x4f\x9a\xc6\xb3\x2c\xa5\x52\x55\xda\xfe\x84\xb3\x09\xa8\xa3\x67\xda\x0a\x9f\xf2\x6f\x24\x9c\xef\xdd\x28\x70\xf5\xd6\x8a\xcc\xb3\xbf\x5b\x2d\xaf\x8b\x3a\xab\xdb\x5e\xc1\x3d\x63\x76\x3b\x6b\xd5\x62\xed\x93\x04\xba\x97\xbb\x67\x6b\x4b\xb6\x8a\x61\xdc\xc7\x71\x5c\x87\xd6\x85\x94\x41\x26\x20\x27\x82\x96\xb1\x44\xde\x38\xba\xb8\x45\x91\x85\x89\x33\x02\x03\xb5\xe7\x47\xf2\x76\x63\x11\x34\x19\x03\x6b\x5c\xc2\xbe\xe1\x28\x33\xa6\xa8\xb9\x86\x9a\x39\x0a\x18\xe5\xa6\xbd\xc6\x9e\x59\x4d\xb2\xf5\x6a\x50\x13\x1f\xcb\x00\x1a\x02\x3b\x6b\xc2\x62\x65\x53\x14\x90\x6c\x0c\x99\xa8\x00\x3a\x29\x44\xf6\x67\x64\x62\xd2\x29\xbd\xe9\xd7\xec\xa7\xdf\xcb\xd6\x8f\xba\x41\x15\x6e\x66\x1a\x36\xaf\xdf\xc0\x9a\x0a\x6a\xbf\xd9\x6b\xaa\xb2\xaa\x16\x2c\x48\x1a\x02\x26\x34\x67\x2b\xfd\x3c\x86\x6d\xa9\x97\xb8\xb6\xbd\xdf\xbf\xcd\x1e\xf6\x5a\xcb\xed\x8e\x82\x03\x16\x2b\x4a\x0b\x9b\x1e\x55\x12\xd7\xd2\x77\xc7\x06\x9e\xc1\xb2\xfa\x56\x21\xee\x8d\x20\x01\xc1\x14\x4b\xab\x81\x47\xc4\x45\xbf\xbb\x37\xaa\xac\xda\xd5\x84\x60\x74\x69\x43\x83\xa5\xc7\x1c\xf0\xfe\x63\xf8\x66\x5b\xdd\xf1\x9a\x69\x03\x37\xc8\x46\x98\x79\x47\x63\x4b\xd7\x6a\x11\x36\xb8\xbb\x37\xba\x55\x63\xc2\x7e\xdd\xcc\xc5\x4f\xc9\xc0\x6a\xef\xc4\xb6\x55\x74\xf6\x13\xf7\x4e\xc4\xd9\xa9\x2e\x49\x82\x6a\x2a\xaf\xbf\x14\x62\x9f\x54\xf1\xde\x52\xf1\x9e\xb0\xf7\x8e\x28\x78\x11\x72\x6b\x58\x22\xfb\x14\x22\xc9\x8a\xb6\x1b\xf1\xd4\x41\x93\x6f\x38\xb9\xa4\x7d\x1b\x71\x08\x2e\xd4\xe3\xe9\x7c\x04\x17\xcf\x8f\x5e\x1c\x42\xaf\xd7\xd3\x96\xec\x15\xc6\xdb\xe9\xfa\x11\xed\x4a\x2f\xc4\xfc\x19\xa5\xea\x2c\xf0\x4c\x88\x05\xef\xdf\xbf\x7f\x99\x89\xd9\x72\xd2\x4b\xd8\xfc\x3e\xe1\x82\x14\x59\x71\x7f\x81\x81\xf4\xba\xa6\x32\x85\x17\xab\x69\xfc\x23\xd2\xe7\xa1\x18\x34\x5b\x0f\xbd\xf2\xb7\x8e\x18\xe2\x11\x10\xbe\x4b\x59\xff\xcb\xa6\x10\x75\x71\xfb\x5d\x3b\xe8\x31\x94\x94\xe8\x97\x27\xf0\x10\x34\x17\x69\x66\xae\xc5\x9f\x2c\xfc\xe3\xeb\xdd\x59\x0c\xdd\xee\x8c\xe6\x8b\x2a\x56\x0c\x9b\x8f\xf7\xde\xe7\x94\x73\x1b\x0e\x64\x4f\xc1\xa3\x05\x0c\xfe\x96\x9c\xae\x09\x0b\x43\xdc\xb9\x5b\x55\x50\x61\x62\xc8\x1a\x89\x8e\x2d\xc5\x62\x29\x2c\xa7\xac\x08\xf0\xdd\x42\x95\xdc\xd6\x67\x7c\xfa\xb2\x2d\x6c\xa9\xfd\xe7\x2e\x87\xd3\xc3\xaf\x0e\x7f\xf5\x4a\x62\xe1\x74\xa1\x7f\x69\x6a\x6c\x34\x0d\x7d\xde\x41\x5f\x9e\x66\xa5\x87\x6d\x35\xcb\x04\xc5\x5b\xd3\x1a\xe3\x73\x78\xfe\xea\xf9\xcb\x73\x89\x10\xb7\x49\xd4\x4f\xb3\xf1\x26\x1d\x6c\x8c\x55\x60\xa6\x55\x7a\x01\xc3\x21\xbc\xd4\x78\xa6\x60\xb0\x28\x08\x85\x04\x23\xac\x08\xd0\x0d\xf6\x4f\xab\x7f\x51\xbf\x38\xbe\x3e\x7c\xab\xfa\x43\x4f\x2e\xd6\x47\xdf\x63\xbc\x8b\x18\x83\xbb\xfe\x17\xe3\x8d\xa1\x58\xdf\xa9\x88\x6f\x40\x56\x72\x11\x83\x3d\x48\x1c\xc3\x4c\xcc\xf3\x18\xdd\x9d\xb7\xfa\x63\x5c\x92\xd5\x4d\x58\xc2\x83\x64\x31\x08\x7e\x75\x43\x09\x4f\xb0\xd8\x8e\x4e\xb8\x5a\xa8\xde\x3c\xbc\xa4\x82\x2d\x84\x9f\xc2\x75\x2c\x59\xfd\x53\xba\xb3\xab\x92\x2c\x94\x52\x2f\xa5\xba\xc2\xc0\xa6\xf6\x52\x9a\xd2\x42\xb4\xd1\x44\xf4\xc6\xe3\x94\x25\xe3\xb1\xaa\x28\x78\xee\x81\x2d\xf0\x49\x96\x12\x5f\x6c\x55\x75\xf6\xd4\x47\x18\xf4\x93\x5f\xf3\x1e\x29\x2f\xaf\x2e\xf6\xfa\xa3\x90\x23\xd1\x6c\x8f\xf5\x79\xff\x79\xff\xa0\x3f\xed\x47\x61\xde\x45\x24\xbb\x59\x14\x9b\xd0\xa6\xf2\x9b\x52\x04\xf9\x8d\xd3\xc5\x00\xdf\xb4\x94\x6a\x86\xdf\xf4\xe9\x67\x7c\xe7\x52\xea\xc3\x20\xf2\x2a\x0b\xde\xc8\xd1\xa4\x7e\x85\x1f\x18\x53\x55\xf6\x39\x5a\x7d\x9b\x88\x56\x5f\x23\x42\x3e\x79\x8f\xdc\x63\xd0\xe4\x4c\xb4\xf5\x79\x9f\x5a\x7c\x57\xbb\x19\x3e\x80\xda\x6e\xb2\x59\x0a\x51\xbb\x4e\xde\xe3\x12\xde\x7e\x80\x59\xe3\xc7\x74\xd9\x5d\x07\x50\x46\x43\x7e\x4f\x25\xb0\xa5\x40\xfb\x37\x90\xd6\xcc\xce\xd4\xd9\x42\xc4\xfa\xd9\xc6\xac\x40\x09\x05\xa1\x01\xd9\x42\xed\x6b\x46\x5d\x7c\x18\xd4\x98\xa6\x68\xb4\x2e\x74\x9d\x3b\x9f\x6d\x01\x30\xe2\x9f\x43\xc4\x14\x22\x2d\x9a\x0a\x22\x47\x24\xd2\xb4\x0e\xc7\x73\x85\x03\x19\x56\x45\xe1\x71\x71\x23\x8e\xa7\x0a\x87\xe1\x69\x15\x8d\xc7\x6b\x44\xa3\x9f\x51\xeb\xac\x43\x37\xd5\x24\xa1\x2e\x55\x91\x65\x3a\x8e\x89\x71\x08\xaa\x91\x2f\xea\xa6\x48\xbf\x67\xf5\x33\x2f\x18\x2f\xf7\xdf\x2b\xb2\x86\x2d\x82\x9f\x29\xdc\xf5\xd0\xc2\x8d\x5a\x58\xd3\xc6\x07\x61\x9e\xa7\x4f\x1b\xd9\xc7\x55\x7b\x39\x5d\x54\x1b\xab\x34\x6f\x63\xe1\x99\x51\xa6\xbc\x56\x7a\x2d\xd1\x96\x60\xfd\xa2\x86\xd4\x13\xec\x3c\x32\x03\x47\xe0\x91\x59\x73\x41\x13\x83\xd3\x60\xf9\x0d\xa1\x71\xd4\x6f\x6b\x50\xe9\x93\x4a\x7a\x8c\xb2\x61\x97\x50\x05\xd8\x82\x16\x6d\x9d\x11\x43\xb4\x8a\x3a\x1d\xd9\xd9\xd9\x52\x84\xde\xe5\x54\xb6\x04\x49\xa8\x49\x7a\xaa\x11\x36\x44\x29\x87\x01\x58\x6a\xab\xc5\xc6\x19\x1f\x4b\x84\xed\x69\x43\x6c\xee\xf1\x02\xf9\xa2\x00\x1a\x4d\xfe\xb4\x79\xec\xb0\x8f\x7b\xea\xa9\x59\x23\x90\x3d\xa9\x6c\x37\x00\x1b\xc1\xa4\x0d\xe5\x74\xd1\x9c\x69\xa3\x45\xda\x03\x48\xcd\x60\x59\x4e\x07\x6c\xb9\x26\xd7\x06\x73\xb4\x47\x1c\x6a\x60\xd5\x50\xe0\x4d\xd1\xb3\x51\xd8\x28\xc9\x29\x4a\x6f\xca\x26\xbf\x69\x1e\xed\x6f\xe6\x2b\x12\xcd\x26\xbf\x59\x3f\x34\x6f\xc5\x62\xd8\x9e\xcd\x70\x13\xab\x61\x7b\x76\xc3\x8d\x2c\x87\xed\xd8\x0e\xea\xfc\xa3\xde\x64\xf3\x98\x36\x55\x31\xac\xbd\xd5\x33\xb7\x8b\x8c\x8b\x7f\xee\x40\x9a\xea\x53\x95\x53\x28\x7a\x45\x44\xa3\xe9\x49\xcf\x5a\x2f\xd3\xbb\xe1\x4d\xf6\x72\xfb\x90\x25\x22\x2d\xed\x96\x93\x5e\x39\x31\xeb\x26\xb2\x27\x95\x3d\x9d\xa7\xd7\xc0\xd0\xa2\xb4\x3c\x29\xe8\xc7\x6f\xd5\xfb\x55\x0d\x74\xd7\x99\x5b\x67\x51\xc7\x7b\xb4\x5d\x32\x18\x1b\xd7\x32\x6c\x92\xfd\x79\x2c\xa7\x1e\xe3\x31\x5a\x83\x31\xfa\x46\xe3\xb1\x36\x0a\x7a\x32\xd5\xfa\xff\x03\x00\x00\xff\xff\x20\x15\x58\x64\x03\xdf\x00\x00")
-
-func scriptsClusterSummaryTabulatePyBytes() ([]byte, error) {
-	return bindataRead(
-		_scriptsClusterSummaryTabulatePy,
-		"scripts/cluster-summary/tabulate.py",
-	)
-}
-
-func scriptsClusterSummaryTabulatePy() (*asset, error) {
-	bytes, err := scriptsClusterSummaryTabulatePyBytes()
-	if err != nil {
-		return nil, err
-	}
-
-	info := bindataFileInfo{name: "scripts/cluster-summary/tabulate.py", size: 57091, mode: os.FileMode(0644), modTime: time.Unix(1620428515, 0)}
-	a := &asset{bytes: bytes, info: info, digest: [32]uint8{0xe9, 0x68, 0x8, 0x2c, 0x92, 0x99, 0x98, 0x23, 0x29, 0xba, 0x60, 0xc3, 0xa4, 0x16, 0x4, 0xe3, 0x2, 0xdd, 0x43, 0xdd, 0x2d, 0x2d, 0x51, 0x1e, 0xa9, 0x2, 0xe9, 0x71, 0x54, 0xef, 0x3c, 0x1c}}
+	info := bindataFileInfo{name: "scripts/cluster-summary/cluster_summary.py", size: 15309, mode: os.FileMode(0755), modTime: time.Unix(1792097360, 0)}
+	a := &asset{bytes: bytes, info: info, digest: [32]uint8{0xde, 0x44, 0x62, 0x40, 0xf7, 0xda, 0xd8, 0xe8, 0x73, 0x3e, 0x42, 0xab, 0xcb, 0x8a, 0x2b, 0xa4, 0xc6, 0xfd, 0x80, 0xe9, 0x24, 0x42, 0xf5, 0xf2, 0x71, 0x70, 0x55, 0xe3, 0x29, 0xf7, 0x51, 0xc7}}
 	return a, nil
 }
 
@@ -404,8 +383,6 @@ var _bindata = map[string]func() (*asset, error){
 
 	"scripts/cluster-summary/cluster_summary.py": scriptsClusterSummaryCluster_summaryPy,
 
-	"scripts/cluster-summary/tabulate.py": scriptsClusterSummaryTabulatePy,
-
 	"scripts/create-lambda-bundle.sh": scriptsCreateLambdaBundleSh,
 
 	"scripts/kindctl.sh": scriptsKindctlSh,
@@ -469,7 +446,6 @@ var _bintree = &bintree{nil, map[string]*bintree{
 		"cluster-summary": &bintree{nil, map[string]*bintree{
 			"__init__.py":        &bintree{scriptsClusterSummary__init__Py, map[string]*bintree{}},
 			"cluster_summary.py": &bintree{scriptsClusterSummaryCluster_summaryPy, map[string]*bintree{}},
-			"tabulate.py":        &bintree{scriptsClusterSummaryTabulatePy, map[string]*bintree{}},
 		}},
 		"create-lambda-bundle.sh": &bintree{scriptsCreateLambdaBundleSh, map[string]*bintree{}},
 		"kindctl.sh":              &bintree{scriptsKindctlSh, map[string]*bintree{}},
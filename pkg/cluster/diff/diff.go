@@ -1,13 +1,15 @@
 package diff
 
 import (
-	"bufio"
-	"crypto/sha1"
+	"bytes"
 	"fmt"
 	"io/ioutil"
 	"os"
 	"path/filepath"
+	"regexp"
+	"runtime"
 	"sort"
+	"strconv"
 	"strings"
 
 	"github.com/ghodss/yaml"
@@ -17,9 +19,27 @@ import (
 )
 
 const (
-	maxLineLen = 256
+	maxLineLen  = 256
+	diffContext = 3
 )
 
+var managedFieldsPrefix = []byte("  managedFields:")
+
+var hunkHeaderRegexp = regexp.MustCompile(`^@@ -(\d+)(,\d+)? \+(\d+)(,\d+)? @@\n$`)
+
+type diffPair struct {
+	index   int
+	name    string
+	oldName string
+	newName string
+}
+
+type diffPairResult struct {
+	index  int
+	result *Result
+	err    error
+}
+
 // DiffKube processes the results of a kubectl diff call in place of the default 'diff'
 // command.
 func DiffKube(oldRoot string, newRoot string) ([]Result, error) {
@@ -33,65 +53,96 @@ func DiffKube(oldRoot string, newRoot string) ([]Result, error) {
 		return nil, err
 	}
 
-	allNames := map[string]struct{}{}
+	diffPairs := []diffPair{}
+
 	for name := range oldNames {
-		allNames[name] = struct{}{}
+		if _, ok := newNames[name]; ok {
+			diffPairs = append(
+				diffPairs,
+				diffPair{name: name, oldName: name, newName: name},
+			)
+		} else {
+			diffPairs = append(diffPairs, diffPair{name: name, oldName: name})
+		}
 	}
 	for name := range newNames {
-		allNames[name] = struct{}{}
+		if _, ok := oldNames[name]; !ok {
+			diffPairs = append(diffPairs, diffPair{name: name, newName: name})
+		}
 	}
 
-	allNamesSlice := []string{}
-	for name := range allNames {
-		allNamesSlice = append(allNamesSlice, name)
+	sort.Slice(diffPairs, func(a, b int) bool {
+		return diffPairs[a].name < diffPairs[b].name
+	})
+	for p := range diffPairs {
+		diffPairs[p].index = p
 	}
 
-	sort.Slice(allNamesSlice, func(a, b int) bool {
-		return allNamesSlice[a] < allNamesSlice[b]
-	})
+	// Diff the files in parallel since each pair is independent
+	pairsChan := make(chan diffPair, len(diffPairs))
+	for _, pair := range diffPairs {
+		pairsChan <- pair
+	}
+	close(pairsChan)
 
-	results := []Result{}
+	// Closed when we return so that the workers stop picking up new pairs after an
+	// error.
+	done := make(chan struct{})
+	defer close(done)
 
-	for _, name := range allNamesSlice {
-		_, oldOk := oldNames[name]
-		_, newOk := newNames[name]
+	pairResultsChan := make(chan diffPairResult, len(diffPairs))
 
-		var diffResult *Result
+	numWorkers := runtime.NumCPU()
+	if numWorkers > len(diffPairs) {
+		numWorkers = len(diffPairs)
+	}
 
-		if oldOk && newOk {
-			diffResult, err = evalDiffs(
-				name,
-				oldRoot,
-				name,
-				newRoot,
-				name,
-			)
-		} else if oldOk {
-			diffResult, err = evalDiffs(
-				name,
-				oldRoot,
-				name,
-				newRoot,
-				"",
-			)
-		} else {
-			diffResult, err = evalDiffs(
-				name,
-				oldRoot,
-				"",
-				newRoot,
-				name,
-			)
-		}
+	for i := 0; i < numWorkers; i++ {
+		go func() {
+			for pair := range pairsChan {
+				select {
+				case <-done:
+					return
+				default:
+				}
+
+				diffResult, err := evalDiffs(
+					pair.name,
+					oldRoot,
+					pair.oldName,
+					newRoot,
+					pair.newName,
+				)
+				pairResultsChan <- diffPairResult{
+					index:  pair.index,
+					result: diffResult,
+					err:    err,
+				}
+			}
+		}()
+	}
 
-		if err != nil {
-			return nil, err
+	pairResults := []diffPairResult{}
+	for i := 0; i < len(diffPairs); i++ {
+		pairResult := <-pairResultsChan
+		if pairResult.err != nil {
+			return nil, pairResult.err
 		}
+		pairResults = append(pairResults, pairResult)
+	}
 
-		if diffResult != nil && diffResult.RawDiff != "" {
+	// Sort results by index so they're returned in name order.
+	sort.Slice(pairResults, func(a, b int) bool {
+		return pairResults[a].index < pairResults[b].index
+	})
+
+	results := []Result{}
+
+	for _, pairResult := range pairResults {
+		if pairResult.result != nil && pairResult.result.RawDiff != "" {
 			results = append(
 				results,
-				*diffResult,
+				*pairResult.result,
 			)
 		}
 	}
@@ -102,6 +153,10 @@ func DiffKube(oldRoot string, newRoot string) ([]Result, error) {
 func walkPaths(root string) (map[string]struct{}, error) {
 	relPaths := map[string]struct{}{}
 
+	// Walk builds each path by joining its parent with the entry name, so the relative
+	// path can be sliced off directly instead of calling filepath.Rel for every file.
+	rootPrefix := filepath.Clean(root) + string(filepath.Separator)
+
 	err := filepath.Walk(
 		root,
 		func(subPath string, info os.FileInfo, err error) error {
@@ -113,9 +168,13 @@ func walkPaths(root string) (map[string]struct{}, error) {
 				return nil
 			}
 
-			relPath, err := filepath.Rel(root, subPath)
-			if err != nil {
-				return err
+			relPath := strings.TrimPrefix(subPath, rootPrefix)
+			if relPath == subPath {
+				// Fall back for cases like "." or a root that's a single file
+				relPath, err = filepath.Rel(root, subPath)
+				if err != nil {
+					return err
+				}
 			}
 
 			relPaths[relPath] = struct{}{}
@@ -133,61 +192,91 @@ func evalDiffs(
 	newRoot string,
 	newName string,
 ) (*Result, error) {
-	var oldLines []string
-	var newLines []string
-	var oldHash string
-	var newHash string
-	var obj *apply.TypedKubeObj
+	var oldPath string
+	var newPath string
+	var oldContents []byte
+	var newContents []byte
 	var err error
 
 	if oldName != "" {
-		oldPath := filepath.Join(oldRoot, oldName)
-		oldLines, oldHash, err = getFileLines(oldPath)
+		oldPath = filepath.Join(oldRoot, oldName)
+		oldContents, err = ioutil.ReadFile(oldPath)
 		if err != nil {
 			return nil, err
 		}
-		obj, err = getFileObj(oldPath)
-		if err != nil {
-			log.Warnf("Error parsing path %s: %+v", oldPath, err)
-		}
 	}
 
 	if newName != "" {
-		newPath := filepath.Join(newRoot, newName)
-		newLines, newHash, err = getFileLines(newPath)
+		newPath = filepath.Join(newRoot, newName)
+		newContents, err = ioutil.ReadFile(newPath)
 		if err != nil {
 			return nil, err
 		}
+	}
 
-		// If we already got the object, don't bother trying to get it again since
-		// it's unlikely that the top-level fields (name, namespace, type, etc.) have
-		// been changed.
-		if obj == nil {
-			obj, err = getFileObj(newPath)
-			if err != nil {
-				log.Warnf("Error parsing path %s: %+v", newPath, err)
-			}
-		}
+	// Most of the files in a diff are typically unchanged, so skip the processing below
+	// for ones that are identical.
+	if oldName != "" && newName != "" && bytes.Equal(oldContents, newContents) {
+		return nil, nil
 	}
 
-	if oldHash == newHash {
+	oldLines := getFileLines(oldContents)
+	newLines := getFileLines(newContents)
+
+	// Matching is the expensive part of the diff, so skip over the lines that the files
+	// have in common at the start and end, keeping enough of them for the context.
+	prefixLen, suffixLen, identical := commonLineCounts(oldLines, newLines, diffContext)
+	if identical {
+		// The files only differ in the parts that we filter out
 		return nil, nil
 	}
 
-	diff := difflib.UnifiedDiff{
-		A:        oldLines,
-		B:        newLines,
-		FromFile: fmt.Sprintf("Server:%s", oldName),
-		ToFile:   fmt.Sprintf("Local:%s", newName),
-		Context:  3,
+	var obj *apply.TypedKubeObj
+
+	if oldName != "" {
+		obj, err = getFileObj(oldContents)
+		if err != nil {
+			log.Warnf("Error parsing path %s: %+v", oldPath, err)
+		}
 	}
 
-	diffStr, err := difflib.GetUnifiedDiffString(diff)
-	if err != nil {
-		return nil, err
+	// If we already got the object, don't bother trying to get it again since
+	// it's unlikely that the top-level fields (name, namespace, type, etc.) have
+	// been changed.
+	if newName != "" && obj == nil {
+		obj, err = getFileObj(newContents)
+		if err != nil {
+			log.Warnf("Error parsing path %s: %+v", newPath, err)
+		}
 	}
 
-	numAdded, numRemoved := diffCounts(diffStr)
+	fromFile := fmt.Sprintf("Server:%s", oldName)
+	toFile := fmt.Sprintf("Local:%s", newName)
+
+	var diffStr string
+	var numAdded int
+	var numRemoved int
+
+	if oldName == "" || newName == "" {
+		// Every line of an added or removed file is in the diff, so there's nothing to
+		// match up.
+		diffStr, numAdded, numRemoved = oneSidedDiff(fromFile, oldLines, toFile, newLines)
+	} else {
+		diff := difflib.UnifiedDiff{
+			A:        oldLines[prefixLen : len(oldLines)-suffixLen],
+			B:        newLines[prefixLen : len(newLines)-suffixLen],
+			FromFile: fromFile,
+			ToFile:   toFile,
+			Context:  diffContext,
+		}
+
+		diffStr, err = difflib.GetUnifiedDiffString(diff)
+		if err != nil {
+			return nil, err
+		}
+
+		diffStr, numAdded, numRemoved = processDiff(diffStr, prefixLen)
+	}
 
 	return &Result{
 		Object:     obj,
@@ -198,66 +287,221 @@ func evalDiffs(
 	}, nil
 }
 
-func getFileLines(path string) ([]string, string, error) {
-	file, err := os.Open(path)
-	if err != nil {
-		return nil, "", err
+// commonLineCounts returns the number of lines at the start and end of the argument
+// slices that can be skipped when diffing them, leaving the given number of context lines.
+// It also returns whether the slices are identical.
+func commonLineCounts(
+	oldLines []string,
+	newLines []string,
+	context int,
+) (int, int, bool) {
+	maxLen := len(oldLines)
+	if len(newLines) < maxLen {
+		maxLen = len(newLines)
 	}
-	defer file.Close()
 
-	lines := []string{}
+	prefixLen := 0
+	for prefixLen < maxLen && oldLines[prefixLen] == newLines[prefixLen] {
+		prefixLen++
+	}
+
+	if prefixLen == len(oldLines) && prefixLen == len(newLines) {
+		return 0, 0, true
+	}
+
+	suffixLen := 0
+	for suffixLen < maxLen-prefixLen &&
+		oldLines[len(oldLines)-suffixLen-1] == newLines[len(newLines)-suffixLen-1] {
+		suffixLen++
+	}
 
-	// Hash the file contents so we can avoid diffing files with the same content.
-	h := sha1.New()
+	prefixLen -= context
+	if prefixLen < 0 {
+		prefixLen = 0
+	}
+	suffixLen -= context
+	if suffixLen < 0 {
+		suffixLen = 0
+	}
 
-	scanner := bufio.NewScanner(file)
-	buf := make([]byte, 0, 64*1024)
-	scanner.Buffer(buf, 1024*1024)
+	return prefixLen, suffixLen, false
+}
+
+// oneSidedDiff generates the same unified diff as difflib for the case where one of the
+// sides is empty, along with the number of added and removed lines.
+func oneSidedDiff(
+	fromFile string,
+	oldLines []string,
+	toFile string,
+	newLines []string,
+) (string, int, int) {
+	lines := newLines
+	linePrefix := "+"
+	hunkHeader := fmt.Sprintf("@@ -0,0 +%s @@\n", unifiedRange(len(newLines)))
+
+	if len(oldLines) > 0 {
+		lines = oldLines
+		linePrefix = "-"
+		hunkHeader = fmt.Sprintf("@@ -%s +0,0 @@\n", unifiedRange(len(oldLines)))
+	}
+
+	var builder strings.Builder
+	builder.WriteString("--- ")
+	builder.WriteString(fromFile)
+	builder.WriteString("\n+++ ")
+	builder.WriteString(toFile)
+	builder.WriteString("\n")
+	builder.WriteString(hunkHeader)
+
+	// Match the counting in processDiff, which only counts lines that start with
+	// "+ " or "- "
+	numChanged := 0
+
+	for _, line := range lines {
+		if strings.HasPrefix(line, " ") {
+			numChanged++
+		}
+		builder.WriteString(linePrefix)
+		builder.WriteString(line)
+	}
+
+	if len(oldLines) > 0 {
+		return builder.String(), 0, numChanged
+	}
+	return builder.String(), numChanged, 0
+}
+
+// unifiedRange formats the range for a hunk that starts at the first line of a file and
+// has the given number of lines.
+func unifiedRange(numLines int) string {
+	if numLines == 1 {
+		return "1"
+	}
+	return fmt.Sprintf("1,%d", numLines)
+}
+
+// processDiff makes a single pass over the lines of a unified diff to count the added and
+// removed lines and to shift the line numbers in its hunk headers by the number of lines
+// that were skipped at the start of both files.
+func processDiff(diffStr string, offset int) (string, int, int) {
+	numAdded := 0
+	numRemoved := 0
+
+	var builder strings.Builder
+	if offset > 0 {
+		builder.Grow(len(diffStr))
+	}
+
+	for remaining := diffStr; len(remaining) > 0; {
+		var line string
+
+		if index := strings.IndexByte(remaining, '\n'); index >= 0 {
+			line = remaining[0 : index+1]
+			remaining = remaining[index+1:]
+		} else {
+			line = remaining
+			remaining = ""
+		}
+
+		if strings.HasPrefix(line, "+ ") {
+			numAdded++
+		} else if strings.HasPrefix(line, "- ") {
+			numRemoved++
+		}
+
+		if offset > 0 {
+			if matches := hunkHeaderRegexp.FindStringSubmatch(line); matches != nil {
+				oldStart, _ := strconv.Atoi(matches[1])
+				newStart, _ := strconv.Atoi(matches[3])
+
+				line = fmt.Sprintf(
+					"@@ -%d%s +%d%s @@\n",
+					oldStart+offset,
+					matches[2],
+					newStart+offset,
+					matches[4],
+				)
+			}
+			builder.WriteString(line)
+		}
+	}
+
+	if offset > 0 {
+		diffStr = builder.String()
+	}
+
+	return diffStr, numAdded, numRemoved
+}
+
+func getFileLines(contents []byte) []string {
+	lines := make([]string, 0, bytes.Count(contents, []byte("\n"))+1)
 
 	insideManagedFields := false
 
-	for scanner.Scan() {
-		keep := true
-		line := scanner.Text()
+	for len(contents) > 0 {
+		// The line including its newline, if any, and the line content without it
+		var line []byte
+		var content []byte
+
+		if index := bytes.IndexByte(contents, '\n'); index >= 0 {
+			line = contents[0 : index+1]
+			content = contents[0:index]
+			contents = contents[index+1:]
+		} else {
+			line = contents
+			content = contents
+			contents = nil
+		}
 
 		// Skip over managedFields chunk in metadata since it's constantly
 		// changing and causing spurious diffs.
-		if strings.HasPrefix(line, "  managedFields:") {
+		if bytes.HasPrefix(content, managedFieldsPrefix) {
 			insideManagedFields = true
-			keep = false
+			continue
 		} else if insideManagedFields {
-			if !(strings.HasPrefix(line, "  -") || strings.HasPrefix(line, "   ")) {
-				insideManagedFields = false
-			} else {
-				keep = false
+			if isManagedFieldsContinuation(content) {
+				continue
 			}
+			insideManagedFields = false
 		}
 
-		if keep {
-			if len(line) > maxLineLen {
-				// Trim very long lines
-				line = fmt.Sprintf(
-					"%s... (%d chars omitted)",
-					line[0:maxLineLen],
-					len(line)-maxLineLen,
-				)
-			}
+		if bytes.HasSuffix(content, []byte("\r")) {
+			content = content[0 : len(content)-1]
+			line = content
+		}
 
-			lines = append(lines, line+"\n")
-			h.Write([]byte(line))
+		if len(content) > maxLineLen {
+			// Trim very long lines
+			lines = append(
+				lines,
+				fmt.Sprintf(
+					"%s... (%d chars omitted)\n",
+					content[0:maxLineLen],
+					len(content)-maxLineLen,
+				),
+			)
+		} else if len(line) > len(content) {
+			// Convert the line with its newline directly to avoid an extra copy
+			lines = append(lines, string(line))
+		} else {
+			lines = append(lines, string(content)+"\n")
 		}
 	}
 
-	return lines, fmt.Sprintf("%x", h.Sum(nil)), scanner.Err()
+	return lines
 }
 
-func getFileObj(path string) (*apply.TypedKubeObj, error) {
-	obj := apply.TypedKubeObj{}
+// isManagedFieldsContinuation returns whether a line continues a managedFields block,
+// i.e. whether it starts with "  -" or "   ".
+func isManagedFieldsContinuation(line []byte) bool {
+	return len(line) >= 3 &&
+		line[0] == ' ' &&
+		line[1] == ' ' &&
+		(line[2] == '-' || line[2] == ' ')
+}
 
-	contents, err := ioutil.ReadFile(path)
-	if err != nil {
-		return nil, err
-	}
+func getFileObj(contents []byte) (*apply.TypedKubeObj, error) {
+	obj := apply.TypedKubeObj{}
 
 	if err := yaml.Unmarshal(contents, &obj); err != nil {
 		return nil, err
@@ -265,19 +509,3 @@ func getFileObj(path string) (*apply.TypedKubeObj, error) {
 
 	return &obj, nil
 }
-
-func diffCounts(diffStr string) (int, int) {
-	numAdded := 0
-	numRemoved := 0
-
-	lines := strings.Split(diffStr, "\n")
-	for _, line := range lines {
-		if strings.HasPrefix(line, "+ ") {
-			numAdded++
-		} else if strings.HasPrefix(line, "- ") {
-			numRemoved++
-		}
-	}
-
-	return numAdded, numRemoved
-}
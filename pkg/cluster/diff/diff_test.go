@@ -1,6 +1,11 @@
 package diff
 
 import (
+	"fmt"
+	"io/ioutil"
+	"os"
+	"path/filepath"
+	"strings"
 	"testing"
 
 	"github.com/segmentio/kubeapply/pkg/cluster/apply"
@@ -74,4 +79,131 @@ func TestDiffKube(t *testing.T) {
 		},
 		results[0].Object,
 	)
+	assert.Equal(
+		t,
+		`--- Server:file2.yaml
++++ Local:
+@@ -1,12 +0,0 @@
+-apiVersion: v1
+-kind: Service
+-metadata:
+-  name: other-service
+-  namespace: apps
+-spec:
+-  ports:
+-  - port: 80
+-    targetPort: 8080
+-    protocol: TCP
+-  selector:
+-    app: echoserver
+`,
+		results[1].RawDiff,
+	)
+	assert.Equal(
+		t,
+		0,
+		results[1].NumAdded,
+	)
+	assert.Equal(
+		t,
+		8,
+		results[1].NumRemoved,
+	)
+	assert.Equal(
+		t,
+		`--- Server:
++++ Local:file3.yaml
+@@ -0,0 +1,12 @@
++apiVersion: v1
++kind: Service
++metadata:
++  name: echoserver2
++  namespace: apps
++spec:
++  ports:
++  - port: 80
++    targetPort: 8080
++    protocol: TCP
++  selector:
++    app: echoserver
+`,
+		results[2].RawDiff,
+	)
+	assert.Equal(
+		t,
+		8,
+		results[2].NumAdded,
+	)
+	assert.Equal(
+		t,
+		0,
+		results[2].NumRemoved,
+	)
+}
+
+func TestEvalDiffsLargeCommonPrefix(t *testing.T) {
+	oldRoot, err := ioutil.TempDir("", "diff-old")
+	require.NoError(t, err)
+	defer os.RemoveAll(oldRoot)
+
+	newRoot, err := ioutil.TempDir("", "diff-new")
+	require.NoError(t, err)
+	defer os.RemoveAll(newRoot)
+
+	// The lines around the change repeat for every container, so the context and
+	// alignment of the diff depend on where the matcher anchors.
+	writeContainers := func(root string, changedImage string) {
+		lines := []string{
+			"apiVersion: v1",
+			"kind: Pod",
+			"metadata:",
+			"  name: busy",
+			"  namespace: apps",
+			"spec:",
+			"  containers:",
+		}
+		for i := 0; i < 100; i++ {
+			image := "busybox:1.0"
+			if i == 80 {
+				image = changedImage
+			}
+			lines = append(
+				lines,
+				fmt.Sprintf("  - name: container%03d", i),
+				fmt.Sprintf("    image: %s", image),
+				"    args: [\"--verbose\"]",
+			)
+		}
+		require.NoError(
+			t,
+			ioutil.WriteFile(
+				filepath.Join(root, "pod.yaml"),
+				[]byte(strings.Join(lines, "\n")+"\n"),
+				0644,
+			),
+		)
+	}
+	writeContainers(oldRoot, "busybox:1.0")
+	writeContainers(newRoot, "busybox:1.1")
+
+	result, err := evalDiffs("pod.yaml", oldRoot, "pod.yaml", newRoot, "pod.yaml")
+	require.NoError(t, err)
+	assert.Equal(
+		t,
+		`--- Server:pod.yaml
++++ Local:pod.yaml
+@@ -246,7 +246,7 @@
+     image: busybox:1.0
+     args: ["--verbose"]
+   - name: container080
+-    image: busybox:1.0
++    image: busybox:1.1
+     args: ["--verbose"]
+   - name: container081
+     image: busybox:1.0
+`,
+		result.RawDiff,
+	)
+	assert.Equal(t, 1, result.NumAdded)
+	assert.Equal(t, 1, result.NumRemoved)
 }
@@ -1,13 +1,23 @@
 package diff
 
 import (
+	"bufio"
 	"fmt"
+	"os"
 	"strings"
 
 	"github.com/segmentio/kubeapply/pkg/cluster/apply"
 	log "github.com/sirupsen/logrus"
 )
 
+// Use escape codes directly instead of color library to force colors even if we're
+// not in a terminal.
+const (
+	colorRed   = "\033[91m"
+	colorGreen = "\033[92m"
+	colorReset = "\033[0m"
+)
+
 // Results contains all results from a given diff run. It's used for wrapping so that
 // everything can be put in a single struct when exported by kubeapply kdiff.
 type Results struct {
@@ -49,31 +59,34 @@ func PrintSummary(results []Result) {
 
 // PrintRaw prints out the raw diffs for a single resource.
 func (r *Result) PrintRaw(useColors bool) {
+	// Buffer the output so that large diffs aren't written out one line at a time
+	out := bufio.NewWriter(os.Stdout)
+	defer out.Flush()
+
 	lines := strings.Split(r.RawDiff, "\n")
 	for _, line := range lines {
-		var prefix string
-		if len(line) > 0 {
-			prefix = line[0:1]
+		if len(line) == 0 {
+			continue
 		}
 
-		switch prefix {
-		case "+":
-			if useColors {
-				printGreen(line)
-			} else {
-				fmt.Println(line)
-			}
-		case "-":
-			if useColors {
-				printRed(line)
-			} else {
-				fmt.Println(line)
-			}
-		default:
-			if len(line) > 0 {
-				fmt.Println(line)
+		var color string
+		if useColors {
+			switch line[0] {
+			case '+':
+				color = colorGreen
+			case '-':
+				color = colorRed
 			}
 		}
+
+		if color != "" {
+			out.WriteString(color)
+			out.WriteString(line)
+			out.WriteString(colorReset)
+		} else {
+			out.WriteString(line)
+		}
+		out.WriteByte('\n')
 	}
 }
 
@@ -98,15 +111,3 @@ func (r *Result) NumChangedLines() int {
 	}
 	return r.NumRemoved
 }
-
-func printRed(line string) {
-	// Use escape codes directly instead of color library to force colors even if we're
-	// not in a terminal
-	fmt.Printf("\033[91m%s\033[0m\n", line)
-}
-
-func printGreen(line string) {
-	// Use escape codes directly instead of color library to force colors even if we're
-	// not in a terminal
-	fmt.Printf("\033[92m%s\033[0m\n", line)
-}
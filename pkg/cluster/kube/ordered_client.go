@@ -268,10 +268,13 @@ func (k *OrderedClient) Summary(
 		return "", err
 	}
 
+	// Always use kubectl so that the output doesn't depend on which python packages are
+	// installed on the host.
 	cmd := exec.Command(
-		"python",
+		"python3",
 		filepath.Join(tempDir, "scripts/cluster-summary/cluster_summary.py"),
 		"--no-color",
+		"--use-kubectl",
 		"--kubeconfig",
 		k.kubeConfigPath,
 	)
@@ -1,4 +1,4 @@
-#!/usr/bin/python
+#!/usr/bin/python3
 """ cluster_summary.py
 
     Print out a summary of a cluster. Used for "kubeapply status" calls.
@@ -7,17 +7,81 @@
 """
 
 import argparse
+import concurrent.futures
+import datetime
+import json
 import logging
 import os
 import subprocess
 
-import tabulate
+try:
+    import kubernetes
+except ImportError:
+    kubernetes = None
 
 logging.basicConfig(
     format='%(asctime)s %(levelname)s %(message)s',
     level=logging.INFO,
 )
 
+# Resources to summarize, in display order
+RESOURCES = [
+    ('PODS', 'pods'),
+    ('JOBS', 'jobs'),
+    ('DEPLOYMENTS', 'deployments'),
+    ('STATEFULSETS', 'statefulsets'),
+    ('DAEMONSETS', 'daemonsets'),
+    ('NODES', 'nodes'),
+]
+
+# Map from the resource types passed to kubectl to the kinds of the returned
+# items
+RESOURCE_KINDS = {
+    'pods': 'Pod',
+    'jobs': 'Job',
+    'deployments': 'Deployment',
+    'statefulsets': 'StatefulSet',
+    'daemonsets': 'DaemonSet',
+    'nodes': 'Node',
+}
+
+CLUSTER_SCOPED_RESOURCES = ['nodes']
+
+# Python client methods for listing each resource type, as (API class, method
+# for all namespaces, method for a single namespace)
+API_LIST_METHODS = {
+    'pods': (
+        'CoreV1Api',
+        'list_pod_for_all_namespaces',
+        'list_namespaced_pod',
+    ),
+    'jobs': (
+        'BatchV1Api',
+        'list_job_for_all_namespaces',
+        'list_namespaced_job',
+    ),
+    'deployments': (
+        'AppsV1Api',
+        'list_deployment_for_all_namespaces',
+        'list_namespaced_deployment',
+    ),
+    'statefulsets': (
+        'AppsV1Api',
+        'list_stateful_set_for_all_namespaces',
+        'list_namespaced_stateful_set',
+    ),
+    'daemonsets': (
+        'AppsV1Api',
+        'list_daemon_set_for_all_namespaces',
+        'list_namespaced_daemon_set',
+    ),
+    'nodes': (
+        'CoreV1Api',
+        'list_node',
+        'list_node',
+    ),
+}
+
 
 class bcolors:
     HEADER = '\033[95m'
@@ -30,61 +94,139 @@ class bcolors:
     UNDERLINE = '\033[4m'
 
 
+# Formatted headings for each resource, built once up front
+HEADINGS = {
+    heading: bcolors.OKBLUE + bcolors.BOLD + '    ' + heading + bcolors.ENDC
+    for heading, _ in RESOURCES
+}
+NO_COLOR_HEADINGS = {heading: '>>> ' + heading for heading, _ in RESOURCES}
+
+
 def main():
     args = get_args()
 
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    print_heading('PODS', no_color=args.no_color)
-    pods_text = kubectl_get_text('pods', args.namespace, args.kubeconfig)
-    pretty_table(pods_text)
+    resource_types = [resource_type for _, resource_type in RESOURCES]
 
-    print_heading('JOBS', no_color=args.no_color)
-    jobs_text = kubectl_get_text('jobs', args.namespace, args.kubeconfig)
-    pretty_table(jobs_text)
+    if args.use_kubectl or kubernetes is None:
+        logging.debug('Getting resources via kubectl')
+        items_by_type = kubectl_get_multi(
+            resource_types,
+            args.namespace,
+            args.kubeconfig,
+        )
+    else:
+        logging.debug('Getting resources via the kubernetes python client')
+        items_by_type = api_get_multi(
+            resource_types,
+            args.namespace,
+            args.kubeconfig,
+        )
+    now = datetime.datetime.now(datetime.timezone.utc)
 
-    print_heading('DEPLOYMENTS', no_color=args.no_color)
-    deployments_text = kubectl_get_text(
-        'deployments', args.namespace, args.kubeconfig)
-    pretty_table(deployments_text)
+    for heading, resource_type in RESOURCES:
+        print_heading(heading, no_color=args.no_color)
 
-    print_heading('STATEFULSETS', no_color=args.no_color)
-    statefulsets_text = kubectl_get_text(
-        'statefulsets', args.namespace, args.kubeconfig)
-    pretty_table(statefulsets_text)
+        columns = COLUMNS[resource_type]
+        namespaced = resource_type not in CLUSTER_SCOPED_RESOURCES
+        if namespaced and args.namespace == '':
+            columns = [('NAMESPACE', field('metadata.namespace'))] + columns
 
-    print_heading('DAEMONSETS', no_color=args.no_color)
-    daemonsets_text = kubectl_get_text(
-        'daemonsets', args.namespace, args.kubeconfig)
-    pretty_table(daemonsets_text)
+        pretty_table_from_json(items_by_type[resource_type], columns, now)
 
-    print_heading('NODES', no_color=args.no_color)
-    nodes_text = kubectl_get_text('nodes', args.namespace, args.kubeconfig)
-    pretty_table(nodes_text)
 
+def kubectl_get_multi(resource_types, namespace, kubeconfig):
+    """Get the items for multiple resource types, bucketed by resource type.
 
-def kubectl_get_text(resource_type, namespace, kubeconfig):
-    cmd = [
-        'kubectl',
-        'get',
-        resource_type,
-        '--kubeconfig',
-        kubeconfig,
+    The namespaced and cluster-scoped types are each fetched with a single
+    kubectl call (run concurrently) instead of one call per type.
+    """
+    namespaced_types = [
+        r for r in resource_types if r not in CLUSTER_SCOPED_RESOURCES
+    ]
+    cluster_types = [
+        r for r in resource_types if r in CLUSTER_SCOPED_RESOURCES
     ]
 
-    if resource_type != 'nodes':
-        if namespace != '':
-            cmd += [
-                '-n',
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(
+                kubectl_get_json,
+                ','.join(types),
                 namespace,
-            ]
-        else:
-            cmd.append('--all-namespaces')
+                kubeconfig,
+            )
+            for types in [namespaced_types, cluster_types] if types
+        ]
+        results = [future.result() for future in futures]
+
+    types_by_kind = {
+        RESOURCE_KINDS[resource_type]: resource_type
+        for resource_type in resource_types
+    }
+    items_by_type = {resource_type: [] for resource_type in resource_types}
+
+    for result in results:
+        for item in result.get('items', []):
+            resource_type = types_by_kind.get(item.get('kind'))
+            if resource_type is not None:
+                items_by_type[resource_type].append(item)
+
+    return items_by_type
+
+
+def api_get_multi(resource_types, namespace, kubeconfig):
+    """Get the items for multiple resource types via the python client.
+
+    All of the requests share the client's connection pool, which avoids the
+    process startup, auth, and discovery costs of running kubectl for each
+    call.
+    """
+    api_client = kubernetes.config.new_client_from_config(
+        config_file=kubeconfig or None,
+    )
 
-    logging.debug('Running command: %s', str(cmd))
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(resource_types)) as executor:
+        futures = [
+            (
+                resource_type,
+                executor.submit(
+                    api_get_json,
+                    api_client,
+                    resource_type,
+                    namespace,
+                ),
+            )
+            for resource_type in resource_types
+        ]
+
+        return {
+            resource_type: future.result().get('items', [])
+            for resource_type, future in futures
+        }
+
+
+def api_get_json(api_client, resource_type, namespace):
+    api_class, all_namespaces_method, namespaced_method = \
+        API_LIST_METHODS[resource_type]
+    api = getattr(kubernetes.client, api_class)(api_client)
+
+    logging.debug('Listing %s via the API', resource_type)
+
+    # Parse the raw response instead of having the client build its model
+    # objects so that the items have the same structure as kubectl's output.
+    if resource_type in CLUSTER_SCOPED_RESOURCES or namespace == '':
+        response = getattr(api, all_namespaces_method)(_preload_content=False)
+    else:
+        response = getattr(api, namespaced_method)(
+            namespace,
+            _preload_content=False,
+        )
 
-    return subprocess.check_output(cmd).decode('utf-8')
+    return json.loads(response.data.decode('utf-8'))
 
 
 def kubectl_get_json(resource_type, namespace, kubeconfig):
@@ -93,7 +235,7 @@ def kubectl_get_json(resource_type, namespace, kubeconfig):
         'get',
         resource_type,
         '--output',
-        'json'
+        'json',
         '--kubeconfig',
         kubeconfig,
     ]
@@ -113,39 +255,251 @@ def kubectl_get_json(resource_type, namespace, kubeconfig):
     return json.loads(result.decode('utf-8'))
 
 
-def pretty_table(text):
-    lines = text.split('\n')
+def get_field(item, path, default=None):
+    """Get a nested field from a dict via a dotted path like 'status.phase'."""
+    value = item
+
+    for key in path.split('.'):
+        if not isinstance(value, dict) or key not in value:
+            return default
+        value = value[key]
+
+    return value
+
+
+def field(path, default=''):
+    return lambda item, now: get_field(item, path, default)
+
+
+def ratio(numerator_path, denominator_path):
+    return lambda item, now: '%d/%d' % (
+        get_field(item, numerator_path, 0),
+        get_field(item, denominator_path, 0),
+    )
+
+
+def age(item, now):
+    created = parse_time(get_field(item, 'metadata.creationTimestamp'))
+    if created is None:
+        return '<unknown>'
+
+    return human_duration(now - created)
+
+
+def pod_ready(item, now):
+    container_statuses = get_field(item, 'status.containerStatuses', [])
+
+    return '%d/%d' % (
+        len([c for c in container_statuses if c.get('ready')]),
+        len(get_field(item, 'spec.containers', [])),
+    )
+
+
+def pod_status(item, now):
+    if get_field(item, 'metadata.deletionTimestamp'):
+        return 'Terminating'
+
+    for container_status in get_field(item, 'status.containerStatuses', []):
+        for state_name in ['waiting', 'terminated']:
+            reason = get_field(
+                container_status,
+                'state.%s.reason' % state_name,
+            )
+            if reason:
+                return reason
+
+    return (
+        get_field(item, 'status.reason') or
+        get_field(item, 'status.phase', '')
+    )
+
+
+def pod_restarts(item, now):
+    return sum(
+        c.get('restartCount', 0)
+        for c in get_field(item, 'status.containerStatuses', [])
+    )
+
 
-    split_lines = []
+def job_completions(item, now):
+    return '%d/%d' % (
+        get_field(item, 'status.succeeded', 0),
+        get_field(item, 'spec.completions') or 1,
+    )
 
-    for l, line in enumerate(lines):
-        if line == '':
-            continue
 
-        if l == 0:
-            line = line.replace('NODE SELECTOR', 'NODE_SELECTOR')
+def job_duration(item, now):
+    start_time = parse_time(get_field(item, 'status.startTime'))
+    if start_time is None:
+        return ''
+
+    completion_time = parse_time(get_field(item, 'status.completionTime'))
+    if completion_time is None:
+        completion_time = now
+
+    return human_duration(completion_time - start_time)
+
+
+def daemonset_node_selector(item, now):
+    node_selector = get_field(item, 'spec.template.spec.nodeSelector', {})
+
+    return ','.join(
+        '%s=%s' % (key, value) for key, value in sorted(node_selector.items())
+    ) or '<none>'
+
+
+def node_status(item, now):
+    status = 'Unknown'
+
+    for condition in get_field(item, 'status.conditions', []):
+        if condition.get('type') == 'Ready':
+            if condition.get('status') == 'True':
+                status = 'Ready'
+            else:
+                status = 'NotReady'
+
+    if get_field(item, 'spec.unschedulable'):
+        status += ',SchedulingDisabled'
+
+    return status
+
+
+def node_roles(item, now):
+    roles = []
+
+    for label, value in sorted(get_field(item, 'metadata.labels', {}).items()):
+        if label.startswith('node-role.kubernetes.io/'):
+            roles.append(label[len('node-role.kubernetes.io/'):])
+        elif label == 'kubernetes.io/role':
+            roles.append(value)
+
+    return ','.join(roles) or '<none>'
+
+
+# Columns for each resource type, as (header, getter) pairs. These match the
+# default columns shown by 'kubectl get'.
+COLUMNS = {
+    'pods': [
+        ('NAME', field('metadata.name')),
+        ('READY', pod_ready),
+        ('STATUS', pod_status),
+        ('RESTARTS', pod_restarts),
+        ('AGE', age),
+    ],
+    'jobs': [
+        ('NAME', field('metadata.name')),
+        ('COMPLETIONS', job_completions),
+        ('DURATION', job_duration),
+        ('AGE', age),
+    ],
+    'deployments': [
+        ('NAME', field('metadata.name')),
+        ('READY', ratio('status.readyReplicas', 'spec.replicas')),
+        ('UP-TO-DATE', field('status.updatedReplicas', 0)),
+        ('AVAILABLE', field('status.availableReplicas', 0)),
+        ('AGE', age),
+    ],
+    'statefulsets': [
+        ('NAME', field('metadata.name')),
+        ('READY', ratio('status.readyReplicas', 'spec.replicas')),
+        ('AGE', age),
+    ],
+    'daemonsets': [
+        ('NAME', field('metadata.name')),
+        ('DESIRED', field('status.desiredNumberScheduled', 0)),
+        ('CURRENT', field('status.currentNumberScheduled', 0)),
+        ('READY', field('status.numberReady', 0)),
+        ('UP-TO-DATE', field('status.updatedNumberScheduled', 0)),
+        ('AVAILABLE', field('status.numberAvailable', 0)),
+        ('NODE SELECTOR', daemonset_node_selector),
+        ('AGE', age),
+    ],
+    'nodes': [
+        ('NAME', field('metadata.name')),
+        ('STATUS', node_status),
+        ('ROLES', node_roles),
+        ('AGE', age),
+        ('VERSION', field('status.nodeInfo.kubeletVersion')),
+    ],
+}
+
+
+def parse_time(timestamp):
+    if not timestamp:
+        return None
+
+    return datetime.datetime.strptime(
+        timestamp,
+        '%Y-%m-%dT%H:%M:%SZ',
+    ).replace(tzinfo=datetime.timezone.utc)
+
+
+def human_duration(delta):
+    """Format a duration in the same, abbreviated way that kubectl does."""
+    seconds = max(int(delta.total_seconds()), 0)
+    minutes = seconds // 60
+    hours = seconds // 3600
+    days = hours // 24
+    years = days // 365
+
+    if seconds < 60 * 2:
+        return '%ds' % seconds
+    elif minutes < 10:
+        return with_remainder(minutes, 'm', seconds % 60, 's')
+    elif minutes < 60 * 3:
+        return '%dm' % minutes
+    elif hours < 8:
+        return with_remainder(hours, 'h', minutes % 60, 'm')
+    elif hours < 48:
+        return '%dh' % hours
+    elif hours < 24 * 8:
+        return with_remainder(days, 'd', hours % 24, 'h')
+    elif hours < 24 * 365 * 2:
+        return '%dd' % days
+    elif hours < 24 * 365 * 8:
+        return with_remainder(years, 'y', days % 365, 'd')
+    else:
+        return '%dy' % years
 
-        components = line.split(' ')
-        split_lines.append([c for c in components if c != ''])
 
-    if len(split_lines) == 0:
+def with_remainder(value, unit, remainder, remainder_unit):
+    # Like kubectl, leave off the remainder if it's zero (e.g., '3m' instead of
+    # '3m0s').
+    if remainder == 0:
+        return '%d%s' % (value, unit)
+    return '%d%s%d%s' % (value, unit, remainder, remainder_unit)
+
+
+def pretty_table_from_json(items, columns, now=None):
+    if len(items) == 0:
         print('None found\n')
         return
 
-    print(tabulate.tabulate(
-        split_lines[1:],
-        headers=split_lines[0],
-        showindex=True,
-    ))
+    if now is None:
+        now = datetime.datetime.now(datetime.timezone.utc)
+
+    rows = [[header for header, _ in columns]]
+    for item in items:
+        rows.append([str(getter(item, now)) for _, getter in columns])
+
+    # Compute the column widths in a single pass and pad the cells directly;
+    # this is much cheaper than going through tabulate for large clusters.
+    widths = [max(len(row[c]) for row in rows) for c in range(len(columns))]
+
+    lines = []
+    for row in rows:
+        cells = [cell.ljust(width) for cell, width in zip(row, widths)]
+        lines.append('   '.join(cells).rstrip())
+
+    print('\n'.join(lines))
     print('')
 
 
 def print_heading(heading, no_color=False):
     if no_color:
-        print('>>> %s' % heading)
+        print(NO_COLOR_HEADINGS[heading])
     else:
-        print(bcolors.OKBLUE + bcolors.BOLD + '    %s' %
-              heading + bcolors.ENDC)
+        print(HEADINGS[heading])
 
 
 def get_args():
@@ -182,6 +536,12 @@ def get_args():
         default=os.environ.get('KUBECONFIG', ''),
         help='Kubeconfig',
     )
+    parser.add_argument(
+        '--use-kubectl',
+        default=False,
+        action='store_true',
+        help='Use kubectl even if the kubernetes python client is installed',
+    )
 
     return parser.parse_args()
 
@@ -0,0 +1,247 @@
+""" test_cluster_summary.py
+
+    Tests for the kubectl-compatible formatting in cluster_summary.py. Run via
+    "make testpy".
+"""
+
+import datetime
+import unittest
+
+import cluster_summary
+
+NOW = datetime.datetime(2020, 6, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
+
+
+def duration(days=0, hours=0, minutes=0, seconds=0):
+    return datetime.timedelta(
+        days=days,
+        hours=hours,
+        minutes=minutes,
+        seconds=seconds,
+    )
+
+
+class HumanDurationTest(unittest.TestCase):
+    def test_human_duration(self):
+        test_cases = [
+            (duration(seconds=0), '0s'),
+            (duration(seconds=119), '119s'),
+            (duration(seconds=120), '2m'),
+            (duration(minutes=3, seconds=5), '3m5s'),
+            (duration(minutes=9, seconds=59), '9m59s'),
+            (duration(minutes=10, seconds=30), '10m'),
+            (duration(hours=2, minutes=59), '179m'),
+            (duration(hours=3), '3h'),
+            (duration(hours=7, minutes=1), '7h1m'),
+            (duration(hours=8, minutes=30), '8h'),
+            (duration(hours=47), '47h'),
+            (duration(days=2), '2d'),
+            (duration(days=7, hours=1), '7d1h'),
+            (duration(days=8, hours=5), '8d'),
+            (duration(days=729), '729d'),
+            (duration(days=730), '2y'),
+            (duration(days=731), '2y1d'),
+            (duration(days=365 * 8), '8y'),
+        ]
+
+        for delta, expected in test_cases:
+            with self.subTest(delta=delta):
+                self.assertEqual(
+                    expected,
+                    cluster_summary.human_duration(delta),
+                )
+
+
+class ParseTimeTest(unittest.TestCase):
+    def test_parse_time(self):
+        self.assertEqual(
+            NOW,
+            cluster_summary.parse_time('2020-06-01T12:00:00Z'),
+        )
+        self.assertIsNone(cluster_summary.parse_time(None))
+        self.assertIsNone(cluster_summary.parse_time(''))
+
+
+class PodColumnsTest(unittest.TestCase):
+    def test_pod_ready(self):
+        pod = {
+            'spec': {'containers': [{}, {}]},
+            'status': {
+                'containerStatuses': [{'ready': True}, {'ready': False}],
+            },
+        }
+        self.assertEqual('1/2', cluster_summary.pod_ready(pod, NOW))
+        self.assertEqual(
+            '0/1',
+            cluster_summary.pod_ready({'spec': {'containers': [{}]}}, NOW),
+        )
+
+    def test_pod_status(self):
+        test_cases = [
+            ({'status': {'phase': 'Running'}}, 'Running'),
+            ({'status': {'phase': 'Failed', 'reason': 'Evicted'}}, 'Evicted'),
+            (
+                {
+                    'status': {
+                        'phase': 'Running',
+                        'containerStatuses': [
+                            {'state': {'running': {}}},
+                            {
+                                'state': {
+                                    'waiting': {'reason': 'CrashLoopBackOff'},
+                                },
+                            },
+                        ],
+                    },
+                },
+                'CrashLoopBackOff',
+            ),
+            (
+                {
+                    'status': {
+                        'phase': 'Failed',
+                        'containerStatuses': [
+                            {'state': {'terminated': {'reason': 'Error'}}},
+                        ],
+                    },
+                },
+                'Error',
+            ),
+            (
+                {
+                    'metadata': {'deletionTimestamp': '2020-06-01T11:00:00Z'},
+                    'status': {'phase': 'Running'},
+                },
+                'Terminating',
+            ),
+            ({}, ''),
+        ]
+
+        for pod, expected in test_cases:
+            with self.subTest(pod=pod):
+                self.assertEqual(
+                    expected,
+                    cluster_summary.pod_status(pod, NOW),
+                )
+
+    def test_pod_restarts(self):
+        pod = {
+            'status': {
+                'containerStatuses': [
+                    {'restartCount': 2},
+                    {'restartCount': 3},
+                ],
+            },
+        }
+        self.assertEqual(5, cluster_summary.pod_restarts(pod, NOW))
+        self.assertEqual(0, cluster_summary.pod_restarts({}, NOW))
+
+
+class JobColumnsTest(unittest.TestCase):
+    def test_job_completions(self):
+        test_cases = [
+            ({'spec': {'completions': 3}, 'status': {'succeeded': 2}}, '2/3'),
+            ({'spec': {}, 'status': {'succeeded': 1}}, '1/1'),
+            ({'spec': {'completions': 1}, 'status': {}}, '0/1'),
+        ]
+
+        for job, expected in test_cases:
+            with self.subTest(job=job):
+                self.assertEqual(
+                    expected,
+                    cluster_summary.job_completions(job, NOW),
+                )
+
+    def test_job_duration(self):
+        test_cases = [
+            (
+                {
+                    'status': {
+                        'startTime': '2020-06-01T10:00:00Z',
+                        'completionTime': '2020-06-01T10:00:42Z',
+                    },
+                },
+                '42s',
+            ),
+            (
+                {'status': {'startTime': '2020-06-01T11:55:00Z'}},
+                '5m',
+            ),
+            ({'status': {}}, ''),
+        ]
+
+        for job, expected in test_cases:
+            with self.subTest(job=job):
+                self.assertEqual(
+                    expected,
+                    cluster_summary.job_duration(job, NOW),
+                )
+
+
+class NodeColumnsTest(unittest.TestCase):
+    def test_node_status(self):
+        test_cases = [
+            (
+                {'status': {'conditions': [
+                    {'type': 'MemoryPressure', 'status': 'False'},
+                    {'type': 'Ready', 'status': 'True'},
+                ]}},
+                'Ready',
+            ),
+            (
+                {'status': {'conditions': [
+                    {'type': 'Ready', 'status': 'Unknown'},
+                ]}},
+                'NotReady',
+            ),
+            (
+                {
+                    'spec': {'unschedulable': True},
+                    'status': {'conditions': [
+                        {'type': 'Ready', 'status': 'True'},
+                    ]},
+                },
+                'Ready,SchedulingDisabled',
+            ),
+            ({}, 'Unknown'),
+        ]
+
+        for node, expected in test_cases:
+            with self.subTest(node=node):
+                self.assertEqual(
+                    expected,
+                    cluster_summary.node_status(node, NOW),
+                )
+
+    def test_node_roles(self):
+        test_cases = [
+            (
+                {
+                    'node-role.kubernetes.io/master': '',
+                    'node-role.kubernetes.io/control-plane': '',
+                    'kubernetes.io/os': 'linux',
+                },
+                'control-plane,master',
+            ),
+            ({'kubernetes.io/role': 'worker'}, 'worker'),
+            ({'kubernetes.io/os': 'linux'}, '<none>'),
+        ]
+
+        for labels, expected in test_cases:
+            with self.subTest(labels=labels):
+                self.assertEqual(
+                    expected,
+                    cluster_summary.node_roles(
+                        {'metadata': {'labels': labels}},
+                        NOW,
+                    ),
+                )
+
+    def test_age(self):
+        node = {'metadata': {'creationTimestamp': '2020-05-25T11:00:00Z'}}
+        self.assertEqual('7d1h', cluster_summary.age(node, NOW))
+        self.assertEqual('<unknown>', cluster_summary.age({}, NOW))
+
+
+if __name__ == '__main__':
+    unittest.main()